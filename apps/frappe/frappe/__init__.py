@@ -33,10 +33,6 @@ import orjson
 from werkzeug.datastructures import Headers
 
 import frappe
-from frappe.query_builder.utils import (
-	get_query,
-	get_query_builder,
-)
 from frappe.utils.caching import deprecated_local_cache as local_cache
 from frappe.utils.caching import request_cache, site_cache
 from frappe.utils.data import as_unicode, bold, cint, cstr, safe_decode, safe_encode, sbool
@@ -46,13 +42,7 @@ from frappe.utils.translations import _, _lt, set_user_lang
 # Local application imports
 from .exceptions import *
 from .types import _dict
-from .utils.jinja import (
-	get_email_from_template,
-	get_jenv,
-	get_jloader,
-	get_template,
-	render_template,
-)
+from .utils.lazy_loader import lazy_attributes
 
 __version__ = "16.0.0-dev"
 __title__ = "Frappe Framework"
@@ -66,10 +56,41 @@ if TYPE_CHECKING:  # pragma: no cover
 	from frappe.database.mariadb.mysqlclient import MariaDBDatabase
 	from frappe.database.postgres.database import PostgresDatabase
 	from frappe.database.sqlite.database import SQLiteDatabase
+	from frappe.email import sendmail
 	from frappe.model.document import Document
 	from frappe.query_builder.builder import MariaDB, Postgres, SQLite
+	from frappe.query_builder.utils import get_query, get_query_builder
+	from frappe.utils.background_jobs import enqueue, enqueue_doc
+	from frappe.utils.jinja import (
+		get_email_from_template,
+		get_jenv,
+		get_jloader,
+		get_template,
+		render_template,
+	)
+	from frappe.utils.print_utils import attach_print, get_print
 	from frappe.utils.redis_wrapper import ClientCache, RedisWrapper
 
+# Imported on first use, these pull in query builder, jinja, rq and friends which most CLI commands and
+# many requests never need
+__getattr__ = lazy_attributes(
+	globals(),
+	{
+		"get_query": "frappe.query_builder.utils",
+		"get_query_builder": "frappe.query_builder.utils",
+		"get_email_from_template": "frappe.utils.jinja",
+		"get_jenv": "frappe.utils.jinja",
+		"get_jloader": "frappe.utils.jinja",
+		"get_template": "frappe.utils.jinja",
+		"render_template": "frappe.utils.jinja",
+		"enqueue": "frappe.utils.background_jobs",
+		"enqueue_doc": "frappe.utils.background_jobs",
+		"get_print": "frappe.utils.print_utils",
+		"attach_print": "frappe.utils.print_utils",
+		"sendmail": "frappe.email",
+	},
+)
+
 controllers: dict[str, type] = {}
 lazy_controllers: dict[str, type] = {}
 local = Local()
@@ -201,6 +222,9 @@ def init(site: str, sites_path: str = ".", new_site: bool = False, force: bool =
 	local.preload_assets = {"style": [], "script": [], "icons": []}
 	local.session = _dict()
 	local.dev_server = _dev_server  # only for backwards compatibility
+
+	from frappe.query_builder.utils import get_query_builder
+
 	local.qb = get_query_builder(local.conf.db_type)
 	if not cache or not client_cache:
 		setup_redis_cache_connection()
@@ -985,7 +1009,9 @@ def get_hooks(
 	else:
 		hooks = client_cache.get_value("app_hooks")
 		if hooks is None:
-			hooks = _load_app_hooks()
+			from frappe.utils.hooks_cache import load_app_hooks
+
+			hooks = load_app_hooks()
 			client_cache.set_value("app_hooks", hooks)
 
 	if hook:
@@ -1438,7 +1464,7 @@ from frappe.deprecation_dumpster import frappe_get_test_records as get_test_reco
 
 def task(**task_kwargs):
 	def decorator_task(f):
-		f.enqueue = lambda **fun_kwargs: enqueue(f, **task_kwargs, **fun_kwargs)
+		f.enqueue = lambda **fun_kwargs: frappe.enqueue(f, **task_kwargs, **fun_kwargs)
 		return f
 
 	return decorator_task
@@ -1587,11 +1613,8 @@ from frappe.model.document import (
 from frappe.model.meta import get_meta
 from frappe.realtime import publish_progress, publish_realtime
 from frappe.utils import get_traceback, mock, parse_json, safe_eval, create_folder
-from frappe.utils.background_jobs import enqueue, enqueue_doc
 from frappe.utils.error import log_error
 from frappe.utils.formatters import format_value
-from frappe.utils.print_utils import get_print, attach_print
-from frappe.email import sendmail
 
 # for backwards compatibility
 format = format_value
@@ -8,10 +8,13 @@ Note:
 	  internal implementation can change without treating it as "breaking change".
 """
 
+import itertools
 import json
+from collections.abc import Iterator
 from typing import Any
 
 from werkzeug.routing import Rule
+from werkzeug.wrappers import Response
 
 import frappe
 import frappe.client
@@ -23,6 +26,8 @@ PERMISSION_MAP = {
 	"GET": "read",
 	"POST": "write",
 }
+# Documents read per query by `bulk_read`
+BULK_READ_BATCH_SIZE = 500
 
 
 def handle_rpc_call(method: str, doctype: str | None = None):
@@ -160,6 +165,180 @@ def document_list(doctype: str) -> list[dict[str, Any]]:
 	return data[:limit]
 
 
+def bulk_read(doctype: str) -> Response:
+	"""
+	GET|POST /api/v2/document/<doctype>/bulk?names=[...],fields=[...],child_fields={...},...
+
+	REST API endpoint for reading many documents with their child tables
+
+	Args:
+		doctype: DocType name
+
+	Query Parameters (accessible via frappe.form_dict):
+		names: JSON list of document names, documents that don't exist or can't be read are left out
+		filters: JSON string of filters to apply
+		fields: JSON list of fields to fetch, fieldnames of child tables fetch all their fields
+		        (default: all fields and child tables)
+		child_fields: JSON object of child table fieldnames and their fields to fetch
+		order_by: Order by field, documents are returned in order of `names` if given
+		limit: Maximum number of documents to fetch (default: all)
+
+	Response:
+		Newline delimited JSON, one document per line, streamed as documents are read.
+
+	Documents are read in batches of `BULK_READ_BATCH_SIZE`, with one query for parents and one for
+	each child doctype per batch. Permissions are applied to each batch as in `document_list`.
+	"""
+	args = frappe.form_dict
+	names: list | None = frappe.parse_json(args.get("names", None))
+	filters: dict | list | None = frappe.parse_json(args.get("filters", None))
+	fields: list = frappe.parse_json(args.get("fields", None)) or ["*"]
+	child_fields: dict = frappe.parse_json(args.get("child_fields", None)) or {}
+	order_by: str | None = args.get("order_by", None)
+	limit: int = cint(args.get("limit", 0))
+
+	meta = frappe.get_meta(doctype)
+	if meta.issingle or meta.istable:
+		frappe.throw(_("Bulk read is not supported for {0}").format(_(doctype)))
+
+	frappe.has_permission(doctype, "read", throw=True)
+
+	table_fields = {df.fieldname: df for df in meta.get_table_fields()}
+	has_access_to = None if frappe.session.user == "Administrator" else set(meta.get_permlevel_access())
+
+	tables = {
+		fieldname: child_fields.get(fieldname, ["*"])
+		for fieldname in table_fields
+		if "*" in fields or fieldname in fields or fieldname in child_fields
+	}
+	for fieldname in child_fields:
+		if fieldname not in table_fields:
+			frappe.throw(_("{0} is not a child table of {1}").format(fieldname, _(doctype)), frappe.DataError)
+
+	tables = {
+		fieldname: get_child_fields(
+			frappe.get_meta(table_fields[fieldname].options), projection, has_access_to
+		)
+		for fieldname, projection in tables.items()
+		if has_access_to is None or table_fields[fieldname].permlevel in has_access_to | {0}
+	}
+	# children are matched to parents by name
+	parent_fields = [field for field in fields if field not in table_fields]
+	if "*" not in parent_fields and "name" not in parent_fields:
+		parent_fields.append("name")
+	if names is not None and limit:
+		names = names[:limit]
+
+	def get_batches() -> Iterator[list[dict]]:
+		if names is not None:
+			for start in range(0, len(names), BULK_READ_BATCH_SIZE):
+				batch_names = names[start : start + BULK_READ_BATCH_SIZE]
+				docs = frappe.get_list(
+					doctype,
+					fields=parent_fields,
+					filters=[[doctype, "name", "in", batch_names], *get_filter_list(doctype, filters)],
+					limit_page_length=0,
+				)
+				# names may be matched case insensitively
+				position = {cstr(name).casefold(): idx for idx, name in enumerate(batch_names)}
+				yield sorted(docs, key=lambda doc: position.get(cstr(doc.name).casefold(), len(position)))
+			return
+
+		start = 0
+		while not limit or start < limit:
+			page_length = min(BULK_READ_BATCH_SIZE, limit - start) if limit else BULK_READ_BATCH_SIZE
+			docs = frappe.get_list(
+				doctype,
+				fields=parent_fields,
+				filters=filters,
+				order_by=order_by,
+				limit_start=start,
+				limit_page_length=page_length,
+			)
+			if docs:
+				yield docs
+			if len(docs) < page_length:
+				return
+			start += page_length
+
+	def get_documents() -> Iterator[list[dict]]:
+		for docs in get_batches():
+			load_child_tables(doctype, docs, tables, table_fields)
+			yield docs
+
+	# the first batch is read before responding, so that invalid arguments are reported as errors
+	batches = get_documents()
+	first_batch = next(batches, [])
+
+	def generate() -> Iterator[str]:
+		for docs in itertools.chain([first_batch], batches):
+			for doc in docs:
+				yield frappe.as_json(doc, indent=None, separators=(",", ":")) + "\n"
+
+	return Response(generate(), mimetype="application/x-ndjson")
+
+
+def get_child_fields(meta, fields: list, has_access_to: set | None) -> list[str]:
+	"""Return `fields` of child doctype, all of them for `*`, the user is allowed to read."""
+	columns = meta.get_valid_columns()
+	if "*" in fields:
+		fields = columns
+	elif invalid := set(fields) - set(columns):
+		frappe.throw(
+			_("Invalid fields for {0}: {1}").format(_(meta.name), ", ".join(sorted(invalid))),
+			frappe.DataError,
+		)
+
+	if has_access_to is None:
+		return list(fields)
+
+	return [
+		fieldname
+		for fieldname in fields
+		if not (df := meta.get_field(fieldname)) or df.permlevel == 0 or df.permlevel in has_access_to
+	]
+
+
+def get_filter_list(doctype: str, filters: dict | list | None) -> list:
+	from frappe.utils.data import make_filter_tuple
+
+	if isinstance(filters, dict):
+		return [make_filter_tuple(doctype, key, value) for key, value in filters.items()]
+	return list(filters or [])
+
+
+def load_child_tables(doctype: str, docs: list[dict], tables: dict[str, list[str]], table_fields: dict):
+	"""Set rows of child `tables`, fieldnames and their fields, on `docs` with one query per child
+	doctype."""
+	docs_by_name = {doc.name: doc for doc in docs}
+	for doc in docs:
+		for fieldname in tables:
+			doc[fieldname] = []
+
+	fieldnames_by_doctype = {}
+	for fieldname in tables:
+		fieldnames_by_doctype.setdefault(table_fields[fieldname].options, []).append(fieldname)
+
+	for child_doctype, fieldnames in fieldnames_by_doctype.items():
+		if not docs_by_name:
+			break
+
+		columns = {"parent", "parentfield"}.union(*(tables[fieldname] for fieldname in fieldnames))
+		rows = frappe.get_all(
+			child_doctype,
+			fields=list(columns),
+			filters={
+				"parenttype": doctype,
+				"parentfield": ("in", fieldnames),
+				"parent": ("in", list(docs_by_name)),
+			},
+			order_by="idx asc",
+		)
+		for row in rows:
+			if doc := docs_by_name.get(row.parent):
+				doc[row.parentfield].append({field: row[field] for field in tables[row.parentfield]})
+
+
 def count(doctype: str) -> int:
 	from frappe.desk.reportview import get_count
 
@@ -284,6 +463,7 @@ url_rules = [
 	# Document level APIs
 	Rule("/document/<doctype>", methods=["GET"], endpoint=document_list),
 	Rule("/document/<doctype>", methods=["POST"], endpoint=create_doc),
+	Rule("/document/<doctype>/bulk", methods=["GET", "POST"], endpoint=bulk_read),
 	Rule("/document/<doctype>/<path:name>/", methods=["GET"], endpoint=read_doc),
 	Rule("/document/<doctype>/<path:name>/copy", methods=["GET"], endpoint=copy_doc),
 	Rule("/document/<doctype>/<path:name>/", methods=["PATCH", "PUT"], endpoint=update_doc),
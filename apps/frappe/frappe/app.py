@@ -102,6 +102,7 @@ def application(request: Request):
 		init_request(request)
 
 		validate_auth()
+		frappe.rate_limiter.apply_user_policies()
 
 		if request.method == "OPTIONS":
 			response = Response()
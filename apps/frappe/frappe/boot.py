@@ -2,8 +2,16 @@
 # License: MIT. See LICENSE
 """
 bootstrap client session
+
+Parts of the boot that are the same for users with the same language, or the same roles, are built once
+and kept as shared fragments in the `bootinfo` cache next to the per user boots, which only keep what
+differs from them. A fragment is cached with a hash of its data, so that the desk can load them as a
+script the browser revalidates by ETag (see `frappe.sessions.get_shared_boot`) instead of downloading
+translations and the like on every load. Fragments are cleared along with the boots of all users.
 """
 
+import copy
+import hashlib
 import os
 
 import frappe
@@ -27,16 +35,20 @@ from frappe.query_builder.functions import Count
 from frappe.query_builder.terms import ParameterizedValueWrapper, SubQuery
 from frappe.utils import add_user_info, cstr, get_system_timezone
 from frappe.utils.change_log import get_versions
+from frappe.utils.data import orjson_dumps
 from frappe.utils.frappecloud import on_frappecloud
+from frappe.utils.response import json_handler
 from frappe.website.doctype.web_page_view.web_page_view import is_tracking_enabled
 
+# Keys of shared fragments in the `bootinfo` cache, user names can't start with it
+BOOT_FRAGMENT_PREFIX = "__boot_fragment:"
+
 
 def get_bootinfo():
 	"""build and return boot info"""
-	from frappe.translate import get_lang_dict, get_translated_doctypes
-
 	frappe.set_user_lang(frappe.session.user)
-	bootinfo = frappe._dict()
+	# copied, boot session hooks may change it
+	bootinfo = frappe._dict(copy.deepcopy(get_shared_bootinfo().data))
 	hooks = frappe.get_hooks()
 	doclist = []
 
@@ -60,17 +72,8 @@ def get_bootinfo():
 	bootinfo.desktop_icons = get_desktop_icons(bootinfo=bootinfo)
 	bootinfo.letter_heads = get_letter_heads()
 	bootinfo.active_domains = frappe.get_active_domains()
-	bootinfo.all_domains = [d.get("name") for d in frappe.get_all("Domain")]
-	add_layouts(bootinfo)
-
-	bootinfo.module_app = frappe.local.module_app
-	bootinfo.single_types = [d.name for d in frappe.get_all("DocType", {"issingle": 1})]
-	bootinfo.nested_set_doctypes = [
-		d.parent for d in frappe.get_all("DocField", {"fieldname": "lft"}, ["parent"])
-	]
 	add_home_page(bootinfo, doclist)
-	bootinfo.page_info = get_allowed_pages()
-	load_translations(bootinfo)
+	bootinfo.lang = frappe.lang
 	add_timezone_info(bootinfo)
 	load_conf_settings(bootinfo)
 	load_print(bootinfo, doclist)
@@ -95,22 +98,14 @@ def get_bootinfo():
 
 	if bootinfo.lang:
 		bootinfo.lang = str(bootinfo.lang)
-	bootinfo.versions = {k: v["version"] for k, v in get_versions().items()}
 
 	bootinfo.error_report_email = frappe.conf.error_report_email
-	bootinfo.calendars = sorted(frappe.get_hooks("calendars"))
-	bootinfo.treeviews = frappe.get_hooks("treeviews") or []
-	bootinfo.lang_dict = get_lang_dict()
-	bootinfo.success_action = get_success_action()
 	bootinfo.update(get_email_accounts(user=frappe.session.user))
 	bootinfo.sms_gateway_enabled = bool(frappe.db.get_single_value("SMS Settings", "sms_gateway_url"))
 	bootinfo.frequently_visited_links = frequently_visited_links()
-	bootinfo.link_preview_doctypes = get_link_preview_doctypes()
 	bootinfo.additional_filters_config = get_additional_filters_from_hooks()
 	bootinfo.desk_settings = get_desk_settings()
 	bootinfo.app_logo_url = get_app_logo()
-	bootinfo.link_title_doctypes = get_link_title_doctypes()
-	bootinfo.translated_doctypes = get_translated_doctypes()
 	bootinfo.subscription_conf = add_subscription_conf()
 	bootinfo.marketplace_apps = get_marketplace_apps()
 	bootinfo.is_fc_site = is_fc_site()
@@ -126,6 +121,75 @@ def get_bootinfo():
 	return bootinfo
 
 
+def get_shared_bootinfo() -> frappe._dict:
+	"""Return boot data shared with users of the same language and roles, and a hash of it as `version`.
+
+	Returned data is cached, it must not be changed."""
+	roles_key = hashlib.sha1("\n".join(sorted(frappe.get_roles())).encode(), usedforsecurity=False)
+	fragments = (
+		get_boot_fragment(f"lang:{frappe.local.lang}", get_language_bootinfo),
+		get_boot_fragment(f"roles:{roles_key.hexdigest()}", get_role_bootinfo),
+	)
+
+	data = {}
+	for fragment in fragments:
+		data.update(fragment["data"])
+	version = hashlib.sha1(
+		"".join(fragment["version"] for fragment in fragments).encode(), usedforsecurity=False
+	)
+	return frappe._dict(data=data, version=version.hexdigest())
+
+
+def get_boot_fragment(key: str, builder) -> dict:
+	def build():
+		data = builder()
+		version = hashlib.sha1(orjson_dumps(data, default=json_handler, decode=False), usedforsecurity=False)
+		return {"version": version.hexdigest(), "data": data}
+
+	if frappe.conf.disable_session_cache:
+		return build()
+
+	return frappe.cache.hget("bootinfo", BOOT_FRAGMENT_PREFIX + key, generator=build)
+
+
+def get_language_bootinfo() -> frappe._dict:
+	"""Return boot data that only depends on the site and language of the user."""
+	from frappe.translate import get_lang_dict, get_messages_for_boot, get_translated_doctypes
+
+	bootinfo = frappe._dict()
+	bootinfo.all_domains = [d.get("name") for d in frappe.get_all("Domain")]
+	add_layouts(bootinfo)
+
+	bootinfo.module_app = frappe.local.module_app
+	bootinfo.single_types = [d.name for d in frappe.get_all("DocType", {"issingle": 1})]
+	bootinfo.nested_set_doctypes = [
+		d.parent for d in frappe.get_all("DocField", {"fieldname": "lft"}, ["parent"])
+	]
+	bootinfo["__messages"] = get_messages_for_boot()
+	load_print_css(bootinfo, frappe.db.get_singles_dict("Print Settings"))
+	bootinfo.versions = {k: v["version"] for k, v in get_versions().items()}
+	bootinfo.calendars = sorted(frappe.get_hooks("calendars"))
+	bootinfo.treeviews = frappe.get_hooks("treeviews") or []
+	bootinfo.lang_dict = get_lang_dict()
+	bootinfo.success_action = get_success_action()
+	bootinfo.link_preview_doctypes = get_link_preview_doctypes()
+	bootinfo.link_title_doctypes = get_link_title_doctypes()
+	bootinfo.translated_doctypes = get_translated_doctypes()
+	return bootinfo
+
+
+def get_role_bootinfo() -> frappe._dict:
+	"""Return boot data that only depends on the roles of the user."""
+	return frappe._dict(page_info=get_allowed_pages())
+
+
+def strip_shared_bootinfo(bootinfo: dict, shared: dict) -> frappe._dict:
+	"""Return `bootinfo` without values that are the same in shared boot data."""
+	return frappe._dict(
+		{key: value for key, value in bootinfo.items() if key not in shared or value != shared[key]}
+	)
+
+
 def get_letter_heads():
 	letter_heads = {}
 
@@ -332,13 +396,6 @@ def get_user_pages_or_reports(parent, cache=False):
 	return has_role
 
 
-def load_translations(bootinfo):
-	from frappe.translate import get_messages_for_boot
-
-	bootinfo["lang"] = frappe.lang
-	bootinfo["__messages"] = get_messages_for_boot()
-
-
 def get_user_info():
 	# get info for current user
 	user_info = frappe._dict()
@@ -382,7 +439,6 @@ def load_print(bootinfo, doclist):
 	print_settings = frappe.db.get_singles_dict("Print Settings")
 	print_settings.doctype = ":Print Settings"
 	doclist.append(print_settings)
-	load_print_css(bootinfo, print_settings)
 
 
 def load_print_css(bootinfo, print_settings):
@@ -101,10 +101,12 @@ def clear_domain_cache(user=None):
 
 
 def clear_global_cache():
+	from frappe.utils.hooks_cache import clear_hooks_cache
 	from frappe.website.utils import clear_website_cache
 
 	clear_doctype_cache()
 	clear_website_cache()
+	clear_hooks_cache()
 	frappe.cache.delete_value(global_cache_keys + bench_cache_keys)
 	frappe.setup_module_map()
 
@@ -165,6 +165,7 @@ def new_site(
 	help="Ignore the validations and downgrade warnings. This action is not recommended",
 )
 @click.option("--encryption-key", help="Backup encryption key")
+@click.option("--workers", type=int, help="Tables restored at a time from a parallel backup")
 @pass_context
 def restore(
 	context: CliCtxObj,
@@ -179,14 +180,26 @@ def restore(
 	force=None,
 	with_public_files=None,
 	with_private_files=None,
+	workers=None,
 ):
 	"Restore site database from an sql file"
 
+	from frappe.utils.parallel_backup import is_parallel_backup, restore_parallel_backup
 	from frappe.utils.synchronization import filelock
 
 	site = get_site(context)
 	frappe.init(site)
 
+	if is_parallel_backup(sql_file_path):
+		with filelock("site_restore", timeout=1):
+			frappe.connect()
+			try:
+				restore_parallel_backup(sql_file_path, workers=workers, verbose=context.verbose or verbose)
+			finally:
+				frappe.destroy()
+		click.secho(f"Site {site} has been restored from {sql_file_path}", fg="green")
+		return
+
 	with filelock("site_restore", timeout=1):
 		_restore(
 			site=site,
@@ -835,6 +848,13 @@ def use(site, sites_path="."):
 @click.option("--verbose", default=False, is_flag=True, help="Add verbosity")
 @click.option("--compress", default=False, is_flag=True, help="Compress private and public files")
 @click.option("--old-backup-metadata", default=False, is_flag=True, help="Use older backup metadata")
+@click.option(
+	"--parallel",
+	default=False,
+	is_flag=True,
+	help="Dump tables in parallel into a directory, with files stored incrementally",
+)
+@click.option("--workers", type=int, help="Tables dumped at a time with --parallel")
 @pass_context
 def backup(
 	context: CliCtxObj,
@@ -850,10 +870,13 @@ def backup(
 	include="",
 	exclude="",
 	old_backup_metadata=False,
+	parallel=False,
+	workers=None,
 ):
 	"Backup"
 
 	from frappe.utils.backups import scheduled_backup
+	from frappe.utils.parallel_backup import new_parallel_backup
 
 	verbose = verbose or context.verbose
 	exit_code = 0
@@ -864,22 +887,34 @@ def backup(
 			frappe.init(site)
 			frappe.connect()
 			rollback_callback = CallbackManager()
-			odb = scheduled_backup(
-				ignore_files=not with_files,
-				backup_path=backup_path,
-				backup_path_db=backup_path_db,
-				backup_path_files=backup_path_files,
-				backup_path_private_files=backup_path_private_files,
-				backup_path_conf=backup_path_conf,
-				ignore_conf=ignore_backup_conf,
-				include_doctypes=include,
-				exclude_doctypes=exclude,
-				compress=compress,
-				verbose=verbose,
-				force=True,
-				old_backup_metadata=old_backup_metadata,
-				rollback_callback=rollback_callback,
-			)
+			if parallel:
+				odb = new_parallel_backup(
+					ignore_files=not with_files,
+					backup_path=backup_path,
+					ignore_conf=ignore_backup_conf,
+					include_doctypes=include,
+					exclude_doctypes=exclude,
+					workers=workers,
+					verbose=verbose,
+					rollback_callback=rollback_callback,
+				)
+			else:
+				odb = scheduled_backup(
+					ignore_files=not with_files,
+					backup_path=backup_path,
+					backup_path_db=backup_path_db,
+					backup_path_files=backup_path_files,
+					backup_path_private_files=backup_path_private_files,
+					backup_path_conf=backup_path_conf,
+					ignore_conf=ignore_backup_conf,
+					include_doctypes=include,
+					exclude_doctypes=exclude,
+					compress=compress,
+					verbose=verbose,
+					force=True,
+					old_backup_metadata=old_backup_metadata,
+					rollback_callback=rollback_callback,
+				)
 		except Exception:
 			click.secho(
 				f"Backup failed for Site {site}. Database or site_config.json may be corrupted",
@@ -7,6 +7,7 @@ import json
 import os
 import secrets
 import shlex
+import shutil
 import signal
 import string
 import subprocess
@@ -733,6 +734,40 @@ class TestBackups(BaseTestCommands):
 		self.assertIsNotNone(after_backup["public"])
 		self.assertIsNotNone(after_backup["private"])
 
+	def test_parallel_backup_and_restore(self):
+		from frappe.utils.parallel_backup import (
+			BackupChecksumError,
+			get_stored_file_path,
+			new_parallel_backup,
+			restore_parallel_backup,
+			verify_parallel_backup,
+		)
+
+		todo = frappe.get_doc(doctype="ToDo", description="parallel backup").insert()
+		file = frappe.get_doc(
+			doctype="File", file_name="parallel_backup.txt", content="parallel backup", is_private=1
+		).insert()
+		frappe.db.commit()
+
+		odb = new_parallel_backup(include_doctypes="ToDo,Note")
+		self.addCleanup(shutil.rmtree, odb.backup_dir, ignore_errors=True)
+		manifest = verify_parallel_backup(odb.backup_dir)
+		self.assertEqual(set(manifest.tables), {"tabToDo", "tabNote"})
+
+		# files are stored by content hash, shared by all backups
+		stored_file = manifest.files[file.file_url.lstrip("/")]
+		self.assertEqual(stored_file["hash"], file.content_hash)
+		self.assertTrue(os.path.exists(get_stored_file_path(odb.file_store, file.content_hash)))
+
+		frappe.db.delete("ToDo", {"name": todo.name})
+		frappe.db.commit()
+		restore_parallel_backup(odb.backup_dir, tables=["tabToDo"], with_files=False)
+		self.assertTrue(frappe.db.exists("ToDo", todo.name))
+
+		with open(os.path.join(odb.backup_dir, manifest.tables["tabToDo"]["file"]), "ab") as f:
+			f.write(b"damaged")
+		self.assertRaises(BackupChecksumError, verify_parallel_backup, odb.backup_dir)
+
 	@run_only_if(db_type_is.MARIADB)
 	def test_clear_log_table(self):
 		d = frappe.get_doc(doctype="Error Log", title="Something").insert()
@@ -451,9 +451,18 @@ def import_doc(context: CliCtxObj, path, force=False):
 )
 @click.option("--submit-after-import", default=False, is_flag=True, help="Submit document after importing it")
 @click.option("--mute-emails", default=True, is_flag=True, help="Mute emails during import")
+@click.option(
+	"--batch", "import_in_batches", default=False, is_flag=True, help="Commit documents in batches (faster)"
+)
 @pass_context
 def data_import(
-	context: CliCtxObj, file_path, doctype, import_type=None, submit_after_import=False, mute_emails=True
+	context: CliCtxObj,
+	file_path,
+	doctype,
+	import_type=None,
+	submit_after_import=False,
+	mute_emails=True,
+	import_in_batches=False,
 ):
 	"Import documents in bulk from CSV or XLSX using data import"
 	from frappe.core.doctype.data_import.data_import import import_file
@@ -462,7 +471,14 @@ def data_import(
 
 	frappe.init(site)
 	frappe.connect()
-	import_file(doctype, file_path, import_type, submit_after_import, console=True)
+	import_file(
+		doctype,
+		file_path,
+		import_type,
+		submit_after_import,
+		console=True,
+		import_in_batches=import_in_batches,
+	)
 	frappe.destroy()
 
 
@@ -1030,6 +1046,43 @@ def list_sites(context: CliCtxObj, output_json=False):
 		click.echo("No sites found")
 
 
+@click.command("import-time")
+@click.option("--limit", default=20, type=int, help="Number of packages to show")
+@click.option("--by-module", is_flag=True, default=False, help="Show modules instead of top level packages")
+@pass_context
+def import_time(context: CliCtxObj, limit=20, by_module=False):
+	"""Show time spent importing packages while starting frappe and connecting to site, if given.
+
+	Imports are run in a new interpreter with `-X importtime`, time is attributed to the package whose
+	module was imported, without time spent importing other packages from it."""
+	import time
+
+	from frappe.utils.commands import get_import_times, render_table
+
+	code = "import frappe"
+	if context.sites:
+		code += f"; frappe.init({context.sites[0]!r}); frappe.connect(); frappe.get_hooks(); frappe.destroy()"
+
+	started_at = time.monotonic()
+	result = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=False
+	)
+	wall_time = (time.monotonic() - started_at) * 1000
+
+	if result.returncode:
+		click.secho(result.stderr, fg="red")
+		sys.exit(result.returncode)
+
+	times = get_import_times(result.stderr, by_module=by_module)
+	total = sum(times.values()) or 1
+	slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:limit]
+	render_table(
+		[["Module" if by_module else "Package", "Import time (ms)", "Share"]]
+		+ [[name, f"{us / 1000:.1f}", f"{us / total:.1%}"] for name, us in slowest]
+	)
+	click.echo(f"Imports took {total / 1000:.0f} ms of {wall_time:.0f} ms spent starting the process")
+
+
 @click.command("setup-chrome")
 def setup_chrome():
 	from frappe.utils.print_utils import setup_chromium
@@ -1070,4 +1123,5 @@ commands = [
 	rebuild_global_search,
 	list_sites,
 	setup_chrome,
+	import_time,
 ]
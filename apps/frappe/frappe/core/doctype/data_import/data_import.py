@@ -33,6 +33,7 @@ class DataImport(Document):
 		delimiter_options: DF.Data | None
 		google_sheets_url: DF.Data | None
 		import_file: DF.Attach | None
+		import_in_batches: DF.Check
 		import_type: DF.Literal["", "Insert New Records", "Update Existing Records"]
 		mute_emails: DF.Check
 		payload_count: DF.Int
@@ -83,8 +84,11 @@ class DataImport(Document):
 		if self.import_file:
 			if importer is None:
 				importer = self.get_importer()
-			payloads = importer.import_file.get_payloads_for_import()
-			self.payload_count = len(payloads)
+			if not importer.import_file.stream:
+				self.payload_count = len(importer.import_file.get_payloads_for_import())
+			elif not self.payload_count or self.has_value_changed("import_file"):
+				# reading a streamed file is left to the import, which sets the actual count
+				self.payload_count = len(importer.import_file.data)
 
 	@frappe.whitelist()
 	def get_preview_from_template(self, import_file=None, google_sheets_url=None):
@@ -268,7 +272,9 @@ def get_import_logs(data_import: str):
 	)
 
 
-def import_file(doctype, file_path, import_type, submit_after_import=False, console=False):
+def import_file(
+	doctype, file_path, import_type, submit_after_import=False, console=False, import_in_batches=False
+):
 	"""
 	Import documents in from CSV or XLSX using data import.
 
@@ -277,12 +283,14 @@ def import_file(doctype, file_path, import_type, submit_after_import=False, cons
 	:param import_type: One of "Insert" or "Update"
 	:param submit_after_import: Whether to submit documents after import
 	:param console: Set to true if this is to be used from command line. Will print errors or progress to stdout.
+	:param import_in_batches: Commit documents in batches instead of after every document.
 	"""
 
 	data_import = frappe.new_doc("Data Import")
 	data_import.reference_doctype = doctype
 	data_import.import_file = file_path
 	data_import.submit_after_import = submit_after_import
+	data_import.import_in_batches = import_in_batches
 	data_import.import_type = (
 		"Insert New Records" if import_type.lower() == "insert" else "Update Existing Records"
 	)
@@ -1,6 +1,7 @@
 # Copyright (c) 2020, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
 
+import itertools
 import json
 import os
 import re
@@ -12,8 +13,9 @@ from frappe import _
 from frappe.core.doctype.version.version import get_diff
 from frappe.model import no_value_fields
 from frappe.utils import cint, cstr, duration_to_seconds, flt, update_progress_bar
-from frappe.utils.csvutils import get_csv_content_from_google_sheets, read_csv_content
+from frappe.utils.csvutils import get_csv_content_from_google_sheets, iter_csv_rows, read_csv_content
 from frappe.utils.xlsxutils import (
+	iter_xlsx_rows,
 	read_xls_file_from_attached_file,
 	read_xlsx_file_from_attached_file,
 )
@@ -22,6 +24,12 @@ INVALID_VALUES = ("", None)
 MAX_ROWS_IN_PREVIEW = 10
 INSERT = "Insert New Records"
 UPDATE = "Update Existing Records"
+# Number of Link values checked in a single query while validating a column
+LINK_VALIDATION_BATCH_SIZE = 1000
+# Minimum seconds between two progress events while importing in batches
+PROGRESS_PUBLISH_INTERVAL = 2
+# Rows read upfront to build columns when a file is streamed
+STREAM_SAMPLE_SIZE = 1000
 DURATION_PATTERN = re.compile(r"^(?:(\d+d)?((^|\s)\d+h)?((^|\s)\d+m)?((^|\s)\d+s)?)$")
 
 
@@ -49,6 +57,7 @@ class Importer:
 			self.import_type,
 			console=self.console,
 			use_sniffer=self.use_sniffer,
+			stream=cint(self.data_import.import_in_batches),
 		)
 
 	def get_data_for_import_preview(self):
@@ -78,8 +87,11 @@ class Importer:
 	def import_data(self):
 		self.before_import()
 
-		# parse docs from rows
-		payloads = self.import_file.get_payloads_for_import()
+		# parse docs from rows, while importing in batches docs are parsed as they are imported
+		if cint(self.data_import.import_in_batches):
+			payloads = self.import_file.iter_payloads_for_import()
+		else:
+			payloads = self.import_file.get_payloads_for_import()
 
 		# dont import if there are non-ignorable warnings
 		warnings = self.import_file.get_warnings()
@@ -124,6 +136,12 @@ class Importer:
 			log_index = log.log_index
 
 		# start import
+		if cint(self.data_import.import_in_batches):
+			total_payload_count = self.import_in_batches(payloads, imported_rows, log_index)
+			# streamed files are only counted once they are read completely
+			self.data_import.db_set("payload_count", total_payload_count)
+			return self.finish_import(total_payload_count)
+
 		total_payload_count = len(payloads)
 		batch_size = frappe.conf.data_import_batch_size or 1000
 
@@ -209,6 +227,10 @@ class Importer:
 
 					log_index += 1
 
+		return self.finish_import(total_payload_count)
+
+	def finish_import(self, total_payload_count: int):
+		"""Set status of the import from its logs, return the logs."""
 		# Logs are db inserted directly so will have to be fetched again
 		import_log = (
 			frappe.get_all(
@@ -246,6 +268,107 @@ class Importer:
 
 		return import_log
 
+	def import_in_batches(self, payloads, imported_rows, log_index) -> int:
+		"""Import payloads committing once per batch instead of once per document.
+
+		Payloads are consumed lazily, so a streamed file starts importing right away. Link values
+		are validated per column while parsing the file. If any document of a batch fails, the batch
+		is rolled back and its documents are imported again one by one, so that only failing rows
+		are reported. Import logs of a batch are written in one query and progress is published at
+		most every `PROGRESS_PUBLISH_INTERVAL` seconds.
+
+		Return the number of payloads read."""
+		expected_payload_count = cint(self.data_import.payload_count)
+		batch_size = cint(frappe.conf.data_import_commit_batch_size) or 100
+		imported_rows = set(imported_rows)
+
+		start = timeit.default_timer()
+		last_published = payload_count = done = 0
+		payloads = iter(payloads)
+		while batch := list(itertools.islice(payloads, batch_size)):
+			payload_count += len(batch)
+			batch = [
+				payload
+				for payload in batch
+				if not imported_rows.intersection(row.row_number for row in payload.rows)
+			]
+			if not batch:
+				continue
+
+			try:
+				logs = [self.import_payload(payload) for payload in batch]
+			except Exception:
+				frappe.clear_messages()
+				frappe.db.rollback()
+				logs = [self.import_payload_and_commit(payload) for payload in batch]
+
+			create_import_logs(self.data_import.name, log_index, logs)
+			log_index += len(logs)
+			done += len(logs)
+
+			if self.data_import.status != "Partial Success" and any(log["success"] for log in logs):
+				self.data_import.db_set("status", "Partial Success")
+			frappe.db.commit()
+
+			total_payload_count = max(expected_payload_count, payload_count)
+			if self.console:
+				update_progress_bar(
+					f"Importing {self.doctype}: {total_payload_count} records",
+					payload_count - 1,
+					total_payload_count,
+				)
+			elif expected_payload_count > 5 and (
+				timeit.default_timer() - last_published > PROGRESS_PUBLISH_INTERVAL
+				or payload_count == total_payload_count
+			):
+				elapsed = timeit.default_timer() - start
+				frappe.publish_realtime(
+					"data_import_progress",
+					{
+						"current": payload_count,
+						"total": total_payload_count,
+						"data_import": self.data_import.name,
+						"success": True,
+						"eta": elapsed / done * (total_payload_count - payload_count),
+					},
+					user=frappe.session.user,
+				)
+				last_published = timeit.default_timer()
+
+		return payload_count
+
+	def import_payload(self, payload):
+		"""Import a payload and return its log, without committing.
+
+		Rows of a payload are parsed lazily while importing in batches, so rows with invalid values
+		are logged as failures here instead of stopping the import."""
+		row_indexes = [row.row_number for row in payload.rows]
+		if warnings := [warning for row in payload.rows for warning in row.warnings]:
+			return {
+				"success": False,
+				"messages": [{"title": _("Invalid Value"), "message": w["message"]} for w in warnings],
+				"row_indexes": row_indexes,
+			}
+
+		doc = self.process_doc(payload.doc)
+		return {"success": True, "docname": doc.name, "row_indexes": row_indexes}
+
+	def import_payload_and_commit(self, payload):
+		try:
+			log = self.import_payload(payload)
+			frappe.db.commit()
+			return log
+		except Exception:
+			messages = frappe.local.message_log
+			frappe.clear_messages()
+			frappe.db.rollback()
+			return {
+				"success": False,
+				"exception": frappe.get_traceback(),
+				"messages": messages,
+				"row_indexes": [row.row_number for row in payload.rows],
+			}
+
 	def after_import(self):
 		frappe.flags.in_import = False
 		frappe.flags.mute_emails = False
@@ -332,7 +455,7 @@ class Importer:
 
 		header_row = [col.header_title for col in self.import_file.columns]
 		rows = [header_row]
-		rows += [row.data for row in self.import_file.data if row.row_number in row_indexes]
+		rows += [row.data for row in self.import_file.iter_rows_for_import() if row.row_number in row_indexes]
 
 		build_csv_response(rows, _(self.doctype))
 
@@ -407,8 +530,20 @@ class Importer:
 
 class ImportFile:
 	def __init__(
-		self, doctype, file, template_options=None, import_type=None, *, console=False, use_sniffer=False
+		self,
+		doctype,
+		file,
+		template_options=None,
+		import_type=None,
+		*,
+		console=False,
+		use_sniffer=False,
+		stream=False,
 	):
+		"""
+		:param stream: read only the first `STREAM_SAMPLE_SIZE` rows upfront, to build columns and preview.
+		        All rows are read from the file again while iterating payloads for import.
+		"""
 		self.doctype = doctype
 		self.template_options = template_options or frappe._dict(column_to_field_map=frappe._dict())
 		self.column_to_field_map = self.template_options.column_to_field_map
@@ -429,7 +564,12 @@ class ImportFile:
 		if not self.file_doc and not self.file_path and not self.google_sheets_url:
 			frappe.throw(_("Invalid template file for import"))
 
-		self.raw_data = self.get_data_from_template_file()
+		self.stream = stream and self.get_streamable_file() is not None
+		if self.stream:
+			rows = self.iter_data_from_template_file()
+			self.raw_data = list(itertools.islice(rows, STREAM_SAMPLE_SIZE + 1))
+		else:
+			self.raw_data = self.get_data_from_template_file()
 		self.parse_data_from_template()
 
 	def get_data_from_template_file(self):
@@ -458,6 +598,27 @@ class ImportFile:
 		if content:
 			return self.read_content(content, extension)
 
+	def get_streamable_file(self) -> tuple[str, str] | None:
+		"""Return path and extension of the template file, if it is on disk and can be streamed."""
+		file_path = self.file_path
+		if self.file_doc:
+			file_path = self.file_doc.get_full_path()
+
+		if not file_path or not os.path.exists(file_path):
+			return
+
+		extension = os.path.splitext(file_path)[1][1:].lower()
+		if extension in ("csv", "xlsx"):
+			return file_path, extension
+
+	def iter_data_from_template_file(self):
+		"""Yield raw rows of the template file without loading the whole file in memory."""
+		file_path, extension = self.get_streamable_file()
+		if extension == "csv":
+			yield from iter_csv_rows(file_path, use_sniffer=self.use_sniffer)
+		else:
+			yield from iter_xlsx_rows(file_path)
+
 	def parse_data_from_template(self):
 		header = None
 		data = []
@@ -519,42 +680,53 @@ class ImportFile:
 		return out
 
 	def get_payloads_for_import(self):
-		payloads = []
-		# make a copy
-		data = list(self.data)
-		while data:
-			doc, rows, data = self.parse_next_row_for_import(data)
-			payloads.append(frappe._dict(doc=doc, rows=rows))
-		return payloads
-
-	def parse_next_row_for_import(self, data):
-		"""
-		Parse rows that make up a doc. A doc maybe built from a single row or multiple rows.
-		Return the doc, rows, and data without the rows.
-		"""
-		doctypes = self.header.doctypes
+		return list(self.iter_payloads_for_import())
+
+	def iter_payloads_for_import(self):
+		"""Yield payloads of docs as soon as all their rows are read.
+
+		A doc maybe built from a single row or multiple rows. Subsequent rows that have blank values
+		in parent columns are considered as child rows of the doc."""
+		has_child_doctypes = len(self.header.doctypes) > 1
+		parent_column_indexes = self.header.get_column_indexes(self.doctype)
+
+		rows = []
+		for row in self.iter_rows_for_import():
+			# if we encounter a row which has values in parent columns, then it is the next doc
+			if rows and (
+				not has_child_doctypes
+				or not all(v in INVALID_VALUES for v in row.get_values(parent_column_indexes))
+			):
+				yield frappe._dict(doc=self.parse_rows_for_import(rows), rows=rows)
+				rows = []
+
+			rows.append(row)
+
+		if rows:
+			yield frappe._dict(doc=self.parse_rows_for_import(rows), rows=rows)
+
+	def iter_rows_for_import(self):
+		if not self.stream:
+			yield from self.data
+			return
 
-		# first row is included by default
-		first_row = data[0]
-		rows = [first_row]
-
-		# if there are child doctypes, find the subsequent rows
-		if len(doctypes) > 1:
-			# subsequent rows that have blank values in parent columns
-			# are considered as child rows
-			parent_column_indexes = self.header.get_column_indexes(self.doctype)
-
-			data_without_first_row = data[1:]
-			for row in data_without_first_row:
-				row_values = row.get_values(parent_column_indexes)
-				# if the row is blank, it's a child row doc
-				if all(v in INVALID_VALUES for v in row_values):
-					rows.append(row)
-					continue
-				# if we encounter a row which has values in parent columns,
-				# then it is the next doc
-				break
+		rows = (
+			(i, row)
+			for i, row in enumerate(self.iter_data_from_template_file())
+			if i > self.header.index and not all(v in INVALID_VALUES for v in row)
+		)
+		# links of a streamed file are validated against values fetched for each batch of its rows
+		while batch := list(itertools.islice(rows, LINK_VALIDATION_BATCH_SIZE)):
+			for column in self.columns:
+				if column.df and not column.skip_import and column.df.fieldtype == "Link":
+					column.set_existing_link_values(get_item_at_index(row, column.index) for _i, row in batch)
+
+			for i, row in batch:
+				yield Row(i, row, self.doctype, self.header, self.import_type)
 
+	def parse_rows_for_import(self, rows):
+		"""Return the doc made up of given rows."""
+		doctypes = self.header.doctypes
 		parent_doc = None
 		for row in rows:
 			for doctype, table_df in doctypes:
@@ -568,9 +740,7 @@ class ImportFile:
 					parent_doc[table_df.fieldname] = parent_doc.get(table_df.fieldname, [])
 					parent_doc[table_df.fieldname].append(child_doc)
 
-		doc = parent_doc
-
-		return doc, rows, data[len(rows) :]
+		return parent_doc
 
 	def get_warnings(self):
 		warnings = []
@@ -722,7 +892,7 @@ class Row:
 				return
 
 		elif df.fieldtype == "Link":
-			exists = self.link_exists(value, df)
+			exists = self.link_exists(value, df, col)
 			if not exists:
 				msg = _("Value {0} missing for {1}").format(frappe.bold(value), frappe.bold(df.options))
 				self.warnings.append(
@@ -778,7 +948,9 @@ class Row:
 
 		return value
 
-	def link_exists(self, value, df):
+	def link_exists(self, value, df, col=None):
+		if col is not None and col.existing_link_values is not None:
+			return col.normalize_link_value(value) in col.existing_link_values
 		return bool(frappe.db.exists(df.options, value, cache=True))
 
 	def parse_value(self, value, col):
@@ -906,6 +1078,8 @@ class Column:
 		self.df = None
 		self.skip_import = None
 		self.warnings = []
+		# values of a Link column which exist, fetched for the whole column or a batch of streamed rows
+		self.existing_link_values: set[str] | None = None
 
 		self.meta = frappe.get_meta(doctype)
 		self.parse()
@@ -1035,12 +1209,8 @@ class Column:
 
 		if self.df.fieldtype == "Link":
 			# find all values that dont exist
-			transform = (lambda v: cstr(v).lower()) if frappe.db.db_type == "mariadb" else cstr
-			values = list({transform(v) for v in self.column_values if v})
-			exists = [
-				transform(d.name) for d in frappe.get_all(self.df.options, filters={"name": ("in", values)})
-			]
-			not_exists = list(set(values) - set(exists))
+			values = self.set_existing_link_values(self.column_values)
+			not_exists = list(values - self.existing_link_values)
 			if not_exists:
 				missing_values = ", ".join(not_exists)
 				message = _("The following values do not exist for {0}: {1}")
@@ -1094,6 +1264,21 @@ class Column:
 						}
 					)
 
+	def set_existing_link_values(self, values) -> set[str]:
+		"""Fetch which of `values` exist as the linked doctype, return all of them normalized."""
+		values = {self.normalize_link_value(v) for v in values if v}
+		self.existing_link_values = set()
+		for batch in frappe.utils.create_batch(list(values), LINK_VALIDATION_BATCH_SIZE):
+			self.existing_link_values.update(
+				self.normalize_link_value(name)
+				for name in frappe.get_all(self.df.options, filters={"name": ("in", batch)}, pluck="name")
+			)
+		return values
+
+	def normalize_link_value(self, value) -> str:
+		# names are compared case insensitively on mariadb
+		return cstr(value).lower() if frappe.db.db_type == "mariadb" else cstr(value)
+
 	def as_dict(self):
 		d = frappe._dict()
 		d.index = self.index
@@ -1308,7 +1493,26 @@ def get_select_options(df):
 
 
 def create_import_log(data_import, log_index, log_details):
-	frappe.get_doc(
+	get_import_log_doc(data_import, log_index, log_details).db_insert()
+
+
+def create_import_logs(data_import, log_index, logs):
+	"""Insert import logs of consecutive payloads, starting at `log_index`, in a single query."""
+	from frappe.model.document import bulk_insert
+	from frappe.model.naming import set_new_name
+
+	docs = []
+	for log_details in logs:
+		doc = get_import_log_doc(data_import, log_index, log_details)
+		set_new_name(doc)
+		docs.append(doc)
+		log_index += 1
+
+	bulk_insert("Data Import Log", docs)
+
+
+def get_import_log_doc(data_import, log_index, log_details):
+	return frappe.get_doc(
 		{
 			"doctype": "Data Import Log",
 			"log_index": log_index,
@@ -1319,4 +1523,4 @@ def create_import_log(data_import, log_index, log_details):
 			"messages": json.dumps(log_details.get("messages", "[]")),
 			"exception": log_details.get("exception"),
 		}
-	).db_insert()
+	)
@@ -1,7 +1,10 @@
 # Copyright (c) 2019, Frappe Technologies and Contributors
 # License: MIT. See LICENSE
+from unittest.mock import patch
+
 import frappe
-from frappe.core.doctype.data_import.importer import Importer
+from frappe.core.doctype.data_import import importer
+from frappe.core.doctype.data_import.importer import INSERT, Importer, ImportFile
 from frappe.tests import IntegrationTestCase
 from frappe.tests.test_query_builder import db_type_is, run_only_if
 from frappe.utils import format_duration, getdate
@@ -113,6 +116,68 @@ class TestImporter(IntegrationTestCase):
 			"Title is required",
 		)
 
+	def test_data_import_in_batches(self):
+		frappe.delete_doc_if_exists(doctype_name, "Test 4")
+		import_file = get_import_file("sample_import_file_without_mandatory")
+		data_import = self.get_importer(doctype_name, import_file, import_in_batches=True)
+		frappe.clear_messages()
+		data_import.start_import()
+		data_import.reload()
+
+		import_log = frappe.get_all(
+			"Data Import Log",
+			fields=["row_indexes", "success", "docname", "log_index"],
+			filters={"data_import": data_import.name},
+			order_by="log_index",
+		)
+
+		# the batch failed as a whole, so rows were imported again one by one
+		self.assertEqual([log.log_index for log in import_log], [0, 1, 2])
+		self.assertEqual([log.success for log in import_log], [0, 0, 1])
+		self.assertEqual(frappe.parse_json(import_log[2].row_indexes), [5])
+		self.assertEqual(import_log[2].docname, "Test 4")
+		self.assertTrue(frappe.db.exists(doctype_name, "Test 4"))
+		self.assertEqual(data_import.status, "Partial Success")
+
+	def test_streamed_payloads(self):
+		import_file = get_import_file("sample_import_file")
+		loaded = ImportFile(doctype_name, import_file.file_url, import_type=INSERT)
+		streamed = ImportFile(doctype_name, import_file.file_url, import_type=INSERT, stream=True)
+		self.assertTrue(streamed.stream)
+
+		def summarize(payloads):
+			return [
+				(
+					[row.row_number for row in payload.rows],
+					payload.doc.title,
+					len(payload.doc.get("table_field_1", [])),
+					len(payload.doc.get("table_field_2", [])),
+				)
+				for payload in payloads
+			]
+
+		self.assertEqual(
+			summarize(streamed.iter_payloads_for_import()), summarize(loaded.get_payloads_for_import())
+		)
+
+	def test_streamed_link_values_beyond_sample(self):
+		_file = frappe.get_doc(
+			doctype="File",
+			content="Description,Allocated To\nFirst,Administrator\nSecond,Guest\nThird,nobody@example.com\n",
+			file_name="todo_import_for_streaming.csv",
+			is_private=1,
+		).save(ignore_permissions=True)
+		self.addCleanup(_file.delete)
+
+		with patch.object(importer, "STREAM_SAMPLE_SIZE", 1):
+			import_file = ImportFile("ToDo", _file.file_url, import_type=INSERT, stream=True)
+
+		self.assertTrue(import_file.stream)
+		self.assertEqual(len(import_file.data), 1)
+		# links of rows read after the sample are looked up instead of being reported as missing
+		rows = [row for payload in import_file.iter_payloads_for_import() for row in payload.rows]
+		self.assertEqual([bool(row.warnings) for row in rows], [False, False, True])
+
 	def test_data_import_update(self):
 		existing_doc = frappe.get_doc(
 			doctype=doctype_name,
@@ -146,12 +211,13 @@ class TestImporter(IntegrationTestCase):
 		self.assertEqual(updated_doc.table_field_1[0].child_description, "child description")
 		self.assertEqual(updated_doc.table_field_1_again[0].child_title, "child title again")
 
-	def get_importer(self, doctype, import_file, update=False, use_sniffer=False):
+	def get_importer(self, doctype, import_file, update=False, use_sniffer=False, import_in_batches=False):
 		data_import = frappe.new_doc("Data Import")
 		data_import.import_type = "Insert New Records" if not update else "Update Existing Records"
 		data_import.reference_doctype = doctype
 		data_import.import_file = import_file.file_url
 		data_import.use_csv_sniffer = use_sniffer
+		data_import.import_in_batches = import_in_batches
 		data_import.insert()
 		# Commit so that the first import failure does not rollback the Data Import insert.
 		frappe.db.commit()
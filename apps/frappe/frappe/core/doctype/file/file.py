@@ -442,8 +442,7 @@ class File(Document):
 		file_name = self.file_url.split("/")[-1]
 		try:
 			file_path = get_files_path(file_name, is_private=self.is_private)
-			with open(file_path, "rb") as f:
-				self.content_hash = get_content_hash(f.read())
+			self.content_hash = get_file_content_hash(file_path)
 		except OSError:
 			frappe.throw(_("File {0} does not exist").format(file_path))
 
@@ -460,6 +459,14 @@ class File(Document):
 		if not self.file_url:
 			return
 
+		# Files with the same content share the file on disk, and so its thumbnails
+		if self.file_url.startswith(("/files", "/private/files")) and (
+			thumbnail_url := self.get_existing_thumbnail_url(suffix)
+		):
+			if set_as_thumbnail and self.thumbnail_url != thumbnail_url:
+				self.db_set("thumbnail_url", thumbnail_url)
+			return thumbnail_url
+
 		try:
 			if self.file_url.startswith(("/files", "/private/files")):
 				image, filename, extn = get_local_image(self.file_url)
@@ -488,6 +495,20 @@ class File(Document):
 
 		return thumbnail_url
 
+	def get_existing_thumbnail_url(self, suffix: str) -> str | None:
+		"""Return URL of the thumbnail with `suffix` if it was made after the file was last written."""
+		filename, extn = os.path.splitext(self.file_url)
+		if not extn:
+			return
+
+		thumbnail_url = f"{filename}_{suffix}{extn}"
+		thumbnail_path = os.path.abspath(frappe.get_site_path("public", thumbnail_url.lstrip("/")))
+		try:
+			if os.path.getmtime(thumbnail_path) >= os.path.getmtime(self.get_full_path()):
+				return thumbnail_url
+		except OSError:
+			return
+
 	def validate_empty_folder(self):
 		"""Throw exception if folder is not empty"""
 		if self.is_folder and frappe.get_all("File", filters={"folder": self.name}, limit=1):
@@ -525,21 +546,26 @@ class File(Document):
 
 	def _delete_file_on_disk(self):
 		"""If file not attached to any other record, delete it"""
-		on_disk_file_not_shared = self.content_hash and not frappe.get_all(
-			"File",
-			filters={
-				"content_hash": self.content_hash,
-				"name": ["!=", self.name],
-				# NOTE: Some old Files might share file_urls while not sharing the is_private value
-				# "is_private": self.is_private,
-			},
-			limit=1,
+		# Files with the same content share one file on disk (see `get_stored_file_url`),
+		# it is deleted with the last File referring to it
+		on_disk_file_not_shared = (
+			self.content_hash and self.file_url and not self.get_file_references(self.file_url, limit=1)
 		)
 		if on_disk_file_not_shared:
 			self.delete_file_data_content()
-		else:
+		elif not (self.thumbnail_url and self.get_file_references(self.thumbnail_url, limit=1)):
 			self.delete_file_data_content(only_thumbnail=True)
 
+	def get_file_references(self, url: str, limit: int | None = None) -> list[str]:
+		"""Return names of other Files using the file at `url` on disk, as file or as thumbnail."""
+		return frappe.get_all(
+			"File",
+			filters={"name": ("!=", self.name)},
+			or_filters={"file_url": url, "thumbnail_url": url},
+			pluck="name",
+			limit=limit,
+		)
+
 	def unzip(self) -> list["File"]:
 		"""Unzip current file and replace it by its children"""
 		if not self.file_url.endswith(".zip"):
@@ -687,7 +713,6 @@ class File(Document):
 			return
 
 		file_exists = False
-		duplicate_file = None
 
 		self.is_private = cint(self.is_private)
 		self.content_type = mimetypes.guess_type(self.file_name)[0]
@@ -700,27 +725,18 @@ class File(Document):
 		):
 			self._content = strip_exif_data(self._content, self.content_type)
 
+		# encode once, so that size, hash and the written file are all computed from the same bytes
+		if isinstance(self._content, str):
+			self._content = self._content.encode()
+
 		self.file_size = self.check_max_file_size()
 		self.content_hash = get_content_hash(self._content)
 
-		# check if a file exists with the same content hash and is also in the same folder (public or private)
-		if not ignore_existing_file_check:
-			duplicate_file = frappe.get_value(
-				"File",
-				{"content_hash": self.content_hash, "is_private": self.is_private},
-				["file_url", "name"],
-				as_dict=True,
-			)
-
-		if duplicate_file:
-			file_doc: File = frappe.get_cached_doc("File", duplicate_file.name)
-			if file_doc.exists_on_disk():
-				if self.exists_on_disk():
-					if not self.file_url:
-						self.file_url = duplicate_file.file_url
-				else:
-					self.file_url = duplicate_file.file_url
-				file_exists = True
+		# share the file on disk with other Files having the same content and privacy
+		if not ignore_existing_file_check and (stored_file_url := self.get_stored_file_url()):
+			if not (self.file_url and self.exists_on_disk()):
+				self.file_url = stored_file_url
+			file_exists = True
 
 		if not file_exists:
 			if not overwrite:
@@ -735,6 +751,29 @@ class File(Document):
 				return write_file_method(self)
 			return self.save_file_on_filesystem()
 
+	def get_stored_file_url(self) -> str | None:
+		"""Return URL of a file on disk with the same content hash and privacy as this File, if any."""
+		url_prefix = "/private/files/" if self.is_private else "/files/"
+		filters = {"content_hash": self.content_hash, "is_private": self.is_private, "is_folder": 0}
+		if self.name:
+			filters["name"] = ("!=", self.name)
+
+		file_urls = frappe.get_all(
+			"File",
+			filters=filters,
+			pluck="file_url",
+			order_by="creation asc",
+		)
+
+		# rows of a shared file outnumber its copies, check each path once
+		for file_url in dict.fromkeys(file_urls):
+			if not (file_url or "").startswith(url_prefix):
+				continue
+
+			file_name = file_url.removeprefix(url_prefix)
+			if "/" not in file_name and os.path.exists(get_files_path(file_name, is_private=self.is_private)):
+				return file_url
+
 	def save_file_on_filesystem(self):
 		safe_file_name = re.sub(r"[/\\%?#]", "_", self.file_name)
 		if self.is_private:
@@ -17,7 +17,7 @@ from frappe.core.api.file import (
 	unzip_file,
 )
 from frappe.core.doctype.file.exceptions import FileTypeNotAllowed
-from frappe.core.doctype.file.utils import get_corrupted_image_msg, get_extension
+from frappe.core.doctype.file.utils import get_corrupted_image_msg, get_extension, get_file_content_hash
 from frappe.desk.form.utils import add_comment
 from frappe.exceptions import ValidationError
 from frappe.tests import IntegrationTestCase
@@ -441,6 +441,36 @@ class TestFile(IntegrationTestCase):
 		self.assertEqual(file1.file_url, file2.file_url)
 		self.assertTrue(os.path.exists(file2.get_full_path()))
 
+	def test_same_content_shares_file_on_disk(self):
+		with make_test_image_file(private=True) as file1:
+			with open(file1.get_full_path(), "rb") as f:
+				content = f.read()
+			self.assertEqual(get_file_content_hash(file1.get_full_path()), file1.content_hash)
+
+			file2 = frappe.get_doc(
+				{
+					"doctype": "File",
+					"file_name": "copy_of_sample_image.jpg",
+					"is_private": 1,
+					"content": content,
+				}
+			).insert()
+			self.assertEqual(file2.file_url, file1.file_url)
+
+			# thumbnail is made once for the shared file
+			thumbnail_url = file1.make_thumbnail()
+			thumbnail_path = frappe.get_site_path("public", thumbnail_url.lstrip("/"))
+			made_at = os.path.getmtime(thumbnail_path)
+			self.assertEqual(file2.make_thumbnail(), thumbnail_url)
+			self.assertEqual(os.path.getmtime(thumbnail_path), made_at)
+
+			file2.delete()
+			self.assertTrue(os.path.exists(file1.get_full_path()))
+			self.assertTrue(os.path.exists(thumbnail_path))
+
+		self.assertFalse(os.path.exists(file1.get_full_path()))
+		self.assertFalse(os.path.exists(thumbnail_path))
+
 	def test_parent_directory_validation_in_file_url(self):
 		file1 = frappe.get_doc(
 			{
@@ -183,12 +183,25 @@ def remove_file_by_url(file_url: str, doctype: str | None = None, name: str | No
 		return remove_file(fid=fid)
 
 
-def get_content_hash(content: bytes | str) -> str:
+def get_content_hash(content: bytes | bytearray | memoryview | str) -> str:
 	if isinstance(content, str):
 		content = content.encode()
 	return hashlib.md5(content, usedforsecurity=False).hexdigest()  # nosec
 
 
+def get_file_content_hash(path: str, chunk_size: int = 1024 * 1024) -> str:
+	"""Return content hash of the file at `path`, same as `get_content_hash` of its content.
+
+	The file is read in chunks into a reused buffer, so it is never loaded in memory as a whole."""
+	md5 = hashlib.md5(usedforsecurity=False)  # nosec
+	buffer = bytearray(chunk_size)
+	view = memoryview(buffer)
+	with open(path, "rb", buffering=0) as f:
+		while size := f.readinto(buffer):
+			md5.update(view[:size])
+	return md5.hexdigest()
+
+
 def generate_file_name(name: str, suffix: str | None = None, is_private: bool = False) -> str:
 	"""Generate conflict-free file name. Suffix will be ignored if name available. If the
 	provided suffix doesn't result in an available path, a random suffix will be picked.
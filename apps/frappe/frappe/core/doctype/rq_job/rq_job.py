@@ -19,7 +19,7 @@ from frappe.utils import (
 	create_batch,
 	make_filter_dict,
 )
-from frappe.utils.background_jobs import get_queues, get_redis_conn
+from frappe.utils.background_jobs import get_coalesced_count, get_queues, get_redis_conn
 
 QUEUES = ["default", "long", "short"]
 JOB_STATUSES = ["queued", "started", "failed", "finished", "deferred", "scheduled", "canceled"]
@@ -48,6 +48,7 @@ class RQJob(Document):
 		from frappe.types import DF
 
 		arguments: DF.Code | None
+		coalesced: DF.Int
 		ended_at: DF.Datetime | None
 		exc_info: DF.Code | None
 		job_id: DF.Data | None
@@ -171,6 +172,7 @@ def serialize_job(job: Job) -> frappe._dict:
 		exc_info=exc_info,
 		arguments=frappe.as_json(job.kwargs),
 		timeout=job.timeout,
+		coalesced=get_coalesced_count(job),
 		creation=convert_utc_to_system_timezone(job.created_at),
 		modified=convert_utc_to_system_timezone(modified),
 		_comment_count=0,
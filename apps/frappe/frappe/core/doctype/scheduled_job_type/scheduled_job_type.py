@@ -3,6 +3,7 @@
 
 import hashlib
 import json
+import time
 from datetime import datetime, timedelta
 from functools import lru_cache
 
@@ -212,10 +213,26 @@ def run_scheduled_job(scheduled_job_type: str, job_type: str | None = None):
 	"""This is a wrapper function that runs a hooks.scheduler_events method"""
 	if frappe.conf.maintenance_mode:
 		raise frappe.InReadOnlyMode("Scheduled jobs can't run in maintenance mode.")
+	start = time.monotonic()
 	try:
 		frappe.get_doc("Scheduled Job Type", scheduled_job_type).execute()
 	except Exception:
 		print(frappe.get_traceback())
+	finally:
+		record_job_cost(scheduled_job_type, time.monotonic() - start)
+
+
+def record_job_cost(scheduled_job_type: str, duration: float):
+	"""Feed run duration back to fair-share scheduler, if enabled."""
+	from frappe.utils.fair_scheduler import get_fair_share_scheduler, is_fair_share_enabled
+
+	if not is_fair_share_enabled():
+		return
+
+	try:
+		get_fair_share_scheduler().job_finished(frappe.local.site, scheduled_job_type, duration)
+	except Exception:
+		frappe.logger("scheduler").error("Failed to record scheduled job cost", exc_info=True)
 
 
 def sync_jobs(hooks: dict | None = None):
@@ -284,9 +284,8 @@ class TestUser(IntegrationTestCase):
 		url = get_url()
 		data = {"cmd": "frappe.core.doctype.user.user.reset_password", "user": "test@test.com"}
 
-		# Clear rate limit tracker to start fresh
-		key = f"rl:{data['cmd']}:{data['user']}"
-		frappe.cache.delete(key)
+		# Clear rate limit tracker to start fresh, requests are counted per IP as seen by the server
+		frappe.cache.delete_keys(f"rate-limit:{data['cmd']}:*:{60 * 60}")
 
 		c = FrappeClient(url)
 		res1 = c.session.post(url, data=data, verify=c.verify, headers=c.headers)
@@ -3,7 +3,7 @@
 import copy
 
 import frappe
-from frappe.core.doctype.version.version import get_diff
+from frappe.core.doctype.version.version import compact_diff, get_diff
 from frappe.tests import IntegrationTestCase
 from frappe.tests.utils import make_test_objects
 
@@ -45,6 +45,30 @@ class TestVersion(IntegrationTestCase):
 		t.save(ignore_version=False)
 		self.assertTrue(get_versions(t))
 
+	def test_diff_of_child_tables(self):
+		old_doc = frappe.get_doc(
+			doctype="Note",
+			title="Version Test",
+			seen_by=[{"name": f"row-{i}", "user": "Administrator"} for i in range(100)],
+		)
+		new_doc = copy.deepcopy(old_doc)
+		new_doc.seen_by[10].user = "Guest"
+		new_doc.seen_by.pop()
+		new_doc.append("seen_by", {"user": "Guest"})
+
+		diff = get_diff(old_doc, new_doc)
+		self.assertEqual(diff.row_changed, [("seen_by", 10, "row-10", [("user", "Administrator", "Guest")])])
+		self.assertEqual([row["name"] for _fieldname, row in diff.removed], ["row-99"])
+		self.assertEqual(len(diff.added), 1)
+
+		# stored rows only keep values
+		added_row = compact_diff(diff).added[0][1]
+		self.assertEqual(added_row["user"], "Guest")
+		self.assertNotIn("parenttype", added_row)
+		self.assertFalse([value for value in added_row.values() if value is None])
+
+		self.assertIsNone(get_diff(old_doc, copy.deepcopy(old_doc)))
+
 
 def get_fieldnames(change_array):
 	return [d[0] for d in change_array]
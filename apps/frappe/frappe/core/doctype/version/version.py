@@ -9,6 +9,20 @@ from frappe.model.document import Document
 from frappe.utils import cstr
 
 FIELDTYPES_TO_IGNORE = frozenset(fieldtype for fieldtype in no_value_fields if fieldtype not in table_fields)
+# Bookkeeping fields of child rows left out of added and removed rows stored in Version
+OMITTED_ROW_FIELDS = frozenset(
+	(
+		"doctype",
+		"owner",
+		"creation",
+		"modified",
+		"modified_by",
+		"parent",
+		"parenttype",
+		"parentfield",
+		"docstatus",
+	)
+)
 
 
 class Version(Document):
@@ -50,7 +64,7 @@ class Version(Document):
 			self.set_impersonator(diff)
 			self.ref_doctype = new.doctype
 			self.docname = new.name
-			self.data = frappe.as_json(diff, indent=None, separators=(",", ":"))
+			self.data = frappe.as_json(compact_diff(diff), indent=None, separators=(",", ":"))
 			return True
 		else:
 			return False
@@ -130,6 +144,7 @@ def get_diff(old, new, for_child=False, compare_cancelled=False):
 				old_rows_by_name[d.name] = d
 
 			found_rows = set()
+			comparable_fields = get_comparable_fields(frappe.get_meta(df.options))
 
 			# check rows for additions, changes
 			for i, d in enumerate(new_value):
@@ -142,7 +157,14 @@ def get_diff(old, new, for_child=False, compare_cancelled=False):
 				if old_row_name and old_row_name in old_rows_by_name:
 					found_rows.add(old_row_name)
 
-					diff = get_diff(old_rows_by_name[old_row_name], d, for_child=True)
+					old_row = old_rows_by_name[old_row_name]
+					# most rows of large tables are unchanged, skip them without a field by field diff
+					if get_row_fingerprint(old_row, comparable_fields) == get_row_fingerprint(
+						d, comparable_fields
+					):
+						continue
+
+					diff = get_diff(old_row, d, for_child=True)
 					if diff and diff.changed:
 						out.row_changed.append((df.fieldname, i, d.name, diff.changed))
 				else:
@@ -201,5 +223,41 @@ def get_diff(old, new, for_child=False, compare_cancelled=False):
 		return None
 
 
+def get_comparable_fields(meta) -> list[tuple[str, str]]:
+	"""Return `(fieldname, fieldtype)` of fields of `meta` which are compared by `get_diff`."""
+	return [
+		(df.fieldname, df.fieldtype)
+		for df in meta.fields
+		if df.fieldtype not in FIELDTYPES_TO_IGNORE
+		and df.fieldtype not in table_fields
+		and not getattr(df, "is_virtual", False)
+	]
+
+
+def get_row_fingerprint(row, comparable_fields) -> tuple:
+	"""Return compared values of a child row, `get_diff` finds no change between rows with equal
+	fingerprints."""
+	return tuple(
+		cstr(row.get(fieldname)) if fieldtype in ("Link", "Dynamic Link") else row.get(fieldname)
+		for fieldname, fieldtype in comparable_fields
+	)
+
+
+def compact_diff(diff):
+	"""Drop empty values and bookkeeping fields from added and removed rows of `diff`."""
+
+	def compact_row(row):
+		return {
+			key: value
+			for key, value in row.items()
+			if key not in OMITTED_ROW_FIELDS and value is not None and value != ""
+		}
+
+	for key in ("added", "removed"):
+		diff[key] = [[fieldname, compact_row(row)] for fieldname, row in diff[key]]
+
+	return diff
+
+
 def on_doctype_update():
 	frappe.db.add_index("Version", ["ref_doctype", "docname"])
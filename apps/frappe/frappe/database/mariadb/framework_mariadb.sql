@@ -254,7 +254,8 @@ CREATE TABLE `tabSessions` (
   `ipaddress` varchar(16) DEFAULT NULL,
   `lastupdate` datetime(6) DEFAULT NULL,
   `status` varchar(20) DEFAULT NULL,
-  KEY `sid` (`sid`)
+  KEY `sid` (`sid`),
+  KEY `lastupdate_index` (`lastupdate`)
 ) ENGINE=InnoDB ROW_FORMAT=DYNAMIC CHARACTER SET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 
@@ -0,0 +1,241 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Online schema change for large MariaDB tables.
+
+For changes InnoDB can't make in place, `ALTER TABLE` copies the whole table and blocks writes to it
+until the copy is done. When `online_schema_change` is set in site config, tables with at least
+`online_schema_change_min_rows` rows (as estimated by InnoDB) are altered without blocking writes:
+
+- the change is first tried with ALGORITHM=INSTANT, then with ALGORITHM=INPLACE and LOCK=NONE
+- if InnoDB can do neither, a shadow table with the new schema is filled in chunks of
+  `online_schema_change_chunk_size` rows, while triggers copy concurrent writes to it. The shadow
+  table then replaces the original one in a single RENAME TABLE.
+- copying pauses while the replica at `replica_host` lags more than
+  `online_schema_change_max_replica_lag` seconds behind
+
+Changes adding unique indexes are never copied this way, duplicates would be silently dropped.
+"""
+
+import time
+
+import frappe
+from frappe.utils import cint, update_progress_bar
+
+DEFAULT_MIN_ROWS = 1_000_000
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_MAX_REPLICA_LAG = 10  # seconds
+REPLICA_LAG_POLL_INTERVAL = 5  # seconds
+# Errors raised when the requested ALGORITHM or LOCK can't be used for the change, or are unknown to
+# the server: ER_UNKNOWN_ALTER_ALGORITHM, ER_UNKNOWN_ALTER_LOCK, ER_ALTER_OPERATION_NOT_SUPPORTED(_REASON)
+ALTER_NOT_SUPPORTED_ERRORS = (1800, 1801, 1845, 1846)
+ONLINE_ALGORITHMS = ("ALGORITHM=INSTANT", "ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def is_online_schema_change_enabled(table_name: str) -> bool:
+	if not cint(frappe.conf.online_schema_change):
+		return False
+
+	min_rows = cint(frappe.conf.online_schema_change_min_rows) or DEFAULT_MIN_ROWS
+	return get_estimated_row_count(table_name) >= min_rows
+
+
+def get_estimated_row_count(table_name: str) -> int:
+	rows = frappe.db.sql(
+		"""select table_rows from information_schema.tables
+		where table_schema = database() and table_name = %s""",
+		table_name,
+	)
+	return cint(rows[0][0]) if rows else 0
+
+
+class OnlineSchemaChange:
+	def __init__(self, table_name: str, alter_specs: list[str], allow_copy: bool = True):
+		"""
+		:param table_name: table to alter.
+		:param alter_specs: alter specifications as for one `ALTER TABLE` statement.
+		:param allow_copy: use shadow table if the change can't be made in place, plain
+		        `ALTER TABLE` is run otherwise.
+		"""
+		self.table_name = table_name
+		self.alter_specs = alter_specs
+		self.allow_copy = allow_copy
+		self.shadow_table = f"_{table_name}_new"[:64]
+		self.old_table = f"_{table_name}_old"[:64]
+		self.triggers = {
+			event: f"_{table_name}_osc_{event.lower()}"[:64] for event in ("INSERT", "UPDATE", "DELETE")
+		}
+		self.chunk_size = cint(frappe.conf.online_schema_change_chunk_size) or DEFAULT_CHUNK_SIZE
+		self.max_replica_lag = (
+			cint(frappe.conf.online_schema_change_max_replica_lag) or DEFAULT_MAX_REPLICA_LAG
+		)
+		self.replica = None
+		self.can_check_replica = bool(frappe.conf.replica_host)
+
+	def run(self):
+		specs = ", ".join(self.alter_specs)
+		for algorithm in ONLINE_ALGORITHMS:
+			try:
+				frappe.db.sql_ddl(f"ALTER TABLE `{self.table_name}` {specs}, {algorithm}")
+				return
+			except Exception as e:
+				if e.args[0] not in ALTER_NOT_SUPPORTED_ERRORS:
+					raise
+
+		if not self.allow_copy:
+			frappe.db.sql_ddl(f"ALTER TABLE `{self.table_name}` {specs}")
+			return
+
+		print(f"Altering {self.table_name} through a shadow table")
+		try:
+			self.create_shadow_table()
+			self.create_triggers()
+			self.copy_rows()
+			self.swap_tables()
+		finally:
+			self.cleanup()
+			if self.replica:
+				self.replica.close()
+
+	def create_shadow_table(self):
+		frappe.db.sql_ddl(f"DROP TABLE IF EXISTS `{self.shadow_table}`")
+		frappe.db.sql_ddl(f"CREATE TABLE `{self.shadow_table}` LIKE `{self.table_name}`")
+		frappe.db.sql_ddl(f"ALTER TABLE `{self.shadow_table}` {', '.join(self.alter_specs)}")
+
+		shadow_columns = set(get_columns(self.shadow_table))
+		# columns removed by the change aren't copied, new ones get their defaults
+		self.columns = [column for column in get_columns(self.table_name) if column in shadow_columns]
+
+	def create_triggers(self):
+		columns = ", ".join(f"`{column}`" for column in self.columns)
+		new_values = ", ".join(f"NEW.`{column}`" for column in self.columns)
+		replace_row = f"REPLACE INTO `{self.shadow_table}` ({columns}) VALUES ({new_values})"
+		delete_row = f"DELETE FROM `{self.shadow_table}` WHERE `name` = OLD.`name`"
+
+		self.drop_triggers()
+		for event, statement in (
+			("INSERT", replace_row),
+			# name could have changed
+			("UPDATE", f"BEGIN {delete_row}; {replace_row}; END"),
+			("DELETE", delete_row),
+		):
+			frappe.db.sql_ddl(
+				f"CREATE TRIGGER `{self.triggers[event]}` AFTER {event} ON `{self.table_name}` "
+				f"FOR EACH ROW {statement}"
+			)
+
+	def copy_rows(self):
+		"""Copy rows to the shadow table in chunks of primary key, rows already copied by triggers
+		are newer and kept."""
+		columns = ", ".join(f"`{column}`" for column in self.columns)
+		estimated_rows = max(get_estimated_row_count(self.table_name), 1)
+		copied = 0
+		last_name = None
+
+		while True:
+			conditions = [] if last_name is None else ["`name` > %(last_name)s"]
+			upper_names = frappe.db.sql(
+				f"""SELECT `name` FROM `{self.table_name}` {where(conditions)}
+				ORDER BY `name` LIMIT 1 OFFSET %(offset)s""",
+				{"last_name": last_name, "offset": self.chunk_size - 1},
+				pluck=True,
+			)
+			if upper_names:
+				conditions.append("`name` <= %(upper_name)s")
+
+			frappe.db.sql(
+				f"""INSERT INTO `{self.shadow_table}` ({columns})
+				SELECT {columns} FROM `{self.table_name}` {where(conditions)}
+				ON DUPLICATE KEY UPDATE `name` = `{self.shadow_table}`.`name`""",
+				{"last_name": last_name, "upper_name": upper_names[0] if upper_names else None},
+			)
+			frappe.db.commit()
+
+			if not upper_names:
+				break
+
+			last_name = upper_names[0]
+			copied += self.chunk_size
+			update_progress_bar(
+				f"Copying rows of {self.table_name}", min(copied, estimated_rows - 1), estimated_rows
+			)
+			self.wait_for_replica()
+
+		print()
+
+	def swap_tables(self):
+		frappe.db.sql_ddl(f"DROP TABLE IF EXISTS `{self.old_table}`")
+		frappe.db.sql_ddl(
+			f"RENAME TABLE `{self.table_name}` TO `{self.old_table}`, "
+			f"`{self.shadow_table}` TO `{self.table_name}`"
+		)
+		# triggers moved with the original table
+		self.drop_triggers()
+		frappe.db.sql_ddl(f"DROP TABLE `{self.old_table}`")
+
+	def cleanup(self):
+		self.drop_triggers()
+		frappe.db.sql_ddl(f"DROP TABLE IF EXISTS `{self.shadow_table}`")
+
+	def drop_triggers(self):
+		for trigger in self.triggers.values():
+			frappe.db.sql_ddl(f"DROP TRIGGER IF EXISTS `{trigger}`")
+
+	def wait_for_replica(self):
+		"""Pause while the replica lags too far behind, or its replication isn't running."""
+		while (lag := self.get_replica_lag()) is not False and (lag is None or lag > self.max_replica_lag):
+			print(f"\nReplica lag is {lag}s, waiting before copying more rows of {self.table_name}")
+			time.sleep(REPLICA_LAG_POLL_INTERVAL)
+
+	def get_replica_lag(self) -> int | None | bool:
+		"""Return seconds the replica is behind, None if replication is stopped and False if it can't
+		be checked."""
+		if not self.can_check_replica:
+			return False
+
+		try:
+			if not self.replica:
+				self.replica = get_replica_connection()
+			status = self.replica.sql("SHOW SLAVE STATUS", as_dict=True)
+		except Exception as e:
+			print(f"\nCan't check replica lag, copying without throttling: {e}")
+			self.can_check_replica = False
+			return False
+
+		if not status:
+			return False
+
+		lag = status[0].get("Seconds_Behind_Master")
+		return None if lag is None else cint(lag)
+
+
+def where(conditions: list[str]) -> str:
+	return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+def get_columns(table_name: str) -> list[str]:
+	return frappe.db.sql(
+		"""select column_name from information_schema.columns
+		where table_schema = database() and table_name = %s
+		order by ordinal_position""",
+		table_name,
+		pluck=True,
+	)
+
+
+def get_replica_connection():
+	from frappe.database import get_db
+
+	conf = frappe.conf
+	user, password = conf.db_user, conf.db_password
+	if conf.different_credentials_for_replica:
+		user = conf.replica_db_user or conf.replica_db_name
+		password = conf.replica_db_password
+
+	return get_db(
+		host=conf.replica_host,
+		port=conf.replica_db_port,
+		user=user,
+		password=password,
+		cur_db_name=conf.db_name,
+	)
@@ -2,6 +2,7 @@ from pymysql.constants.ER import DUP_ENTRY
 
 import frappe
 from frappe import _
+from frappe.database.mariadb.online_schema_change import OnlineSchemaChange, is_online_schema_change_enabled
 from frappe.database.schema import DBTable
 from frappe.utils.defaults import get_not_null_defaults
 
@@ -124,10 +125,13 @@ class MariaDBTable(DBTable):
 					print(f"Failed to update data in {self.table_name} for {col.fieldname}")
 					raise
 		try:
-			for query_parts in [add_column_query, modify_column_query, add_index_query, drop_index_query]:
-				if query_parts:
-					query_body = ", ".join(query_parts)
-					query = f"ALTER TABLE `{self.table_name}` {query_body}"
+			# one statement, so that the table is rebuilt at most once
+			if query_parts := [*add_column_query, *modify_column_query, *add_index_query, *drop_index_query]:
+				query_body = ", ".join(query_parts)
+				query = f"ALTER TABLE `{self.table_name}` {query_body}"
+				if is_online_schema_change_enabled(self.table_name):
+					OnlineSchemaChange(self.table_name, query_parts, allow_copy=not self.add_unique).run()
+				else:
 					# nosemgrep
 					frappe.db.sql_ddl(query)
 
@@ -261,6 +261,7 @@ CREATE TABLE "tabSessions" (
 );
 
 create index on "tabSessions" ("sid");
+create index "lastupdate_index" on "tabSessions" ("lastupdate");
 
 --
 -- Table structure for table "tabSingles"
@@ -161,13 +161,12 @@ class PostgresTable(DBTable):
 					print(f"Failed to update data in {self.table_name} for {col.fieldname}")
 					raise
 		try:
-			if query:
-				final_alter_query = "ALTER TABLE `{}` {}".format(self.table_name, ", ".join(query))
+			if query or change_nullability:
+				final_alter_query = "ALTER TABLE `{}` {}".format(
+					self.table_name, ", ".join([*query, *change_nullability])
+				)
 				# nosemgrep
 				frappe.db.sql(final_alter_query)
-			if change_nullability:
-				# nosemgrep
-				frappe.db.sql(f"ALTER TABLE `{self.table_name}` {','.join(change_nullability)}")
 			if create_contraint_query:
 				# nosemgrep
 				frappe.db.sql(create_contraint_query)
@@ -17,6 +17,7 @@ from frappe.monitor import add_data_to_monitor
 from frappe.permissions import get_role_permissions, get_roles, has_permission
 from frappe.utils import cint, cstr, flt, format_duration, get_html_format, sbool
 from frappe.utils.caching import request_cache
+from frappe.utils.columnar import get_columnar_result
 
 
 def get_report_doc(report_name):
@@ -238,6 +239,9 @@ def run(
 	if sbool(are_default_filters) and report.get("custom_filters"):
 		result["custom_filters"] = report.custom_filters
 
+	if columnar := get_columnar_result(result.get("result")):
+		result["result"] = columnar
+
 	return result
 
 
@@ -17,6 +17,7 @@ from frappe.model.base_document import get_controller
 from frappe.model.db_query import DatabaseQuery
 from frappe.model.utils import is_virtual_doctype
 from frappe.utils import add_user_info, cint, format_duration
+from frappe.utils.columnar import get_columnar_result
 from frappe.utils.data import sbool
 
 DISALLOWED_PARAMS = ("cmd", "data", "ignore_permissions", "view", "user", "csrf_token", "join")
@@ -32,6 +33,10 @@ def get():
 		data = compress(frappe.call(controller.get_list, args=args, **args))
 	else:
 		data = compress(execute(**args), args=args)
+
+	if data and (columnar := get_columnar_result(data["values"], data["keys"])):
+		del data["values"]
+		data["columns"] = columnar.columns
 	return data
 
 
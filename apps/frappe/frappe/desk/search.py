@@ -130,28 +130,8 @@ def search_widget(
 	or_filters = []
 
 	# build from doctype
-	if txt:
-		field_types = {
-			"Data",
-			"Text",
-			"Small Text",
-			"Long Text",
-			"Link",
-			"Select",
-			"Read Only",
-			"Text Editor",
-		}
-		search_fields = ["name"]
-		if meta.title_field:
-			search_fields.append(meta.title_field)
-
-		if meta.search_fields:
-			search_fields.extend(meta.get_search_fields())
-
-		for f in search_fields:
-			fmeta = meta.get_field(f.strip())
-			if not meta.translated_doctype and (f == "name" or (fmeta and fmeta.fieldtype in field_types)):
-				or_filters.append([doctype, f.strip(), "like", f"%{txt}%"])
+	if txt and not meta.translated_doctype:
+		or_filters = [[doctype, f, "like", f"%{txt}%"] for f in get_link_search_fields(meta)]
 
 	if not include_disabled:
 		if meta.get("fields", {"fieldname": "enabled", "fieldtype": "Check"}):
@@ -198,19 +178,37 @@ def search_widget(
 		)
 	)
 
-	values = frappe.get_list(
-		doctype,
-		filters=filters,
-		fields=formatted_fields,
-		or_filters=or_filters,
-		limit_start=start,
-		limit_page_length=None if meta.translated_doctype else page_length,
-		order_by=order_by,
-		ignore_permissions=ignore_permissions,
-		reference_doctype=reference_doctype,
-		as_list=not as_dict,
-		strict=False,
-	)
+	def get_values(filters, or_filters):
+		return frappe.get_list(
+			doctype,
+			filters=filters,
+			fields=formatted_fields,
+			or_filters=or_filters,
+			limit_start=start,
+			limit_page_length=None if meta.translated_doctype else page_length,
+			order_by=order_by,
+			ignore_permissions=ignore_permissions,
+			reference_doctype=reference_doctype,
+			as_list=not as_dict,
+			strict=False,
+		)
+
+	candidates = None
+	if or_filters:
+		from frappe.search.link_search import get_link_search_candidates
+
+		# names matching `txt` from the link search index, if this doctype has one
+		candidates = get_link_search_candidates(doctype, txt)
+		if candidates and candidates.truncated:
+			# the most relevant matches may be among those left out, search the table instead
+			candidates = None
+
+	if candidates is None:
+		values = get_values(filters, or_filters)
+	elif not candidates.names:
+		values = []
+	else:
+		values = get_values([*filters, [doctype, "name", "in", candidates.names]], [])
 
 	if meta.translated_doctype:
 		# Filtering the values array so that query is included in very element
@@ -226,7 +224,12 @@ def search_widget(
 	# Sorting the values array so that relevant results always come first
 	# This will first bring elements on top in which query is a prefix of element
 	# Then it will bring the rest of the elements and sort them in lexicographical order
-	values = sorted(values, key=lambda x: relevance_sorter(x, txt, as_dict))
+	if candidates and candidates.fuzzy:
+		# names resembling a misspelt `txt`, most similar first
+		rank = {name: i for i, name in enumerate(candidates.names)}
+		values = sorted(values, key=lambda x: rank[x.name if as_dict else x[0]])
+	else:
+		values = sorted(values, key=lambda x: relevance_sorter(x, txt, as_dict))
 
 	# remove _relevance from results
 	if not meta.translated_doctype:
@@ -239,6 +242,35 @@ def search_widget(
 	return values
 
 
+def get_link_search_fields(meta) -> list[str]:
+	"""Return fields of `meta` which are matched against the text typed in a Link field."""
+	field_types = {
+		"Data",
+		"Text",
+		"Small Text",
+		"Long Text",
+		"Link",
+		"Select",
+		"Read Only",
+		"Text Editor",
+	}
+	search_fields = ["name"]
+	if meta.title_field:
+		search_fields.append(meta.title_field)
+
+	if meta.search_fields:
+		search_fields.extend(meta.get_search_fields())
+
+	fields = []
+	for f in search_fields:
+		f = f.strip()
+		fmeta = meta.get_field(f)
+		if f not in fields and (f == "name" or (fmeta and fmeta.fieldtype in field_types)):
+			fields.append(f)
+
+	return fields
+
+
 def get_std_fields_list(meta, key):
 	# get additional search fields
 	sflist = ["name"]
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import quopri
+import re
 import traceback
 from contextlib import suppress
 from email.parser import Parser
@@ -40,6 +42,12 @@ from frappe.utils.verified_command import get_signed_params
 if TYPE_CHECKING:
 	from typing import Literal
 
+# Number of sent recipients collected before their status is written when batching updates.
+RECIPIENT_STATUS_BATCH_SIZE = 100
+
+# Number of pre-rendered messages (with encoded attachments) kept per job, see `SendMailContext.get_message_skeleton`
+MESSAGE_SKELETON_CACHE_SIZE = 8
+
 
 class EmailQueue(Document):
 	# begin: auto-generated types
@@ -170,12 +178,18 @@ class EmailQueue(Document):
 		smtp_server_instance: SMTPServer = None,
 		frappe_mail_client: FrappeMail = None,
 		force_send: bool = False,
+		batch_recipient_updates: bool = False,
 	):
-		"""Send emails to recipients."""
+		"""Send emails to recipients.
+
+		:param batch_recipient_updates: Write recipient statuses in batches instead of one commit per recipient.
+		"""
 		if not self.can_send_now() and not force_send:
 			return
 
-		with SendMailContext(self, smtp_server_instance, frappe_mail_client) as ctx:
+		with SendMailContext(
+			self, smtp_server_instance, frappe_mail_client, batch_recipient_updates=batch_recipient_updates
+		) as ctx:
 			ctx.fetch_outgoing_server()
 			message = None
 			for recipient in self.recipients:
@@ -245,10 +259,15 @@ class SendMailContext:
 		queue_doc: Document,
 		smtp_server_instance: SMTPServer = None,
 		frappe_mail_client: FrappeMail = None,
+		batch_recipient_updates: bool = False,
 	):
 		self.queue_doc: EmailQueue = queue_doc
 		self.smtp_server: SMTPServer = smtp_server_instance
 		self.frappe_mail_client: FrappeMail = frappe_mail_client
+		self.batch_recipient_updates = batch_recipient_updates
+		self.pending_sent_recipients: list[str] = []
+		self._message_skeleton: list[bytes] | None = None
+		self._receivers_str: str | None = None
 		self.sent_to_atleast_one_recipient = any(
 			rec.recipient for rec in self.queue_doc.recipients if rec.is_mail_sent()
 		)
@@ -268,6 +287,9 @@ class SendMailContext:
 		return self
 
 	def __exit__(self, exc_type, exc_val, exc_tb):
+		# recipients that already got the mail must be marked before retry accounting
+		self.flush_recipient_status()
+
 		if exc_type:
 			update_fields = {"error": frappe.get_traceback()}
 			if self.queue_doc.retry < get_email_retry_limit():
@@ -302,7 +324,30 @@ class SendMailContext:
 
 	def update_recipient_status_to_sent(self, recipient):
 		self.sent_to_atleast_one_recipient = True
-		recipient.update_db(status="Sent", commit=True)
+		if not self.batch_recipient_updates:
+			recipient.update_db(status="Sent", commit=True)
+			return
+
+		recipient.status = "Sent"
+		self.pending_sent_recipients.append(recipient.name)
+		if len(self.pending_sent_recipients) >= RECIPIENT_STATUS_BATCH_SIZE:
+			self.flush_recipient_status()
+
+	def flush_recipient_status(self):
+		"""Mark all pending recipients as sent with a single query."""
+		if not self.pending_sent_recipients:
+			return
+
+		email_recipient = frappe.qb.DocType("Email Queue Recipient")
+		(
+			frappe.qb.update(email_recipient)
+			.set(email_recipient.status, "Sent")
+			.set(email_recipient.modified, now())
+			.set(email_recipient.modified_by, frappe.session.user)
+			.where(email_recipient.name.isin(self.pending_sent_recipients))
+		).run()
+		frappe.db.commit()
+		self.pending_sent_recipients = []
 
 	def get_message_object(self, message):
 		return Parser(policy=SMTP).parsestr(message)
@@ -319,21 +364,65 @@ class SendMailContext:
 
 	def build_message(self, recipient_email) -> bytes:
 		"""Build message specific to the recipient."""
-		message = self.queue_doc.message
-
-		if not message:
+		if not self.queue_doc.message:
 			return ""
 
-		message = message.replace(self.message_placeholder("tracker"), self.get_tracker_str(recipient_email))
-		message = message.replace(
-			self.message_placeholder("unsubscribe_url"), self.get_unsubscribe_str(recipient_email)
-		)
-		message = message.replace(self.message_placeholder("cc"), self.get_receivers_str())
-		message = message.replace(
-			self.message_placeholder("recipient"), self.get_recipient_str(recipient_email)
+		placeholder_values = {
+			self.message_placeholder("tracker"): self.get_tracker_str(recipient_email),
+			self.message_placeholder("unsubscribe_url"): self.get_unsubscribe_str(recipient_email),
+			self.message_placeholder("cc"): self.get_receivers_str(),
+			self.message_placeholder("recipient"): self.get_recipient_str(recipient_email),
+		}
+
+		skeleton = self.get_message_skeleton()
+		parts = skeleton.copy()
+		for i in range(1, len(skeleton), 2):
+			parts[i] = placeholder_values[skeleton[i].decode()].encode()
+
+		return b"".join(parts)
+
+	def get_message_skeleton(self) -> list[bytes]:
+		"""Return the message with attachments included, split around per-recipient placeholders.
+
+		Attachments are fetched and encoded only once per message, subsequent recipients only get
+		their placeholders spliced in. Even indices hold literal byte ranges, odd indices hold placeholders.
+		The skeleton is also shared between Email Queues with identical message and attachments, as
+		created by `QueueBuilder` when queueing recipients separately."""
+		if self._message_skeleton is not None:
+			return self._message_skeleton
+
+		cache_key = self.get_message_skeleton_cache_key()
+		skeletons: dict = frappe.local.__dict__.setdefault("email_message_skeletons", {})
+
+		if cache_key and cache_key in skeletons:
+			self._message_skeleton = skeletons[cache_key]
+			return self._message_skeleton
+
+		message = self.include_attachments(self.queue_doc.message)
+		placeholders = "|".join(
+			re.escape(self.message_placeholder(key))
+			for key in ("tracker", "unsubscribe_url", "cc", "recipient")
 		)
-		message = self.include_attachments(message)
-		return message
+		self._message_skeleton = re.split(f"({placeholders})".encode(), message)
+
+		if cache_key:
+			if len(skeletons) >= MESSAGE_SKELETON_CACHE_SIZE:
+				skeletons.pop(next(iter(skeletons)))
+			skeletons[cache_key] = self._message_skeleton
+
+		return self._message_skeleton
+
+	def get_message_skeleton_cache_key(self) -> str | None:
+		attachments = self.queue_doc.attachments_list
+		if any(a.get("print_format_attachment") == 1 for a in attachments) and frappe.get_system_settings(
+			"store_attached_pdf_document"
+		):
+			# printed attachments are stored against each queue / communication, can't be shared
+			return
+
+		return hashlib.sha256(
+			safe_encode(self.queue_doc.message) + safe_encode(self.queue_doc.attachments or "")
+		).hexdigest()
 
 	def get_tracker_str(self, recipient_email) -> str:
 		tracker_url = ""
@@ -374,6 +463,11 @@ class SendMailContext:
 		return quopri.encodestring(unsubscribe_url.encode()).decode()
 
 	def get_receivers_str(self):
+		if self._receivers_str is None:
+			self._receivers_str = self._get_receivers_str()
+		return self._receivers_str
+
+	def _get_receivers_str(self):
 		message = ""
 		if self.queue_doc.expose_recipients == "footer":
 			to_str = ", ".join(self.queue_doc.to)
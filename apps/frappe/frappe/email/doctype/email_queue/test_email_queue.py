@@ -93,3 +93,33 @@ class TestEmailQueue(IntegrationTestCase):
 		q2 = frappe.new_doc("Email Queue", email_account="_Test Email Account 1")
 		self.assertIsNot(get_server(frappe.new_doc("Email Queue")), get_server(q1))
 		self.assertIs(get_server(q1), get_server(q2))
+
+	def test_message_skeleton_is_rendered_once(self):
+		from unittest.mock import patch
+
+		email_record = frappe.new_doc("Email Queue")
+		email_record.sender = "Test <test@example.com>"
+		email_record.message = textwrap.dedent(
+			f"""\
+		MIME-Version: 1.0
+		Message-Id: {frappe.generate_hash()}
+		Subject: Skeleton
+		From: Test <test@example.com>
+		To: <!--recipient-->
+
+		Hello <!--recipient--><!--email_open_check-->
+		"""
+		)
+		email_record.expose_recipients = "footer"
+		email_record.set_recipients(["a@example.com", "b@example.com"])
+
+		ctx = SendMailContext(queue_doc=email_record)
+		with patch.object(SendMailContext, "include_attachments", wraps=ctx.include_attachments) as include:
+			first = ctx.build_message("a@example.com")
+			second = ctx.build_message("b@example.com")
+
+		include.assert_called_once()
+		self.assertIn(b"To: a@example.com", first)
+		self.assertIn(b"Hello a@example.com", first)
+		self.assertIn(b"To: b@example.com", second)
+		self.assertNotIn(b"<!--", second)
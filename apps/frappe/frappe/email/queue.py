@@ -1,5 +1,8 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 import frappe
@@ -144,21 +147,118 @@ def flush():
 	if not email_queue_batch:
 		return
 
-	failed_email_queues = []
-	for row in email_queue_batch:
+	EmailQueueBatchSender(email_queue_batch).run()
+
+
+class EmailQueueBatchSender:
+	"""Send a batch of Email Queue rows grouped by outgoing email account.
+
+	One SMTP session (or Frappe Mail client) is opened per account and reused for every mail in the
+	group. If `email_queue_workers_per_account` is set in site config, each account's mails are
+	split across a bounded pool of threads, every thread owning its own DB connection and SMTP session.
+	"""
+
+	def __init__(self, email_queue_batch, workers_per_account: int | None = None):
+		self.email_queue_batch = email_queue_batch
+		self.workers_per_account = max(
+			cint(workers_per_account or frappe.conf.email_queue_workers_per_account), 1
+		)
+		# threads can't see uncommitted test data
+		self.use_threads = self.workers_per_account > 1 and not frappe.in_test
+		self.failed_email_queues = []
+		self._lock = threading.Lock()
+		self._aborted = threading.Event()
+
+	def run(self):
+		for names in self.group_by_email_account().values():
+			if self._aborted.is_set():
+				break
+
+			if not self.use_threads or len(names) == 1:
+				self.send_all(names)
+				continue
+
+			site, sites_path = frappe.local.site, frappe.local.sites_path
+			chunks = [names[i :: self.workers_per_account] for i in range(self.workers_per_account)]
+			with ThreadPoolExecutor(max_workers=self.workers_per_account) as executor:
+				for future in [
+					executor.submit(self.send_all_in_thread, site, sites_path, chunk)
+					for chunk in chunks
+					if chunk
+				]:
+					future.result()
+
+		if self._aborted.is_set():
+			frappe.throw(_("Email Queue flushing aborted due to too many failures."))
+
+	def group_by_email_account(self) -> dict[str, list[str]]:
+		groups = defaultdict(list)
+		for row in self.email_queue_batch:
+			groups[row.email_account or ""].append(row.name)
+		return groups
+
+	def send_all_in_thread(self, site: str, sites_path: str, names: list[str]):
+		frappe.init(site, sites_path=sites_path)
+		frappe.connect()
 		try:
-			email_queue: EmailQueue = frappe.get_doc("Email Queue", row.name)
-			email_queue.send()
+			self.send_all(names)
+		finally:
+			frappe.destroy()
+
+	def send_all(self, names: list[str]):
+		"""Send given Email Queues, reusing outgoing connections of their email accounts."""
+		from frappe.email.doctype.email_queue.email_queue import EmailQueue
+
+		clients = {}
+		try:
+			for name in names:
+				if self._aborted.is_set():
+					break
+
+				try:
+					email_queue: EmailQueue = frappe.get_doc("Email Queue", name)
+					smtp_server, frappe_mail_client = self.get_outgoing_clients(email_queue, clients)
+					email_queue.send(
+						smtp_server_instance=smtp_server,
+						frappe_mail_client=frappe_mail_client,
+						batch_recipient_updates=True,
+					)
+				except Exception:
+					frappe.get_doc("Email Queue", name).log_error()
+					self.record_failure(name)
+		finally:
+			for smtp_server, _frappe_mail_client in clients.values():
+				smtp_server and smtp_server.quit()
+
+	def get_outgoing_clients(self, email_queue, clients: dict) -> tuple:
+		"""Return cached `(SMTPServer, FrappeMail)` pair for the outgoing account of `email_queue`.
+
+		Errors are swallowed here so that `EmailQueue.send` reports them with usual retry accounting."""
+		try:
+			email_account = email_queue.get_email_account()
+			if not email_account:
+				return None, None
+
+			if email_account.name not in clients:
+				if email_account.service == "Frappe Mail":
+					clients[email_account.name] = (None, email_account.get_frappe_mail_client())
+				else:
+					clients[email_account.name] = (email_account.get_smtp_server(), None)
+
+			return clients[email_account.name]
 		except Exception:
-			frappe.get_doc("Email Queue", row.name).log_error()
-			failed_email_queues.append(row.name)
+			frappe.clear_last_message()
+			return None, None
 
+	def record_failure(self, name: str):
+		with self._lock:
+			self.failed_email_queues.append(name)
 			if (
-				len(failed_email_queues) / len(email_queue_batch)
+				len(self.failed_email_queues) / len(self.email_queue_batch)
 				> EMAIL_QUEUE_BATCH_FAILURE_THRESHOLD_PERCENT
-				and len(failed_email_queues) > EMAIL_QUEUE_BATCH_FAILURE_THRESHOLD_COUNT
+				and len(self.failed_email_queues) > EMAIL_QUEUE_BATCH_FAILURE_THRESHOLD_COUNT
 			):
-				frappe.throw(_("Email Queue flushing aborted due to too many failures."))
+				self._aborted.set()
 
 
 def get_queue():
@@ -166,7 +266,7 @@ def get_queue():
 
 	return frappe.db.sql(
 		f"""select
-			name, sender
+			name, sender, email_account
 		from
 			`tabEmail Queue`
 		where
@@ -162,7 +162,10 @@ doc_events = {
 			"frappe.core.doctype.permission_log.permission_log.make_perm_log",
 			"frappe.search.sqlite_search.update_doc_index",
 		],
-		"after_rename": "frappe.desk.notifications.clear_doctype_notifications",
+		"after_rename": [
+			"frappe.desk.notifications.clear_doctype_notifications",
+			"frappe.search.link_search.rename_in_link_search_index",
+		],
 		"on_cancel": [
 			"frappe.desk.notifications.clear_doctype_notifications",
 			"frappe.workflow.doctype.workflow_action.workflow_action.process_workflow_actions",
@@ -172,6 +175,7 @@ doc_events = {
 			"frappe.desk.notifications.clear_doctype_notifications",
 			"frappe.workflow.doctype.workflow_action.workflow_action.process_workflow_actions",
 			"frappe.search.sqlite_search.delete_doc_index",
+			"frappe.search.link_search.remove_from_link_search_index",
 		],
 		"on_update_after_submit": [
 			"frappe.workflow.doctype.workflow_action.workflow_action.process_workflow_actions",
@@ -181,6 +185,7 @@ doc_events = {
 		],
 		"on_change": [
 			"frappe.automation.doctype.milestone_tracker.milestone_tracker.evaluate_milestone",
+			"frappe.search.link_search.update_link_search_index",
 		],
 		"after_delete": ["frappe.core.doctype.permission_log.permission_log.make_perm_log"],
 	},
@@ -215,6 +220,7 @@ scheduler_events = {
 			"frappe.automation.doctype.reminder.reminder.send_reminders",
 			"frappe.model.utils.link_count.update_link_count",
 			"frappe.search.sqlite_search.build_index_if_not_exists",
+			"frappe.search.link_search.build_link_search_indexes",
 			"frappe.pulse.client.send_queued_events",
 		],
 		# 10 minutes
@@ -231,6 +237,9 @@ scheduler_events = {
 		"frappe.email.queue.retry_sending_emails",
 		"frappe.monitor.flush",
 		"frappe.integrations.doctype.google_calendar.google_calendar.sync",
+		"frappe.search.sqlite_search.sync_indexes",
+		"frappe.search.link_search.sync_link_search_changes",
+		"frappe.sessions.flush_session_updates",
 	],
 	"hourly": [],
 	# Maintenance queue happen roughly once an hour but don't align with wall-clock time of *:00
@@ -252,7 +261,9 @@ scheduler_events = {
 		"frappe.email.doctype.notification.notification.trigger_daily_alerts",
 		"frappe.desk.form.document_follow.send_daily_updates",
 	],
-	"daily_long": [],
+	"daily_long": [
+		"frappe.search.sqlite_search.optimize_indexes",
+	],
 	"daily_maintenance": [
 		"frappe.email.doctype.auto_email_report.auto_email_report.send_daily",
 		"frappe.desk.notifications.clear_notifications",
@@ -292,6 +303,7 @@ before_migrate = ["frappe.core.doctype.patch_log.patch_log.before_migrate"]
 after_migrate = [
 	"frappe.website.doctype.website_theme.website_theme.after_migrate",
 	"frappe.search.sqlite_search.build_index_in_background",
+	"frappe.search.link_search.build_link_search_indexes_in_background",
 ]
 
 otp_methods = ["OTP App", "Email", "SMS"]
@@ -578,10 +590,11 @@ persistent_cache_keys = [
 	"changelog-*",  # version update notifications
 	"insert_queue_for_*",  # Deferred Insert
 	"recorder-*",  # Recorder
-	"global_search_queue",
+	"global_search_queue*",
 	"monitor-transactions",
 	"rate-limit-counter-*",
-	"rl:*",
+	"rate-limit:*",
+	"rate-limit-policy:*",
 ]
 
 user_invitation = {
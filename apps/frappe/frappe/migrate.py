@@ -80,6 +80,25 @@ class SiteMigration:
 		self.skip_failing = skip_failing
 		self.skip_search_index = skip_search_index
 		self.skip_fixtures = skip_fixtures
+		self.timings: dict[str, float] = {}
+
+	@contextlib.contextmanager
+	def timed(self, phase: str):
+		"""Record time taken by `phase`, printed once migration is over."""
+		start = time.monotonic()
+		try:
+			yield
+		finally:
+			self.timings[phase] = self.timings.get(phase, 0) + time.monotonic() - start
+
+	def print_timings(self):
+		if not self.timings:
+			return
+
+		print("Time taken:")
+		width = max(len(phase) for phase in self.timings)
+		for phase, duration in self.timings.items():
+			print(f"  {phase.ljust(width)}  {duration:.2f}s")
 
 	def setUp(self):
 		"""Complete setup required for site migration"""
@@ -136,13 +155,16 @@ class SiteMigration:
 	@atomic
 	def run_schema_updates(self):
 		"""Run patches as defined in patches.txt, sync schema changes as defined in the {doctype}.json files"""
-		frappe.modules.patch_handler.run_all(
-			skip_failing=self.skip_failing, patch_type=PatchType.pre_model_sync
-		)
-		frappe.model.sync.sync_all()
-		frappe.modules.patch_handler.run_all(
-			skip_failing=self.skip_failing, patch_type=PatchType.post_model_sync
-		)
+		with self.timed("Pre model sync patches"):
+			frappe.modules.patch_handler.run_all(
+				skip_failing=self.skip_failing, patch_type=PatchType.pre_model_sync
+			)
+		with self.timed("DocType sync"):
+			frappe.model.sync.sync_all()
+		with self.timed("Post model sync patches"):
+			frappe.modules.patch_handler.run_all(
+				skip_failing=self.skip_failing, patch_type=PatchType.post_model_sync
+			)
 
 	@atomic
 	def post_schema_updates(self):
@@ -264,13 +286,18 @@ class SiteMigration:
 			raise SystemExit(1)
 
 		with filelock("bench_migrate", timeout=1):
-			self.setUp()
+			with self.timed("Setup"):
+				self.setUp()
 			try:
-				self.pre_schema_updates()
+				with self.timed("Before migrate hooks"):
+					self.pre_schema_updates()
 				self.run_schema_updates()
-				self.post_schema_updates()
+				with self.timed("Post schema updates"):
+					self.post_schema_updates()
 			finally:
-				self.tearDown()
+				with self.timed("Teardown"):
+					self.tearDown()
+				self.print_timings()
 				frappe.destroy()
 
 
@@ -3,6 +3,7 @@
 import datetime
 import json
 import weakref
+from contextlib import contextmanager
 from types import MappingProxyType
 from typing import TYPE_CHECKING, TypeVar
 
@@ -27,6 +28,7 @@ from frappe.utils import (
 	cast_fieldtype,
 	cint,
 	compare,
+	create_batch,
 	cstr,
 	flt,
 	is_a_property,
@@ -46,6 +48,11 @@ DatetimeTypes = datetime.date | datetime.datetime | datetime.time | datetime.tim
 
 max_positive_value = {"smallint": 2**15 - 1, "int": 2**31 - 1, "bigint": 2**63 - 1}
 
+# Names read per query while prefetching links, see `prefetch_link_values`
+LINK_PREFETCH_BATCH_SIZE = 1000
+# Child rows written per statement, see `db_insert_rows` and `db_update_rows`
+ROWS_PER_STATEMENT = 500
+
 DOCTYPE_TABLE_FIELDS = [
 	_dict(fieldname="fields", options="DocField"),
 	_dict(fieldname="permissions", options="DocPerm"),
@@ -759,6 +766,7 @@ class BaseDocument:
 				raise
 
 		self.set("__islocal", False)
+		self._db_values = d
 
 	def db_update(self):
 		if self.get("__islocal") or not self.name:
@@ -791,13 +799,36 @@ class BaseDocument:
 			else:
 				raise
 
+		self._db_values = d
+
+	def get_db_changes(self, values: dict) -> dict | None:
+		"""Return columns of `values` that differ from the row in the database, None if it isn't known.
+
+		The row is known as last written by this document, or as loaded before save."""
+		previous = self.__dict__.get("_db_values")
+		if previous is None:
+			if not (doc_before_save := self.__dict__.get("_doc_before_save")):
+				return None
+
+			previous = doc_before_save.get_valid_dict(
+				convert_dates_to_str=True,
+				ignore_nulls=self.doctype in DOCTYPES_FOR_DOCTYPE,
+				ignore_virtual=True,
+			)
+
+		return {
+			column: value
+			for column, value in values.items()
+			if column != "name" and (column not in previous or previous[column] != value)
+		}
+
 	def db_update_all(self):
 		"""Raw update parent + children
 		DOES NOT VALIDATE AND CALL TRIGGERS"""
 		self.db_update()
-		for fieldname in self._non_computed_table_fieldnames:
-			for doc in self.get(fieldname):
-				doc.db_update()
+		db_update_rows(
+			[doc for fieldname in self._non_computed_table_fieldnames for doc in self.get(fieldname)]
+		)
 
 	def show_unique_validation_message(self, e):
 		if frappe.db.db_type == "mariadb":
@@ -942,48 +973,15 @@ class BaseDocument:
 		invalid_links = []
 		cancelled_links = []
 
-		for df in self.meta.get_link_fields() + self.meta.get("fields", {"fieldtype": ("=", "Dynamic Link")}):
-			docname = self.get(df.fieldname)
-			if not docname:
-				continue
-
-			assert isinstance(docname, str | int) or (
-				isinstance(docname, list | tuple | set) and len(docname) == 1
-			), f"Unexpected value for field {df.fieldname}: {docname}"
-
-			if df.fieldtype == "Link":
-				doctype = df.options
-				if not doctype:
-					frappe.throw(_("Options not set for link field {0}").format(df.fieldname))
-			else:
-				assert df.fieldtype == "Dynamic Link"
-				doctype = self.get(df.options)
-				if not doctype:
-					frappe.throw(_("{0} must be set first").format(_(self.meta.get_label(df.options))))
+		links = self.get_links_to_validate(is_submittable)
+		for df, doctype, docname, fields_to_fetch, values_to_fetch, check_docstatus in links:
+			if df.fieldtype == "Dynamic Link":
 				invalidate_distinct_link_doctypes(df.parent, df.options, doctype)
 
 			meta = frappe.get_meta(doctype)
 			if not meta.istable:
 				notify_link_count(doctype, docname)
 
-			check_docstatus = is_submittable and frappe.get_meta(doctype).is_submittable
-
-			# get a map of values ot fetch along with this link query
-			# that are mapped as link_fieldname.source_fieldname in Options of
-			# Readonly or Data or Text type fields
-			fields_to_fetch = [
-				_df
-				for _df in self.meta.get_fields_to_fetch(df.fieldname)
-				if not _df.get("fetch_if_empty")
-				or (_df.get("fetch_if_empty") and not self.get(_df.fieldname))
-			]
-			values_to_fetch = (
-				"name",
-				*(_df.fetch_from.split(".")[-1] for _df in fields_to_fetch),
-			)
-			if check_docstatus:
-				values_to_fetch += ("docstatus",)
-
 			if not meta.get("is_virtual"):
 				values = frappe.db.get_value(
 					doctype, docname, values_to_fetch, as_dict=True, cache=True, order_by=None
@@ -1022,6 +1020,49 @@ class BaseDocument:
 
 		return invalid_links, cancelled_links
 
+	def get_links_to_validate(self, is_submittable=False):
+		"""Yield `(df, doctype, docname, fields_to_fetch, values_to_fetch, check_docstatus)` for each
+		set Link and Dynamic Link field, `values_to_fetch` being the columns to read from the linked
+		document."""
+		for df in self.meta.get_link_fields() + self.meta.get("fields", {"fieldtype": ("=", "Dynamic Link")}):
+			docname = self.get(df.fieldname)
+			if not docname:
+				continue
+
+			assert isinstance(docname, str | int) or (
+				isinstance(docname, list | tuple | set) and len(docname) == 1
+			), f"Unexpected value for field {df.fieldname}: {docname}"
+
+			if df.fieldtype == "Link":
+				doctype = df.options
+				if not doctype:
+					frappe.throw(_("Options not set for link field {0}").format(df.fieldname))
+			else:
+				assert df.fieldtype == "Dynamic Link"
+				doctype = self.get(df.options)
+				if not doctype:
+					frappe.throw(_("{0} must be set first").format(_(self.meta.get_label(df.options))))
+
+			check_docstatus = is_submittable and frappe.get_meta(doctype).is_submittable
+
+			# get a map of values ot fetch along with this link query
+			# that are mapped as link_fieldname.source_fieldname in Options of
+			# Readonly or Data or Text type fields
+			fields_to_fetch = [
+				_df
+				for _df in self.meta.get_fields_to_fetch(df.fieldname)
+				if not _df.get("fetch_if_empty")
+				or (_df.get("fetch_if_empty") and not self.get(_df.fieldname))
+			]
+			values_to_fetch = (
+				"name",
+				*(_df.fetch_from.split(".")[-1] for _df in fields_to_fetch),
+			)
+			if check_docstatus:
+				values_to_fetch += ("docstatus",)
+
+			yield df, doctype, docname, fields_to_fetch, values_to_fetch, check_docstatus
+
 	def set_fetch_from_value(self, doctype, df, values):
 		fetch_from_fieldname = df.fetch_from.split(".")[-1]
 		value = values[fetch_from_fieldname]
@@ -1491,6 +1532,194 @@ class BaseDocument:
 				extract_images_from_doc(self, df.fieldname)
 
 
+def prefetch_link_values(docs: list[BaseDocument], is_submittable=False):
+	"""Read linked documents of `docs` with one query per linked doctype and keep them in the value cache.
+
+	`get_invalid_links` of each document then finds its links in `frappe.db.value_cache` instead of
+	querying them one by one. Names that aren't found are left out, they are looked up as before."""
+	# {doctype: {values_to_fetch: {docname}}}
+	requested = {}
+	for doc in docs:
+		for df, doctype, docname, _fields, values_to_fetch, _check in doc.get_links_to_validate(
+			is_submittable or doc.meta.is_submittable
+		):
+			if isinstance(docname, str) and not df.get("is_virtual"):
+				requested.setdefault(doctype, {}).setdefault(values_to_fetch, set()).add(docname)
+
+	value_cache = frappe.db.value_cache
+	for doctype, names_by_fields in requested.items():
+		meta = frappe.get_meta(doctype)
+		if meta.issingle or meta.get("is_virtual"):
+			continue
+
+		names = {
+			name
+			for values_to_fetch, docnames in names_by_fields.items()
+			for name in docnames
+			if values_to_fetch not in value_cache[doctype][name]
+		}
+		if not names:
+			continue
+
+		fields = sorted({field for values_to_fetch in names_by_fields for field in values_to_fetch})
+		rows = {}
+		for batch in create_batch(sorted(names), LINK_PREFETCH_BATCH_SIZE):
+			for row in frappe.db.get_values(
+				doctype, {"name": ("in", batch)}, fields, as_dict=True, order_by=None
+			):
+				rows[cstr(row.name)] = row
+
+		# names are matched case insensitively by MariaDB, Link fields get the stored case
+		folded = {}
+		for name, row in rows.items():
+			folded.setdefault(name.casefold(), []).append(row)
+
+		for values_to_fetch, docnames in names_by_fields.items():
+			for docname in docnames:
+				row = rows.get(docname)
+				if not row and len(matches := folded.get(docname.casefold(), ())) == 1:
+					row = matches[0]
+				if row and values_to_fetch not in value_cache[doctype][docname]:
+					# cached as `get_values` returns them, `get_value` reads the first row
+					value_cache[doctype][docname][values_to_fetch] = [
+						_dict({field: row.get(field) for field in values_to_fetch})
+					]
+
+
+def db_insert_rows(rows: list[BaseDocument]):
+	"""INSERT new child rows, with one statement per `ROWS_PER_STATEMENT` rows of a doctype.
+
+	Rows are inserted one by one as in `db_insert` if their controller inserts them itself, and to
+	report duplicate names and unique values, or retry colliding hash names, if the bulk insert fails."""
+	grouped = {}
+	for d in rows:
+		if _writes_own_rows(d, "db_insert"):
+			d.db_insert()
+		else:
+			grouped.setdefault(d.doctype, []).append(d)
+
+	for doctype, doctype_rows in grouped.items():
+		if len(doctype_rows) == 1 or doctype in DOCTYPES_FOR_DOCTYPE:
+			for d in doctype_rows:
+				d.db_insert()
+			continue
+
+		for batch in create_batch(doctype_rows, ROWS_PER_STATEMENT):
+			values = []
+			for d in batch:
+				if not d.name:
+					set_new_name(d)
+				if not d.creation:
+					d.creation = d.modified = now()
+					d.owner = d.modified_by = frappe.session.user
+				values.append(d.get_valid_dict(convert_dates_to_str=True, ignore_virtual=True))
+
+			columns = list(values[0])
+			try:
+				with _statement_savepoint("db_insert_rows"):
+					frappe.db.sql(
+						"""INSERT INTO `tab{doctype}` ({columns}) VALUES {rows}""".format(
+							doctype=doctype,
+							columns=", ".join("`" + c + "`" for c in columns),
+							rows=", ".join(["({})".format(", ".join(["%s"] * len(columns)))] * len(values)),
+						),
+						[row[c] for row in values for c in columns],
+					)
+			except Exception as e:
+				if not (frappe.db.is_primary_key_violation(e) or frappe.db.is_unique_key_violation(e)):
+					raise
+
+				for d in batch:
+					d.db_insert()
+				continue
+
+			for d, row in zip(batch, values, strict=True):
+				d.set("__islocal", False)
+				d._db_values = row
+
+
+def db_update_rows(rows: list[BaseDocument]):
+	"""Write child rows, inserting new ones and updating only changed columns of existing ones.
+
+	Changed rows are updated together with `frappe.db.bulk_update`. Rows in which only `modified` and
+	`modified_by` changed, as set on all rows when the parent is saved, are updated with one statement
+	for all of them. Rows are written one by one as in `db_update` if their changes aren't known."""
+	new_rows = []
+	grouped = {}
+	for d in rows:
+		if _writes_own_rows(d, "db_update"):
+			d.db_update()
+		elif d.get("__islocal") or not d.name:
+			new_rows.append(d)
+		else:
+			grouped.setdefault(d.doctype, []).append(d)
+
+	db_insert_rows(new_rows)
+
+	for doctype, doctype_rows in grouped.items():
+		changes = {}
+		touched = {}
+		for d in doctype_rows:
+			values = d.get_valid_dict(
+				convert_dates_to_str=True,
+				ignore_nulls=doctype in DOCTYPES_FOR_DOCTYPE,
+				ignore_virtual=True,
+			)
+			changed = d.get_db_changes(values)
+			if changed is None:
+				d.db_update()
+				continue
+
+			if changed.keys() - {"modified", "modified_by"}:
+				changes[d] = changed
+			elif changed:
+				touched.setdefault((values.get("modified"), values.get("modified_by")), []).append(d)
+			d._db_values = values
+
+		if changes:
+			try:
+				frappe.db.bulk_update(
+					doctype,
+					{cstr(d.name): changed for d, changed in changes.items()},
+					chunk_size=ROWS_PER_STATEMENT,
+					update_modified=False,
+				)
+			except Exception as e:
+				if frappe.db.is_unique_key_violation(e):
+					next(iter(changes)).show_unique_validation_message(e)
+				raise
+
+		table = frappe.qb.DocType(doctype)
+		for (modified, modified_by), touched_rows in touched.items():
+			for batch in create_batch(touched_rows, ROWS_PER_STATEMENT):
+				(
+					frappe.qb.update(table)
+					.set(table.modified, modified)
+					.set(table.modified_by, modified_by)
+					.where(table.name.isin([cstr(d.name) for d in batch]))
+				).run()
+
+
+def _writes_own_rows(doc, method):
+	return getattr(type(doc), method) is not getattr(BaseDocument, method) or doc.meta.get("is_virtual")
+
+
+@contextmanager
+def _statement_savepoint(name):
+	"""Roll back the failed statement on postgres, which otherwise aborts the whole transaction."""
+	if frappe.db.db_type != "postgres":
+		yield
+		return
+
+	frappe.db.savepoint(name)
+	try:
+		yield
+	except Exception:
+		frappe.db.rollback(save_point=name)
+		raise
+	frappe.db.release_savepoint(name)
+
+
 def _filter(data, filters, limit=None):
 	"""pass filters as:
 	{"key": "val", "key": ["!=", "val"],
@@ -1536,6 +1765,7 @@ CACHED_PROPERTIES = (prop for prop, value in vars(BaseDocument).items() if isins
 UNPICKLABLE_KEYS = frozenset(
 	(
 		"_parent_doc",
+		"_db_values",
 		*CACHED_PROPERTIES,
 	)
 )
@@ -1546,6 +1776,7 @@ RESERVED_KEYWORDS = frozenset(
 		"flags",
 		"_parent_doc",
 		"_doc_before_save",
+		"_db_values",
 		"dont_update_if_missing",
 		*CACHED_PROPERTIES,
 	)
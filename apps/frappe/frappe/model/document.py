@@ -22,7 +22,14 @@ from frappe.database.utils import commit_after_response
 from frappe.desk.form.document_follow import follow_document
 from frappe.integrations.doctype.webhook import run_webhooks
 from frappe.model import optional_fields, table_fields
-from frappe.model.base_document import BaseDocument, D, get_controller
+from frappe.model.base_document import (
+	BaseDocument,
+	D,
+	db_insert_rows,
+	db_update_rows,
+	get_controller,
+	prefetch_link_values,
+)
 from frappe.model.docstatus import DocStatus
 from frappe.model.naming import set_new_name, validate_name
 from frappe.model.utils import is_virtual_doctype, simple_singledispatch
@@ -440,8 +447,7 @@ class Document(BaseDocument):
 
 		# children
 		if not getattr(self.meta, "is_virtual", False):
-			for d in self.get_all_children():
-				d.db_insert()
+			db_insert_rows(self.get_all_children())
 
 		self.reset_computed_child_tables()
 		self.run_method("after_insert")
@@ -624,9 +630,7 @@ class Document(BaseDocument):
 			qry.run()
 
 		# update / insert
-		for d in all_rows:
-			d: Document
-			d.db_update()
+		db_update_rows(all_rows)
 
 	def reset_computed_child_tables(self):
 		"""Reset computed child tables so that they are reloaded next time"""
@@ -1114,6 +1118,7 @@ class Document(BaseDocument):
 		if self.flags.ignore_links or self._action == "cancel":
 			return
 
+		prefetch_link_values([self, *self.get_all_children()], is_submittable=self.meta.is_submittable)
 		invalid_links, cancelled_links = self.get_invalid_links()
 
 		for d in self.get_all_children():
@@ -1339,10 +1344,11 @@ class Document(BaseDocument):
 			return frappe.clear_last_message()
 
 		for fieldname in self._non_computed_table_fieldnames:
+			rows_before_save = {d.name: d for d in self._doc_before_save.get(fieldname) or []}
 			for row in self.get(fieldname):
-				row._doc_before_save = next(
-					(d for d in (self._doc_before_save.get(fieldname) or []) if d.name == row.name), None
-				)
+				row._doc_before_save = rows_before_save.get(row.name)
+				# rows as loaded now are compared to while saving, see `db_update_rows`
+				row.__dict__.pop("_db_values", None)
 
 	def run_post_save_methods(self):
 		"""Run standard methods after `INSERT` or `UPDATE`. Standard Methods are:
@@ -2043,8 +2049,7 @@ class LazyDocument:
 			if fieldname not in self.__dict__:
 				# Not fetched, can't possibly change so no need to update
 				continue
-			for doc in self.get(fieldname):
-				doc.db_update()
+			db_update_rows(self.get(fieldname))
 
 	@override
 	def init_child_tables(self):
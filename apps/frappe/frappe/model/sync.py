@@ -5,8 +5,12 @@ Sync's doctype and docfields from txt files to database
 perms will get synced only if none exist
 """
 
+import hashlib
+import multiprocessing
 import os
 
+import orjson
+
 import frappe
 from frappe.cache_manager import clear_controller_cache
 from frappe.desk.doctype.desktop_icon.desktop_icon import sync_desktop_icons
@@ -14,7 +18,11 @@ from frappe.model.base_document import get_controller
 from frappe.modules.import_file import import_file_by_path
 from frappe.modules.patch_handler import _patch_mode
 from frappe.modules.utils import get_app_level_directory_path
-from frappe.utils import update_progress_bar
+from frappe.utils import create_batch, get_datetime, update_progress_bar
+
+SYNC_MANIFEST = "sync_manifest.json"
+# Changed files are read in a process pool once there are at least these many
+PARALLEL_READ_THRESHOLD = 64
 
 IMPORTABLE_DOCTYPES = [
 	# for a permission type "impersonate"
@@ -125,6 +133,9 @@ def sync_for(app_name, force=0, reset_permissions=False):
 			for doc_path in icon_files:
 				files.append(doc_path)
 
+	if not force:
+		files = get_files_to_import(app_name, files)
+
 	l = len(files)
 	if l:
 		for i, doc_path in enumerate(files):
@@ -142,6 +153,134 @@ def sync_for(app_name, force=0, reset_permissions=False):
 		print()
 
 
+def get_files_to_import(app_name: str, files: list[str]) -> list[str]:
+	"""Return files which `import_file_by_path` could import, in order, leaving out unchanged ones.
+
+	The sync manifest of the site keeps hash, doctype, name and modified timestamp of documents in every
+	file, so that only new or changed files have to be read. Files are left out if all their documents
+	are stored with the same migration hash (DocTypes) or the same or a newer modified timestamp, as
+	checked with one query per doctype. Others are still checked again by `import_file_by_path`."""
+	manifest = get_sync_manifest()
+	app_manifest = manifest.get(app_name) or {}
+
+	entries = {}
+	to_read = []
+	for path in files:
+		try:
+			stat = os.stat(path)
+		except OSError:
+			continue
+
+		entry = app_manifest.get(path)
+		if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+			entries[path] = entry
+		else:
+			to_read.append(path)
+
+	for path, entry in read_doc_files(to_read).items():
+		if entry:
+			entries[path] = entry
+
+	if to_read or len(entries) != len(app_manifest):
+		manifest[app_name] = entries
+		save_sync_manifest(manifest)
+
+	unchanged = get_unchanged_files(entries)
+	return [path for path in files if path not in unchanged]
+
+
+def get_unchanged_files(entries: dict[str, dict]) -> set[str]:
+	names_by_doctype = {}
+	for entry in entries.values():
+		for doctype, name, _modified in entry["docs"]:
+			names_by_doctype.setdefault(doctype, set()).add(name)
+
+	stored = {}
+	for doctype, names in names_by_doctype.items():
+		if not frappe.db.table_exists(doctype):
+			continue
+
+		if doctype == "DocType" and not frappe.db.has_column("DocType", "migration_hash"):
+			continue
+
+		table = frappe.qb.DocType(doctype)
+		fields = [table.name, table.modified]
+		if doctype == "DocType":
+			fields.append(table.migration_hash)
+
+		for batch in create_batch(sorted(names), 1000):
+			for row in frappe.qb.from_(table).select(*fields).where(table.name.isin(batch)).run(as_dict=True):
+				stored[(doctype, row.name)] = row
+
+	def is_stored(doctype, name, modified, file_hash):
+		row = stored.get((doctype, name))
+		if not row:
+			return False
+
+		if doctype == "DocType":
+			return row.migration_hash == file_hash
+
+		return bool(modified and row.modified and get_datetime(modified) <= get_datetime(row.modified))
+
+	return {
+		path
+		for path, entry in entries.items()
+		if entry["docs"] and all(is_stored(*doc, entry["hash"]) for doc in entry["docs"])
+	}
+
+
+def read_doc_files(paths: list[str]) -> dict[str, dict | None]:
+	"""Return manifest entries of `paths`, reading them in a process pool if there are many."""
+	if len(paths) < PARALLEL_READ_THRESHOLD or frappe.in_test:
+		return {path: read_doc_file(path) for path in paths}
+
+	with multiprocessing.Pool(processes=min(os.cpu_count() or 1, 8)) as pool:
+		return dict(zip(paths, pool.map(read_doc_file, paths, chunksize=16), strict=True))
+
+
+def read_doc_file(path: str) -> dict | None:
+	"""Return hash, size, modification time and `[doctype, name, modified]` of each document in the
+	file at `path`, None if it can't be read."""
+	try:
+		stat = os.stat(path)
+		with open(path, "rb") as f:
+			content = f.read()
+		docs = orjson.loads(content)
+	except (OSError, ValueError):
+		# reported by `import_file_by_path`
+		return None
+
+	if not isinstance(docs, list):
+		docs = [docs] if docs else []
+
+	return {
+		"mtime": stat.st_mtime_ns,
+		"size": stat.st_size,
+		# same as `calculate_hash`, stored as migration hash of DocTypes
+		"hash": hashlib.md5(content, usedforsecurity=False).hexdigest(),
+		"docs": [
+			[doc.get("doctype"), doc.get("name"), doc.get("modified")]
+			for doc in docs
+			if isinstance(doc, dict)
+		],
+	}
+
+
+def get_sync_manifest() -> dict:
+	try:
+		with open(frappe.get_site_path(SYNC_MANIFEST), "rb") as f:
+			return orjson.loads(f.read())
+	except (OSError, ValueError):
+		return {}
+
+
+def save_sync_manifest(manifest: dict):
+	path = frappe.get_site_path(SYNC_MANIFEST)
+	with open(f"{path}.tmp", "wb") as f:
+		f.write(orjson.dumps(manifest))
+	os.replace(f"{path}.tmp", path)
+
+
 def get_doc_files(files, start_path):
 	"""walk and sync all doctypes and pages"""
 
@@ -0,0 +1,6 @@
+import frappe
+
+
+def execute():
+	# expired sessions are looked up by `lastupdate`
+	frappe.db.add_index("Sessions", ["lastupdate"])
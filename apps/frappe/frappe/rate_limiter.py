@@ -1,9 +1,32 @@
 # Copyright (c) 2020, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
 
+"""
+Rate limits for requests.
+
+- `rate_limit` in site config limits the time spent on requests of a site per fixed window, see
+  `RateLimiter`
+- `rate_limit_policies` in site config limits the number of requests to matching paths per sliding
+  window, e.g.
+
+        "rate_limit_policies": [
+                {"path": "/api/method/frappe.client.*", "limit": 300, "seconds": 60, "per": "user"},
+                {"path": "/api/v2/document/*", "methods": ["POST"], "limit": 50, "seconds": 60}
+        ]
+
+  `path` is a glob pattern and requests to all paths it matches share the limit. Limits are counted
+  per "user" (guests per IP), per "ip" (default) or for everyone with "global". Requests over a limit
+  are rejected with 429 and `Retry-After`. Limits per user are counted once the request is
+  authenticated, see `apply_user_policies`, the others before.
+- the `rate_limit` decorator limits the number of calls of a whitelisted method
+
+Sliding windows are counted by `check_rate_limits`, in one round trip to Redis.
+"""
+
 import time
 from collections.abc import Callable
-from functools import wraps
+from fnmatch import fnmatchcase
+from functools import cache, wraps
 
 from werkzeug.wrappers import Response
 
@@ -11,6 +34,72 @@ import frappe
 from frappe import _
 from frappe.utils import cint
 
+# Sliding window counter: requests of the previous fixed window are counted in proportion to how
+# much of it the sliding window still covers. A request is counted against all given keys, only if
+# it's within all of their limits.
+#
+# KEYS: counters, ARGV: limit and window in seconds of each counter
+# Returns: 1 if allowed, requests remaining in the tightest limit, seconds to retry after if rejected
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+local allowed = 1
+local remaining = -1
+local retry_after = 0
+local states = {}
+
+for i, key in ipairs(KEYS) do
+	local limit = tonumber(ARGV[2 * i - 1])
+	local window = tonumber(ARGV[2 * i]) * 1000000
+	local current_window = math.floor(now / window)
+	local elapsed = now - current_window * window
+
+	local state = redis.call("HMGET", key, "window", "current", "previous")
+	local stored_window = tonumber(state[1])
+	local current = tonumber(state[2]) or 0
+	local previous = tonumber(state[3]) or 0
+	if stored_window ~= current_window then
+		if stored_window == current_window - 1 then
+			previous = current
+		else
+			previous = 0
+		end
+		current = 0
+	end
+
+	local count = previous * (1 - elapsed / window) + current
+	if count + 1 > limit then
+		allowed = 0
+		local wait = window
+		if previous > 0 and current + 1 <= limit then
+			-- enough of the previous window has to slide out
+			wait = window * (1 - (limit - current - 1) / previous) - elapsed
+		elseif current > 0 and limit >= 1 then
+			-- requests of this window have to slide out, during the next one
+			wait = 2 * window - elapsed - window * (limit - 1) / current
+		end
+		retry_after = math.max(retry_after, wait)
+	end
+
+	local left = math.max(limit - count - 1, 0)
+	if remaining < 0 or left < remaining then
+		remaining = left
+	end
+	states[i] = {current_window, current, previous, window}
+end
+
+if allowed == 1 then
+	for i, key in ipairs(KEYS) do
+		local state = states[i]
+		redis.call("HSET", key, "window", state[1], "current", state[2] + 1, "previous", state[3])
+		redis.call("PEXPIRE", key, math.ceil(2 * state[4] / 1000))
+	end
+end
+
+return {allowed, math.floor(remaining), math.ceil(retry_after / 1000000)}
+"""
+RATE_LIMIT_PER = ("user", "ip", "global")
+
 
 def apply():
 	rate_limit = frappe.conf.rate_limit
@@ -18,6 +107,9 @@ def apply():
 		frappe.local.rate_limiter = RateLimiter(rate_limit["limit"], rate_limit["window"])
 		frappe.local.rate_limiter.apply()
 
+	# users authenticated by API keys, tokens or OAuth are only known after `validate_auth`
+	apply_policies(per=("ip", "global"))
+
 
 def update():
 	if hasattr(frappe.local, "rate_limiter"):
@@ -25,8 +117,80 @@ def update():
 
 
 def respond():
-	if hasattr(frappe.local, "rate_limiter"):
-		return frappe.local.rate_limiter.respond()
+	if hasattr(frappe.local, "rate_limiter") and (response := frappe.local.rate_limiter.respond()):
+		return response
+
+	if frappe.flags.rate_limit_policy_exceeded:
+		return Response(_("Too Many Requests"), status=429)
+
+
+@cache
+def get_sliding_window_script():
+	return frappe.cache.register_script(SLIDING_WINDOW_SCRIPT)
+
+
+def check_rate_limits(limits: list[tuple[str, int, int]]) -> frappe._dict:
+	"""Count a request against `limits`, tuples of cache key, number of requests and seconds of the
+	sliding window, in one round trip. The request is only counted if it's within all of them.
+
+	Return whether it's `allowed`, requests `remaining` within the tightest limit and seconds to
+	`retry_after` if it isn't allowed."""
+	keys, args = [], []
+	for key, limit, seconds in limits:
+		keys.append(frappe.cache.make_key(key))
+		args.extend((limit, seconds))
+
+	allowed, remaining, retry_after = get_sliding_window_script()(keys=keys, args=args, client=frappe.cache)
+	return frappe._dict(allowed=bool(allowed), remaining=remaining, retry_after=retry_after)
+
+
+def apply_user_policies():
+	"""Reject the request if it's over a limit of `rate_limit_policies` counted per user.
+
+	Called once the request is authenticated."""
+	apply_policies(per=("user",))
+
+
+def apply_policies(per: tuple[str, ...] = RATE_LIMIT_PER):
+	"""Reject the request if it's over a limit of `rate_limit_policies` matching it, counted `per`."""
+	policies = frappe.conf.rate_limit_policies
+	request = getattr(frappe.local, "request", None)
+	if not policies or not request:
+		return
+
+	limits = []
+	for policy in policies:
+		if not fnmatchcase(request.path, policy.get("path") or "*"):
+			continue
+		if (methods := policy.get("methods")) and request.method not in methods:
+			continue
+
+		policy_per = policy.get("per") or "ip"
+		if policy_per not in RATE_LIMIT_PER:
+			frappe.throw(_("Invalid rate limit policy for {0}").format(policy.get("path")))
+		if policy_per not in per:
+			continue
+
+		limit, seconds = cint(policy.get("limit")), cint(policy.get("seconds"))
+		key = f"rate-limit-policy:{policy.get('path')}:{seconds}:{policy_per}:{get_identity(policy_per)}"
+		limits.append((key, limit, seconds))
+
+	if not limits:
+		return
+
+	result = check_rate_limits(limits)
+	if not result.allowed:
+		frappe.flags.rate_limit_policy_exceeded = True
+		frappe.local.response_headers["Retry-After"] = str(result.retry_after)
+		raise frappe.TooManyRequestsError
+
+
+def get_identity(per: str) -> str:
+	if per == "user" and frappe.session.user != "Guest":
+		return frappe.session.user
+	if per in ("user", "ip"):
+		return frappe.local.request_ip or ""
+	return ""
 
 
 class RateLimiter:
@@ -110,8 +274,8 @@ def rate_limit(
 ):
 	"""Decorator to rate limit an endpoint.
 
-	This will limit Number of requests per endpoint to `limit` within `seconds`.
-	Uses redis cache to track request counts.
+	This will limit Number of requests per endpoint to `limit` within a sliding window of `seconds`.
+	Uses redis cache to track request counts, see `check_rate_limits`.
 
 	:param key: Key is used to identify the requests uniqueness (Optional)
 	:param limit: Maximum number of requests to allow with in window time
@@ -151,17 +315,12 @@ def rate_limit(
 			if not identity:
 				frappe.throw(_("Either key or IP flag is required."))
 
-			cache_key = frappe.cache.make_key(f"rl:{frappe.form_dict.cmd}:{identity}")
-
-			if not callable(seconds):
-				cache_key += f":{seconds}".encode()
-
-			value = frappe.cache.get(cache_key)
-			if not value:
-				frappe.cache.setex(cache_key, seconds, 0)
-
-			value = frappe.cache.incrby(cache_key, 1)
-			if value > _limit:
+			_seconds = seconds() if callable(seconds) else seconds
+			result = check_rate_limits(
+				[(f"rate-limit:{frappe.form_dict.cmd}:{identity}:{_seconds}", _limit, _seconds)]
+			)
+			if not result.allowed:
+				frappe.local.response_headers["Retry-After"] = str(result.retry_after)
 				frappe.throw(
 					_("You hit the rate limit because of too many requests. Please try after sometime."),
 					frappe.RateLimitExceededError,
@@ -0,0 +1,368 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Index for Link field search.
+
+`search_widget` matches `%txt%` against the search fields of a doctype, which scans the whole table on
+every keystroke in a Link field. Doctypes listed in the `link_search_index` hook or site config keep
+their search field values in a local SQLite FTS5 table with the trigram tokenizer instead:
+
+- queries of 3 or more characters are answered as substring matches from the trigram index
+- shorter queries match prefixes of name and title
+- if nothing matches, names sharing most trigrams with the query are returned, so typos still find
+  something
+
+The index only returns candidate names. `search_widget` fetches them through `frappe.get_list`, so
+filters, user permissions and ordering apply as usual. Indexes are updated once document changes are
+committed, updates that fail are retried by the scheduler, see `sync_link_search_changes`. Indexes are
+rebuilt after migrate.
+"""
+
+import json
+import os
+import sqlite3
+from collections import defaultdict
+from contextlib import closing, contextmanager
+
+import frappe
+
+INDEX_NAME = "link_search.db"
+# Names returned for a query, matches beyond this are left out
+MAX_CANDIDATES = 1000
+MIN_SUBSTRING_QUERY_LENGTH = 3  # shortest query the trigram index can answer
+MIN_FUZZY_QUERY_LENGTH = 4
+# Fraction of query trigrams a value must contain to be suggested for a misspelt query
+MIN_FUZZY_SIMILARITY = 0.5
+FUZZY_CANDIDATES = 200
+BUILD_BATCH_SIZE = 5000
+# Documents whose index update failed, as JSON `[doctype, name]`
+PENDING_CHANGES = "link_search_pending_changes"
+
+
+def get_indexed_doctypes() -> set[str]:
+	return set(frappe.get_hooks("link_search_index") or []) | set(frappe.get_conf().link_search_index or [])
+
+
+def get_link_search_candidates(doctype: str, txt: str) -> frappe._dict | None:
+	"""Return names matching `txt` from the link search index of `doctype`, None if it isn't indexed.
+
+	Result has `names` in order of relevance, `fuzzy` if they only resemble `txt` and `truncated`
+	if more names matched than were returned."""
+	if doctype not in get_indexed_doctypes():
+		return None
+
+	try:
+		return LinkSearchIndex(doctype).search(txt)
+	except sqlite3.Error:
+		frappe.log_error(title=f"Link Search Index Error for {doctype}")
+		return None
+
+
+class LinkSearchIndex:
+	def __init__(self, doctype: str):
+		from frappe.desk.search import get_link_search_fields
+
+		self.doctype = doctype
+		self.meta = frappe.get_meta(doctype)
+		self.fields = get_link_search_fields(self.meta)
+		self.table = f"link_{frappe.scrub(doctype)}"
+		self.db_path = os.path.join(frappe.get_site_path(), INDEX_NAME)
+
+	def connect(self) -> sqlite3.Connection:
+		# transactions are explicit, see `transaction`
+		conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+		conn.execute("PRAGMA journal_mode = WAL")  # readers aren't blocked while a doctype is rebuilt
+		conn.execute("PRAGMA synchronous = NORMAL")
+		return conn
+
+	def exists(self) -> bool:
+		if not os.path.exists(self.db_path):
+			return False
+
+		with closing(self.connect()) as conn:
+			return self._exists(conn)
+
+	def _exists(self, conn) -> bool:
+		try:
+			return bool(
+				conn.execute("SELECT 1 FROM link_search_state WHERE doctype = ?", (self.doctype,)).fetchone()
+			)
+		except sqlite3.OperationalError:
+			# state table doesn't exist yet
+			return False
+
+	def build(self):
+		"""Index all documents of the doctype, replacing the existing index."""
+		if self.meta.issingle or self.meta.is_virtual:
+			return
+
+		started_at = frappe.utils.now()
+		with closing(self.connect()) as conn, transaction(conn):
+			conn.execute(
+				"CREATE TABLE IF NOT EXISTS link_search_state (doctype TEXT PRIMARY KEY, built_at TEXT)"
+			)
+			conn.execute(f'DROP TABLE IF EXISTS "{self.table}"')
+			conn.execute(f'DROP TABLE IF EXISTS "{self.table}_docs"')
+			conn.execute(
+				f'CREATE VIRTUAL TABLE "{self.table}" USING fts5(name, title, content, tokenize="trigram")'
+			)
+			conn.execute(
+				f"""CREATE TABLE "{self.table}_docs" (
+					name TEXT PRIMARY KEY, name_key TEXT, title_key TEXT, fts_rowid INTEGER
+				)"""
+			)
+			conn.execute(f'CREATE INDEX "{self.table}_name_key" ON "{self.table}_docs" (name_key)')
+			conn.execute(f'CREATE INDEX "{self.table}_title_key" ON "{self.table}_docs" (title_key)')
+
+			last_name = None
+			while docs := self.get_documents(last_name):
+				self._insert(conn, docs)
+				last_name = docs[-1].name
+
+			conn.execute(
+				"INSERT OR REPLACE INTO link_search_state (doctype, built_at) VALUES (?, ?)",
+				(self.doctype, started_at),
+			)
+
+		# documents changed while building may have been written to the replaced index
+		self.update(
+			frappe.get_all(self.doctype, fields=self.fields, filters={"modified": (">=", started_at)})
+		)
+
+	def drop(self):
+		if not os.path.exists(self.db_path):
+			return
+
+		with closing(self.connect()) as conn, transaction(conn):
+			conn.execute(f'DROP TABLE IF EXISTS "{self.table}"')
+			conn.execute(f'DROP TABLE IF EXISTS "{self.table}_docs"')
+			if self._exists(conn):
+				conn.execute("DELETE FROM link_search_state WHERE doctype = ?", (self.doctype,))
+
+	def get_documents(self, after: str | None = None) -> list[frappe._dict]:
+		return frappe.get_all(
+			self.doctype,
+			fields=self.fields,
+			filters={"name": (">", after)} if after else None,
+			order_by="name asc",
+			limit=BUILD_BATCH_SIZE,
+		)
+
+	def update(self, docs):
+		"""Replace index entries of given documents."""
+		if not docs or not self.exists():
+			return
+
+		with closing(self.connect()) as conn, transaction(conn):
+			self._delete(conn, [doc.name for doc in docs])
+			self._insert(conn, docs)
+
+	def sync(self, names: list[str]):
+		"""Replace index entries of given documents with their current values, removing deleted ones."""
+		if not names or not self.exists():
+			return
+
+		docs = frappe.get_all(self.doctype, fields=self.fields, filters={"name": ("in", names)})
+		with closing(self.connect()) as conn, transaction(conn):
+			self._delete(conn, names)
+			self._insert(conn, docs)
+
+	def _insert(self, conn, docs):
+		for doc in docs:
+			name, title, content = self.get_values(doc)
+			cursor = conn.execute(
+				f'INSERT INTO "{self.table}" (name, title, content) VALUES (?, ?, ?)', (name, title, content)
+			)
+			conn.execute(
+				f'INSERT OR REPLACE INTO "{self.table}_docs" VALUES (?, ?, ?, ?)',
+				(name, name.casefold(), title.casefold(), cursor.lastrowid),
+			)
+
+	def _delete(self, conn, names):
+		for name in names:
+			row = conn.execute(
+				f'SELECT fts_rowid FROM "{self.table}_docs" WHERE name = ?', (name,)
+			).fetchone()
+			if row:
+				conn.execute(f'DELETE FROM "{self.table}" WHERE rowid = ?', row)
+				conn.execute(f'DELETE FROM "{self.table}_docs" WHERE name = ?', (name,))
+
+	def get_values(self, doc) -> tuple[str, str, str]:
+		"""Return name, title and other search field values of `doc` as indexed."""
+		title_field = self.meta.title_field if self.meta.title_field in self.fields else None
+		title = str(doc.get(title_field) or "") if title_field else ""
+		content = " ".join(
+			str(doc.get(field))
+			for field in self.fields
+			if field not in ("name", title_field) and doc.get(field)
+		)
+		return str(doc.name), title, content
+
+	def search(self, txt: str, limit: int = MAX_CANDIDATES) -> frappe._dict | None:
+		"""Return names matching `txt`, None if the index isn't built yet."""
+		txt = txt.strip().casefold()
+		if not txt or not os.path.exists(self.db_path):
+			return None
+
+		with closing(self.connect()) as conn:
+			if not self._exists(conn):
+				return None
+
+			if len(txt) < MIN_SUBSTRING_QUERY_LENGTH:
+				names = self._search_prefix(conn, txt, limit)
+			else:
+				names = self._search_substring(conn, txt, limit)
+
+			if names or len(txt) < MIN_FUZZY_QUERY_LENGTH:
+				return frappe._dict(names=names, fuzzy=False, truncated=len(names) >= limit)
+
+			return frappe._dict(names=self._search_fuzzy(conn, txt), fuzzy=True, truncated=False)
+
+	def _search_prefix(self, conn, txt, limit):
+		rows = conn.execute(
+			f"""SELECT name FROM "{self.table}_docs"
+			WHERE (name_key >= :txt AND name_key < :end) OR (title_key >= :txt AND title_key < :end)
+			LIMIT :limit""",
+			{"txt": txt, "end": txt + "\U0010ffff", "limit": limit},
+		)
+		return [row[0] for row in rows]
+
+	def _search_substring(self, conn, txt, limit):
+		# a phrase of the trigram tokenizer matches values containing it
+		rows = conn.execute(
+			f"""SELECT name FROM "{self.table}" WHERE "{self.table}" MATCH ?
+			ORDER BY instr(lower(name), ?) = 1 DESC LIMIT ?""",
+			(quote(txt), txt, limit),
+		)
+		return [row[0] for row in rows]
+
+	def _search_fuzzy(self, conn, txt):
+		trigrams = get_trigrams(txt)
+		rows = conn.execute(
+			f"""SELECT name, title FROM "{self.table}" WHERE "{self.table}" MATCH ?
+			ORDER BY rank LIMIT ?""",
+			(" OR ".join(quote(trigram) for trigram in trigrams), FUZZY_CANDIDATES),
+		)
+
+		scored = []
+		for name, title in rows:
+			similarity = max(
+				len(trigrams & get_trigrams(value.casefold())) / len(trigrams) for value in (name, title)
+			)
+			if similarity >= MIN_FUZZY_SIMILARITY:
+				scored.append((-similarity, len(name), name))
+
+		return [name for _similarity, _length, name in sorted(scored)]
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+	conn.execute("BEGIN IMMEDIATE")
+	try:
+		yield
+	except BaseException:
+		conn.execute("ROLLBACK")
+		raise
+	conn.execute("COMMIT")
+
+
+def quote(txt: str) -> str:
+	return '"' + txt.replace('"', '""') + '"'
+
+
+def get_trigrams(txt: str) -> set[str]:
+	return {txt[i : i + 3] for i in range(len(txt) - 2)}
+
+
+def update_link_search_index(doc, method=None):
+	if doc.doctype not in get_indexed_doctypes():
+		return
+
+	if any(doc.has_value_changed(field) for field in LinkSearchIndex(doc.doctype).fields):
+		queue_link_search_change(doc.doctype, doc.name)
+
+
+def rename_in_link_search_index(doc, method=None, old=None, new=None, merge=False):
+	if doc.doctype in get_indexed_doctypes():
+		queue_link_search_change(doc.doctype, old, new)
+
+
+def remove_from_link_search_index(doc, method=None):
+	if doc.doctype in get_indexed_doctypes():
+		queue_link_search_change(doc.doctype, doc.name)
+
+
+def queue_link_search_change(doctype: str, *names: str):
+	"""Update index entries of documents once the transaction changing them is committed."""
+	if getattr(frappe.local, "link_search_changes", None) is None:
+		frappe.local.link_search_changes = defaultdict(set)
+		frappe.db.after_commit.add(flush_link_search_changes)
+		frappe.db.after_rollback.add(discard_link_search_changes)
+
+	frappe.local.link_search_changes[doctype].update(names)
+
+
+def flush_link_search_changes():
+	changes = getattr(frappe.local, "link_search_changes", None)
+	frappe.local.link_search_changes = None
+	if changes:
+		apply_link_search_changes(changes)
+
+
+def discard_link_search_changes():
+	frappe.local.link_search_changes = None
+
+
+def apply_link_search_changes(changes: dict[str, set[str]]) -> bool:
+	"""Update index entries of documents from the database, queue them to be retried if that fails.
+
+	Return False if any of the updates failed."""
+	applied = True
+	for doctype, names in changes.items():
+		for batch in frappe.utils.create_batch(sorted(names), BUILD_BATCH_SIZE):
+			try:
+				LinkSearchIndex(doctype).sync(batch)
+			except sqlite3.Error:
+				frappe.log_error(title=f"Link Search Index Update Error for {doctype}")
+				frappe.cache.sadd(PENDING_CHANGES, *(json.dumps([doctype, name]) for name in batch))
+				applied = False
+	return applied
+
+
+def sync_link_search_changes():
+	"""Retry index updates that failed.
+
+	This function is meant to be called from scheduler"""
+	while pending := frappe.cache.spop(PENDING_CHANGES, BUILD_BATCH_SIZE):
+		changes = defaultdict(set)
+		for change in pending:
+			doctype, name = json.loads(change)
+			changes[doctype].add(name)
+
+		if not apply_link_search_changes(changes):
+			# failed again, left for the next run
+			return
+
+
+def build_link_search_indexes(force: bool = False):
+	"""Build link search indexes of indexed doctypes, only missing ones unless `force` is set."""
+	for doctype in sorted(get_indexed_doctypes()):
+		if not frappe.db.exists("DocType", doctype):
+			continue
+
+		index = LinkSearchIndex(doctype)
+		if force or not index.exists():
+			index.build()
+
+
+def build_link_search_indexes_in_background():
+	if not get_indexed_doctypes():
+		return
+
+	frappe.enqueue(
+		"frappe.search.link_search.build_link_search_indexes",
+		queue="long",
+		job_id="build_link_search_indexes",
+		deduplicate=True,
+		force=True,
+	)
@@ -75,6 +75,12 @@ RECENT_WEEK_BOOST = 1.5  # Documents from last 7 days
 RECENT_MONTH_BOOST = 1.2  # Documents from last 30 days
 RECENT_QUARTER_BOOST = 1.1  # Documents from last 90 days
 
+# Incremental Sync Constants
+SYNC_BATCH_SIZE = 500  # Changed documents applied in one transaction
+SYNC_MERGE_PAGES = 500  # Pages written by an incremental FTS segment merge after a sync
+DELETED_DOCUMENTS_SOURCE = "Deleted Document"  # Sync state key for the deletion feed
+QUERY_LATENCY_SAMPLES = 1000  # Recent query durations kept for latency stats
+
 
 class SQLiteSearch(ABC):
 	"""
@@ -103,6 +109,10 @@ class SQLiteSearch(ABC):
 		func._is_scoring_function = True
 		return func
 
+	# When set, document changes are applied by the scheduled `sync_index` in batches instead of
+	# reindexing each document as it is saved
+	INCREMENTAL_SYNC = False
+
 	def __init__(self, db_name=None):
 		# Use class-level INDEX_NAME if db_name not provided
 		if db_name is None:
@@ -276,6 +286,7 @@ class SQLiteSearch(ABC):
 		processed_results = self._process_search_results(raw_results, query)
 
 		duration = time.time() - start_time
+		self._record_query_latency(duration)
 
 		return {
 			"results": processed_results,
@@ -315,6 +326,8 @@ class SQLiteSearch(ABC):
 
 			self._update_progress("Fetching records", 20, 100, absolute=True)
 
+			# documents changed while building are picked up by the next incremental sync
+			build_started_at = frappe.utils.now()
 			records = self.get_documents()
 			documents = []
 
@@ -340,6 +353,10 @@ class SQLiteSearch(ABC):
 			# Build vocabulary for spelling correction
 			self._build_vocabulary(documents)
 
+			self._set_sync_state(
+				{source: (build_started_at, "") for source in [*self.doc_configs, DELETED_DOCUMENTS_SOURCE]}
+			)
+
 			# Atomic replacement: move temp database to final location
 			if os.path.exists(original_db_path):
 				os.unlink(original_db_path)
@@ -787,15 +804,27 @@ class SQLiteSearch(ABC):
 
 	def _build_vocabulary(self, documents):
 		"""Build vocabulary and trigram index from documents for spelling correction."""
-		import re
+		word_freq = self._get_word_frequencies(documents, show_progress=True)
+
+		# Clear existing data and insert vocabulary in a single transaction
+		conn = self._get_connection()
+		try:
+			cursor = conn.cursor()
+			cursor.execute("DELETE FROM search_vocabulary")
+			cursor.execute("DELETE FROM search_trigrams")
+			self._add_to_vocabulary(cursor, word_freq)
+			conn.commit()
+		finally:
+			conn.close()
 
+	def _get_word_frequencies(self, documents, show_progress=False):
 		word_freq = defaultdict(int)
 		word_regex = re.compile(r"\w+")  # Compile regex once for efficiency
 
 		# Extract words from all documents in batches
 		for i, doc in enumerate(documents):
 			# Show progress for large document sets
-			if i % 1000 == 0:
+			if show_progress and i % 1000 == 0:
 				progress = 80 + int((i / len(documents)) * 15)  # 80-95% range
 				self._update_progress(
 					f"Processing vocabulary ({i}/{len(documents)})", progress, 100, absolute=True
@@ -813,16 +842,10 @@ class SQLiteSearch(ABC):
 				if len(word) > MIN_WORD_LENGTH - 1 and word.isalpha():  # Filter out short words and non-alpha
 					word_freq[word] += 1
 
-		# Clear existing data in a single transaction
-		conn = self._get_connection()
-		try:
-			cursor = conn.cursor()
-			cursor.execute("DELETE FROM search_vocabulary")
-			cursor.execute("DELETE FROM search_trigrams")
-			conn.commit()
-		finally:
-			conn.close()
+		return word_freq
 
+	def _add_to_vocabulary(self, cursor, word_freq):
+		"""Add word frequencies to vocabulary and trigram index, without committing."""
 		if not word_freq:
 			return
 
@@ -842,24 +865,44 @@ class SQLiteSearch(ABC):
 					trigram_set.add(trigram_key)
 					trigram_data.append(trigram_key)
 
-		# Use batch inserts with a single transaction
-		conn = self._get_connection()
-		try:
-			cursor = conn.cursor()
+		# Batch insert vocabulary
+		cursor.executemany(
+			"""INSERT INTO search_vocabulary (word, frequency, length) VALUES (?, ?, ?)
+			ON CONFLICT(word) DO UPDATE SET frequency = frequency + excluded.frequency""",
+			vocab_data,
+		)
 
-			# Batch insert vocabulary
-			cursor.executemany(
-				"INSERT INTO search_vocabulary (word, frequency, length) VALUES (?, ?, ?)", vocab_data
-			)
+		# Batch insert trigrams
+		cursor.executemany(
+			"INSERT OR IGNORE INTO search_trigrams (trigram, word) VALUES (?, ?)", trigram_data
+		)
 
-			# Batch insert trigrams (duplicates already removed)
-			cursor.executemany("INSERT INTO search_trigrams (trigram, word) VALUES (?, ?)", trigram_data)
+	def _remove_from_vocabulary(self, cursor, word_freq):
+		"""Subtract word frequencies of removed documents, dropping words no document has anymore."""
+		if not word_freq:
+			return
 
-			conn.commit()
-		finally:
-			conn.close()
+		cursor.executemany(
+			"UPDATE search_vocabulary SET frequency = frequency - ? WHERE word = ?",
+			[(freq, word) for word, freq in word_freq.items()],
+		)
 
-	# Database and Infrastructure Methods
+		words = list(word_freq)
+		for i in range(0, len(words), SYNC_BATCH_SIZE):
+			chunk = words[i : i + SYNC_BATCH_SIZE]
+			unused = [
+				r[0]
+				for r in cursor.execute(
+					f"""SELECT word FROM search_vocabulary
+					WHERE frequency <= 0 AND word IN ({",".join("?" * len(chunk))})""",
+					chunk,
+				).fetchall()
+			]
+			cursor.executemany("DELETE FROM search_vocabulary WHERE word = ?", [(word,) for word in unused])
+			cursor.executemany(
+				"DELETE FROM search_trigrams WHERE trigram = ? AND word = ?",
+				[(trigram, word) for word in unused for trigram in set(self._generate_trigrams(word))],
+			)
 
 	def _get_connection(self, read_only=False):
 		"""Get SQLite connection with FTS5 support and performance optimizations."""
@@ -884,6 +927,7 @@ class SQLiteSearch(ABC):
 		cursor.execute("PRAGMA synchronous = NORMAL;")  # Better performance vs FULL
 		cursor.execute("PRAGMA cache_size = -8192;")  # 8MB cache
 		cursor.execute("PRAGMA temp_store = MEMORY;")  # Memory temp storage
+		cursor.execute("PRAGMA busy_timeout = 5000;")  # Wait for a concurrent writer instead of failing
 		if is_read:
 			cursor.execute("PRAGMA query_only = 1;")  # Read-only optimization
 
@@ -931,6 +975,24 @@ class SQLiteSearch(ABC):
                 CREATE INDEX IF NOT EXISTS idx_trigram_lookup ON search_trigrams(trigram)
             """)
 
+			# FTS rowid of each document, FTS5 can't look up rows by an UNINDEXED column efficiently
+			cursor.execute("""
+                CREATE TABLE IF NOT EXISTS search_documents (
+                    doc_id TEXT PRIMARY KEY,
+                    fts_rowid INTEGER
+                )
+            """)
+
+			# High-water mark (modified, name) of changes applied per doctype
+			cursor.execute("""
+                CREATE TABLE IF NOT EXISTS search_sync_state (
+                    source TEXT PRIMARY KEY,
+                    modified TEXT,
+                    name TEXT,
+                    synced_at REAL
+                )
+            """)
+
 			conn.commit()
 		finally:
 			conn.close()
@@ -940,6 +1002,15 @@ class SQLiteSearch(ABC):
 		if not documents:
 			return
 
+		conn = self._get_connection()
+		try:
+			self._insert_documents(conn.cursor(), documents)
+			conn.commit()
+		finally:
+			conn.close()
+
+	def _insert_documents(self, cursor, documents):
+		"""Insert documents into FTS and record their rowids, without committing."""
 		# Get schema configuration to build dynamic insert SQL
 		text_fields = self.schema["text_fields"]
 		metadata_fields = self.schema["metadata_fields"]
@@ -954,67 +1025,303 @@ class SQLiteSearch(ABC):
             VALUES ({placeholders})
         """
 
+		last_rowid = cursor.execute("SELECT COALESCE(MAX(rowid), 0) FROM search_fts").fetchone()[0]
+
 		# Process documents in chunks to prevent memory issues with large datasets
 		chunk_size = 1000
-		conn = self._get_connection()
-		try:
-			cursor = conn.cursor()
+		for i in range(0, len(documents), chunk_size):
+			chunk = documents[i : i + chunk_size]
+			values_to_insert = []
+
+			for doc in chunk:
+				# Validate document has required fields
+				if not doc.get("doctype") or not doc.get("name"):
+					self._warn_invalid_document(doc, "missing doctype/name")
+					continue
 
-			for i in range(0, len(documents), chunk_size):
-				chunk = documents[i : i + chunk_size]
-				values_to_insert = []
-
-				for doc in chunk:
-					# Validate document has required fields
-					if not doc.get("doctype") or not doc.get("name"):
-						self._warn_invalid_document(doc, "missing doctype/name")
-						continue
-
-					# Validate text fields are present
-					missing_text_fields = []
-					for field in text_fields:
-						if field not in doc or doc[field] is None:
-							missing_text_fields.append(field)
-
-					if missing_text_fields:
-						self._warn_missing_text_fields(
-							doc.get("doctype", ""), doc.get("name", ""), missing_text_fields
-						)
-						continue
+				# Validate text fields are present
+				missing_text_fields = []
+				for field in text_fields:
+					if field not in doc or doc[field] is None:
+						missing_text_fields.append(field)
 
-					# Build values tuple dynamically based on schema
-					values = []
-					for field in all_fields:
-						# Build doc_id automatically from doctype:name
-						if field == "doc_id":
-							doc_id = doc.get("id") or f"{doc.get('doctype', '')}:{doc.get('name', '')}"
-							values.append(doc_id)
-						else:
-							values.append(doc.get(field, ""))
+				if missing_text_fields:
+					self._warn_missing_text_fields(
+						doc.get("doctype", ""), doc.get("name", ""), missing_text_fields
+					)
+					continue
 
-					values_to_insert.append(tuple(values))
+				# Build values tuple dynamically based on schema
+				values = []
+				for field in all_fields:
+					# Build doc_id automatically from doctype:name
+					if field == "doc_id":
+						doc_id = doc.get("id") or f"{doc.get('doctype', '')}:{doc.get('name', '')}"
+						values.append(doc_id)
+					else:
+						values.append(doc.get(field, ""))
+
+				values_to_insert.append(tuple(values))
 
-				# Insert the chunk
-				if values_to_insert:
-					cursor.executemany(insert_sql, values_to_insert)
+			# Insert the chunk
+			if values_to_insert:
+				cursor.executemany(insert_sql, values_to_insert)
 
+		# rowids of FTS5 rows grow monotonically
+		cursor.execute(
+			"""INSERT OR REPLACE INTO search_documents (doc_id, fts_rowid)
+			SELECT doc_id, rowid FROM search_fts WHERE rowid > ?""",
+			(last_rowid,),
+		)
+
+	def _delete_documents(self, cursor, doc_ids):
+		"""Delete documents from FTS by their rowids and their words from the vocabulary, without
+		committing."""
+		for i in range(0, len(doc_ids), SYNC_BATCH_SIZE):
+			chunk = doc_ids[i : i + SYNC_BATCH_SIZE]
+			placeholders = ",".join("?" * len(chunk))
+			rowids = [
+				r[0]
+				for r in cursor.execute(
+					f"SELECT fts_rowid FROM search_documents WHERE doc_id IN ({placeholders})", chunk
+				).fetchall()
+			]
+			if rowids:
+				documents = cursor.execute(
+					f"SELECT * FROM search_fts WHERE rowid IN ({','.join('?' * len(rowids))})", rowids
+				).fetchall()
+				self._remove_from_vocabulary(cursor, self._get_word_frequencies([dict(d) for d in documents]))
+			cursor.executemany("DELETE FROM search_fts WHERE rowid = ?", [(rowid,) for rowid in rowids])
+			cursor.execute(f"DELETE FROM search_documents WHERE doc_id IN ({placeholders})", chunk)
+
+	def _apply_changes(self, doc_ids, documents, sync_state=None):
+		"""Replace given documents in the index in a single transaction.
+
+		:param doc_ids: ids of documents to remove, changed ones are inserted again from `documents`.
+		:param documents: prepared documents to index.
+		:param sync_state: high-water marks to record along with the changes.
+		"""
+		conn = self._get_connection()
+		try:
+			cursor = conn.cursor()
+			self._delete_documents(cursor, doc_ids)
+			if documents:
+				self._insert_documents(cursor, documents)
+				self._add_to_vocabulary(cursor, self._get_word_frequencies(documents))
+			if sync_state:
+				self._write_sync_state(cursor, sync_state)
 			conn.commit()
 		finally:
 			conn.close()
 
 	def index_doc(self, doctype, docname):
-		"""Index a single document."""
+		"""Index a single document, replacing its existing entry."""
 		doc = frappe.get_doc(doctype, docname)
 		self.raise_if_not_indexed()
 		document = self.prepare_document(doc)
-		if document:
-			self._index_documents([document])
+		self._apply_changes([f"{doctype}:{docname}"], [document] if document else [])
 
 	def remove_doc(self, doctype, docname):
 		"""Remove a single document from the index."""
 		self.raise_if_not_indexed()
-		doc_id = f"{doctype}:{docname}"
-		self.sql("DELETE FROM search_fts WHERE doc_id = ?", (doc_id,), commit=True)
+		self._apply_changes([f"{doctype}:{docname}"], [])
+
+	# Incremental Sync
+
+	def sync_index(self, batch_size=SYNC_BATCH_SIZE):
+		"""Apply documents changed or deleted since the last build or sync to the index.
+
+		Changes are read in order of (modified, name) after the high-water mark stored for each doctype
+		and applied in batches, each batch and its new high-water mark in one SQLite transaction.
+		Deletions are read from Deleted Document. Readers keep using the index meanwhile (WAL mode).
+
+		Returns:
+		    int: number of documents updated or removed
+		"""
+		if not (self.is_search_enabled() and self.index_exists()):
+			return 0
+
+		self._ensure_fts_table()
+		self._populate_document_rowids()
+		sync_state = self.get_sync_state()
+		changes = 0
+
+		# deletions first, a document deleted and created again is then indexed by the change feed
+		while deleted := self.get_deleted_documents(sync_state.get(DELETED_DOCUMENTS_SOURCE), batch_size):
+			last = deleted[-1]
+			sync_state[DELETED_DOCUMENTS_SOURCE] = (str(last.creation), last.name)
+			self._apply_changes(
+				[f"{d.deleted_doctype}:{d.deleted_name}" for d in deleted],
+				[],
+				{DELETED_DOCUMENTS_SOURCE: sync_state[DELETED_DOCUMENTS_SOURCE]},
+			)
+			changes += len(deleted)
+
+		for doctype in self.doc_configs:
+			while changed := self.get_changed_names(doctype, sync_state.get(doctype), batch_size):
+				last = changed[-1]
+				sync_state[doctype] = (str(last.modified), last.name)
+
+				# changed documents which don't match filters anymore are only removed
+				documents = [
+					document
+					for doc in self.get_changed_documents(doctype, [d.name for d in changed])
+					if (document := self.prepare_document(doc))
+				]
+				self._apply_changes(
+					[f"{doctype}:{d.name}" for d in changed], documents, {doctype: sync_state[doctype]}
+				)
+				changes += len(changed)
+
+		if changes:
+			self.merge_segments()
+
+		return changes
+
+	def get_changed_names(self, doctype, high_water_mark, limit):
+		"""Return names and modified timestamps of documents changed after `high_water_mark`."""
+		table = frappe.qb.DocType(doctype)
+		query = (
+			frappe.qb.from_(table)
+			.select(table.name, table.modified)
+			.orderby(table.modified)
+			.orderby(table.name)
+			.limit(limit)
+		)
+		if high_water_mark:
+			modified, name = high_water_mark
+			query = query.where(
+				(table.modified > modified) | ((table.modified == modified) & (table.name > name))
+			)
+
+		return query.run(as_dict=True)
+
+	def get_changed_documents(self, doctype, names):
+		"""Return records of given names to be indexed, like `get_documents` does for all records."""
+		config = self.doc_configs[doctype]
+		query = frappe.qb.get_query(doctype, fields=config["fields"], filters=config.get("filters", {}))
+		table = frappe.qb.DocType(doctype)
+		docs = query.where(table.name.isin(names)).run(as_dict=True)
+
+		for doc in docs:
+			doc.doctype = doctype
+			if config["modified_field"] != "modified":
+				doc.modified = getattr(doc, config["modified_field"], None) or doc.modified
+
+		return docs
+
+	def get_deleted_documents(self, high_water_mark, limit):
+		"""Return Deleted Documents of indexed doctypes created after `high_water_mark`."""
+		table = frappe.qb.DocType("Deleted Document")
+		query = (
+			frappe.qb.from_(table)
+			.select(table.name, table.creation, table.deleted_doctype, table.deleted_name)
+			.where(table.deleted_doctype.isin(list(self.doc_configs)))
+			.orderby(table.creation)
+			.orderby(table.name)
+			.limit(limit)
+		)
+		if high_water_mark:
+			creation, name = high_water_mark
+			query = query.where(
+				(table.creation > creation) | ((table.creation == creation) & (table.name > name))
+			)
+
+		return query.run(as_dict=True)
+
+	def get_sync_state(self):
+		"""Return high-water marks `{source: (modified, name)}` of applied changes."""
+		rows = self.sql("SELECT source, modified, name FROM search_sync_state", read_only=True)
+		return {row["source"]: (row["modified"], row["name"]) for row in rows}
+
+	def _set_sync_state(self, sync_state):
+		conn = self._get_connection()
+		try:
+			self._write_sync_state(conn.cursor(), sync_state)
+			conn.commit()
+		finally:
+			conn.close()
+
+	def _write_sync_state(self, cursor, sync_state):
+		now = time.time()
+		cursor.executemany(
+			"""INSERT INTO search_sync_state (source, modified, name, synced_at) VALUES (?, ?, ?, ?)
+			ON CONFLICT(source) DO UPDATE SET
+				modified = excluded.modified, name = excluded.name, synced_at = excluded.synced_at""",
+			[(source, modified, name, now) for source, (modified, name) in sync_state.items()],
+		)
+
+	def _populate_document_rowids(self):
+		"""Fill rowids of documents indexed before they were tracked, once."""
+		conn = self._get_connection()
+		try:
+			cursor = conn.cursor()
+			if cursor.execute("SELECT 1 FROM search_documents LIMIT 1").fetchone():
+				return
+			cursor.execute("INSERT OR REPLACE INTO search_documents SELECT doc_id, rowid FROM search_fts")
+			conn.commit()
+		finally:
+			conn.close()
+
+	def merge_segments(self, pages=SYNC_MERGE_PAGES):
+		"""Do a limited amount of FTS segment merging, keeps queries fast between full optimizations."""
+		self.sql("INSERT INTO search_fts (search_fts, rank) VALUES ('merge', ?)", (pages,), commit=True)
+
+	def optimize_index(self):
+		"""Merge all FTS segments into one. Expensive, meant for background jobs."""
+		if self.is_search_enabled() and self.index_exists():
+			self.sql("INSERT INTO search_fts (search_fts) VALUES ('optimize')", commit=True)
+
+	def get_index_stats(self):
+		"""Return index freshness per doctype and latency of recent queries.
+
+		`lag` is the age in seconds of the oldest change not yet applied to the index."""
+		self.raise_if_not_indexed()
+
+		rows = self.sql("SELECT source, modified, name, synced_at FROM search_sync_state", read_only=True)
+		sync_state = {row["source"]: row for row in rows}
+
+		freshness = {}
+		now = frappe.utils.now_datetime()
+		for doctype in self.doc_configs:
+			state = sync_state.get(doctype)
+			oldest_pending = None
+			if state:
+				pending = self.get_changed_names(doctype, (state["modified"], state["name"]), 1)
+				oldest_pending = pending[0].modified if pending else None
+
+			freshness[doctype] = {
+				"synced_until": state["modified"] if state else None,
+				"synced_at": state["synced_at"] if state else None,
+				"lag": (now - oldest_pending).total_seconds() if oldest_pending else 0,
+			}
+
+		durations = sorted(
+			float(d) for d in frappe.cache.lrange(self._get_latency_key(), 0, QUERY_LATENCY_SAMPLES - 1)
+		)
+
+		def percentile(p):
+			if durations:
+				return round(durations[min(int(len(durations) * p), len(durations) - 1)], 4)
+
+		documents = self.sql("SELECT COUNT(*) AS count FROM search_documents", read_only=True)
+		return {
+			"documents": documents[0]["count"],
+			"freshness": freshness,
+			"query_latency": {"samples": len(durations), "p50": percentile(0.5), "p95": percentile(0.95)},
+		}
+
+	def _get_latency_key(self):
+		return f"sqlite_search_latency:{self.db_name}"
+
+	def _record_query_latency(self, duration):
+		key = self._get_latency_key()
+		try:
+			frappe.cache.lpush(key, duration)
+			frappe.cache.ltrim(key, 0, QUERY_LATENCY_SAMPLES - 1)
+		except Exception:
+			# latency stats are best effort, searching must not fail because of them
+			pass
 
 	# Utility Methods
 
@@ -1386,6 +1693,24 @@ def build_index(
 		search.build_index()
 
 
+def sync_indexes():
+	"""Apply pending document changes to indexes of search classes with `INCREMENTAL_SYNC`."""
+	for SearchClass in get_search_classes():
+		if not SearchClass.INCREMENTAL_SYNC:
+			continue
+
+		try:
+			SearchClass().sync_index()
+		except Exception:
+			frappe.log_error(title=f"SQLite Search Index Sync Error in {SearchClass.__name__}")
+
+
+def optimize_indexes():
+	"""Merge FTS segments of all search indexes."""
+	for SearchClass in get_search_classes():
+		SearchClass().optimize_index()
+
+
 def build_index_in_background():
 	"""Enqueue index building in background."""
 	search_classes = get_search_classes()
@@ -1410,6 +1735,10 @@ def update_doc_index(doc: Document, method=None):
 	search_classes = get_search_classes()
 
 	for SearchClass in search_classes:
+		if SearchClass.INCREMENTAL_SYNC:
+			# picked up by the next `sync_indexes`
+			continue
+
 		search = SearchClass()
 
 		if not (search.is_search_enabled() and search.index_exists()):
@@ -5,13 +5,23 @@ Boot session from cache or build
 
 Session bootstraps info needed by common client side activities including
 permission, homepage, default variables, system defaults etc
+
+Sessions are read from the `session` cache, falling back to `tabSessions`. Workers keep sessions they
+read in memory for `LOCAL_SESSION_TTL` seconds, changes and logouts are published to other workers
+through Redis (see `ClientCache.erase_session_cache`) so that they drop their copy. Activity of a
+session is saved in cache as it happens, and written to `tabSessions` and `User.last_active` for many
+sessions at once by `flush_session_updates`.
 """
 
+import copy
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from urllib.parse import unquote
 
 import redis
+from werkzeug.wrappers import Response
 
 import frappe
 import frappe.defaults
@@ -26,6 +36,18 @@ from frappe.utils import cint, cstr, get_assets_json
 from frappe.utils.change_log import has_app_update_notifications
 from frappe.utils.data import add_to_date
 
+LOCAL_SESSION_TTL = 30  # seconds
+MAX_LOCAL_SESSIONS = 4096
+# Activity is saved at most this often per session
+SESSION_UPDATE_INTERVAL = 600  # seconds
+# Set of sessions with activity that isn't written to the database yet
+PENDING_SESSION_UPDATES = "pending_session_updates"
+SESSION_BATCH_SIZE = 500
+
+# (site, sid) -> (expiry, session)
+_local_sessions: dict[tuple[str, str], tuple[float, frappe._dict]] = {}
+_local_sessions_lock = threading.Lock()
+
 
 @frappe.whitelist()
 def clear():
@@ -98,7 +120,7 @@ def delete_session(sid=None, user=None, reason="Session Expired"):
 	frappe.db.delete("Sessions", {"sid": sid})
 	frappe.db.commit(chain=True)
 
-	frappe.cache.hdel("session", sid)
+	uncache_session(sid)
 
 
 def clear_all_sessions(reason=None):
@@ -110,24 +132,131 @@ def clear_all_sessions(reason=None):
 		delete_session(sid, reason=reason)
 
 
-def get_expired_sessions():
+def get_expired_sessions(limit: int | None = None, pluck: str | None = "sid") -> list:
 	"""Return list of expired sessions."""
 
 	sessions = frappe.qb.DocType("Sessions")
-	return (
-		frappe.qb.from_(sessions).select(sessions.sid).where(sessions.lastupdate < get_expired_threshold())
-	).run(pluck=True)
+	query = (
+		frappe.qb.from_(sessions)
+		.select(sessions.sid, sessions.user)
+		.where(sessions.lastupdate < get_expired_threshold())
+	)
+	if limit:
+		query = query.limit(limit)
+	return query.run(pluck=pluck, as_dict=not pluck)
 
 
 def clear_expired_sessions():
 	"""This function is meant to be called from scheduler"""
-	for sid in get_expired_sessions():
-		delete_session(sid, reason="Session Expired")
+	from frappe.core.doctype.activity_log.feed import logout_feed
+
+	if frappe.flags.read_only:
+		return
+
+	# activity saved only in cache would be missed otherwise
+	flush_session_updates()
+
+	# expired sessions are found through the index on `lastupdate` and removed in batches
+	while sessions := get_expired_sessions(limit=SESSION_BATCH_SIZE, pluck=None):
+		for session in sessions:
+			logout_feed(session.user, "Session Expired")
+
+		sids = [session.sid for session in sessions]
+		frappe.db.delete("Sessions", {"sid": ("in", sids)})
+		frappe.db.commit()
+		for sid in sids:
+			uncache_session(sid)
+
+
+def flush_session_updates():
+	"""Write activity of sessions saved in cache by `Session.update` to the database.
+
+	This function is meant to be called from scheduler"""
+	if frappe.flags.read_only:
+		return
+
+	Sessions = frappe.qb.DocType("Sessions")
+	while sids := frappe.cache.spop(PENDING_SESSION_UPDATES, SESSION_BATCH_SIZE):
+		last_active = {}
+		for sid in sids:
+			session = frappe.cache.hget("session", frappe.safe_decode(sid))
+			if not session:
+				# logged out since
+				continue
+
+			session_data = session["data"]
+			last_updated = frappe.utils.get_datetime(session_data.last_updated)
+			(
+				frappe.qb.update(Sessions)
+				.where(Sessions.sid == session["sid"])
+				.set(Sessions.sessiondata, frappe.as_json(session_data, indent=None, separators=(",", ":")))
+				.set(Sessions.lastupdate, last_updated)
+			).run()
+			last_active[session["user"]] = max(last_updated, last_active.get(session["user"], last_updated))
+
+		frappe.db.bulk_update(
+			"User",
+			{user: {"last_active": value} for user, value in last_active.items()},
+			update_modified=False,
+		)
+		frappe.db.commit()
+		# sessions are only needed while flushing
+		frappe.local.cache.pop(frappe.cache.make_key("session"), None)
+
+
+def get_cached_session(sid: str) -> frappe._dict | None:
+	"""Return session `sid` from cache, from memory of this worker if it was read in the last
+	`LOCAL_SESSION_TTL` seconds."""
+	key = (frappe.local.site, sid)
+	if (cached := _local_sessions.get(key)) and time.monotonic() < cached[0]:
+		return copy.deepcopy(cached[1])
+
+	session = frappe.cache.hget("session", sid)
+	if session:
+		session = frappe._dict(copy.deepcopy(session))
+		keep_local_session(sid, session)
+	return session
+
+
+def cache_session(sid: str, session: frappe._dict):
+	frappe.cache.hset("session", sid, session)
+	frappe.client_cache.erase_session_cache(sid)
+	keep_local_session(sid, session)
+
+
+def uncache_session(sid: str):
+	frappe.cache.hdel("session", sid)
+	frappe.cache.srem(PENDING_SESSION_UPDATES, sid)
+	frappe.client_cache.erase_session_cache(sid)
+	drop_local_sessions(sid)
+
+
+def keep_local_session(sid: str, session: frappe._dict):
+	if not frappe.client_cache.healthy:
+		# changes made by other workers wouldn't be noticed
+		return
+
+	with _local_sessions_lock:
+		if len(_local_sessions) >= MAX_LOCAL_SESSIONS:
+			_local_sessions.pop(next(iter(_local_sessions)), None)
+		_local_sessions[(frappe.local.site, sid)] = (
+			time.monotonic() + LOCAL_SESSION_TTL,
+			copy.deepcopy(session),
+		)
+
+
+def drop_local_sessions(sid: str | None = None, site: str | None = None):
+	"""Drop session `sid`, or all sessions, kept in memory of this worker."""
+	with _local_sessions_lock:
+		if sid is None:
+			_local_sessions.clear()
+		else:
+			_local_sessions.pop((site or frappe.local.site, sid), None)
 
 
 def get():
 	"""get session boot info"""
-	from frappe.boot import get_bootinfo
+	from frappe.boot import get_bootinfo, get_shared_bootinfo, strip_shared_bootinfo
 	from frappe.desk.doctype.note.note import get_unseen_notes
 	from frappe.utils.change_log import get_change_log
 
@@ -136,13 +265,18 @@ def get():
 		# check if cache exists
 		bootinfo = frappe.cache.hget("bootinfo", frappe.session.user)
 		if bootinfo:
+			# cached boot only has what differs from shared boot data
+			frappe.set_user_lang(frappe.session.user)
+			bootinfo = frappe._dict(copy.deepcopy(get_shared_bootinfo().data), **bootinfo)
 			bootinfo["from_cache"] = 1
 			bootinfo["user"]["recent"] = json.dumps(frappe.cache.hget("user_recent", frappe.session.user))
 
 	if not bootinfo:
 		# if not create it
 		bootinfo = get_bootinfo()
-		frappe.cache.hset("bootinfo", frappe.session.user, bootinfo)
+		frappe.cache.hset(
+			"bootinfo", frappe.session.user, strip_shared_bootinfo(bootinfo, get_shared_bootinfo().data)
+		)
 		try:
 			frappe.cache.ping()
 		except redis.exceptions.ConnectionError:
@@ -191,6 +325,30 @@ def get_boot_assets_json():
 	return get_assets_json()
 
 
+@frappe.whitelist(methods=["GET"])
+def get_shared_boot():
+	"""Return a script adding boot data shared with users of the same language and roles to `frappe.boot`.
+
+	The desk loads it separately from the rest of the boot, browsers revalidate it by its version."""
+	from frappe.boot import get_shared_bootinfo
+	from frappe.utils.data import orjson_dumps
+	from frappe.utils.response import json_handler
+
+	frappe.set_user_lang(frappe.session.user)
+	shared = get_shared_bootinfo()
+
+	if frappe.request.if_none_match.contains(shared.version):
+		response = Response(status=304)
+	else:
+		data = orjson_dumps(shared.data, default=json_handler)
+		# values in the boot built for the user take precedence
+		response = Response(f"frappe.boot = Object.assign({data}, frappe.boot);", mimetype="text/javascript")
+
+	response.set_etag(shared.version)
+	response.headers["Cache-Control"] = "private, no-cache"
+	return response
+
+
 def get_csrf_token():
 	if not frappe.local.session.data.csrf_token:
 		generate_csrf_token()
@@ -313,7 +471,7 @@ class Session:
 				)
 			)
 		).run()
-		frappe.cache.hset("session", self.data.sid, self.data)
+		cache_session(self.data.sid, self.data)
 
 	def resume(self):
 		"""non-login request: load a session"""
@@ -357,9 +515,8 @@ class Session:
 		return data
 
 	def get_session_data_from_cache(self):
-		data = frappe.cache.hget("session", self.sid)
+		data = get_cached_session(self.sid)
 		if data:
-			data = frappe._dict(data)
 			session_data = data.get("data", {})
 
 			# set user for correct timezone
@@ -412,38 +569,44 @@ class Session:
 
 		now = frappe.utils.now_datetime()
 
-		# update session in db
 		last_updated = self.data.data.last_updated
 		time_diff = frappe.utils.time_diff_in_seconds(now, last_updated) if last_updated else None
 
-		# database persistence is secondary, don't update it too often
-		updated_in_db = False
-		if (
-			force or (time_diff is None) or (time_diff > 600) or self._update_in_cache
-		) and not frappe.flags.read_only:
-			self.data.data.last_updated = now
-			self.data.data.lang = str(frappe.lang)
-			self.data.data.session_ip = frappe.local.request_ip
-
-			Sessions = frappe.qb.DocType("Sessions")
-			# update sessions table
-			(
-				frappe.qb.update(Sessions)
-				.where(Sessions.sid == self.data["sid"])
-				.set(
-					Sessions.sessiondata,
-					frappe.as_json(self.data["data"], indent=None, separators=(",", ":")),
-				)
-				.set(Sessions.lastupdate, now)
-			).run()
+		# persistence is secondary, don't update it too often
+		if frappe.flags.read_only or not (
+			force or (time_diff is None) or (time_diff > SESSION_UPDATE_INTERVAL) or self._update_in_cache
+		):
+			return False
 
-			frappe.db.set_value("User", frappe.session.user, "last_active", now, update_modified=False)
+		self.data.data.last_updated = now
+		self.data.data.lang = str(frappe.lang)
+		self.data.data.session_ip = frappe.local.request_ip
+		cache_session(self.sid, self.data)
+
+		if not force:
+			try:
+				# written to the database along with other sessions by `flush_session_updates`
+				frappe.cache.sadd(PENDING_SESSION_UPDATES, self.sid)
+				return False
+			except redis.exceptions.ConnectionError:
+				pass
+
+		Sessions = frappe.qb.DocType("Sessions")
+		# update sessions table
+		(
+			frappe.qb.update(Sessions)
+			.where(Sessions.sid == self.data["sid"])
+			.set(
+				Sessions.sessiondata,
+				frappe.as_json(self.data["data"], indent=None, separators=(",", ":")),
+			)
+			.set(Sessions.lastupdate, now)
+		).run()
 
-			frappe.db.commit(chain=True)
-			updated_in_db = True
-			frappe.cache.hset("session", self.sid, self.data)
+		frappe.db.set_value("User", frappe.session.user, "last_active", now, update_modified=False)
 
-		return updated_in_db
+		frappe.db.commit(chain=True)
+		return True
 
 	def set_impersonated(self, original_user):
 		self.data.data.impersonated_by = original_user
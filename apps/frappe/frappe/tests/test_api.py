@@ -484,6 +484,22 @@ class TestResponse(FrappeAPITestCase):
 		self.assertGreater(cint(response.headers["content-length"]), 0)
 		self.assertEqual(response.headers["content-disposition"], f'filename="{encoded_filename}"')
 
+	def test_columnar_response(self):
+		from frappe.utils.columnar import COLUMNAR_MIMETYPE
+
+		params = {"sid": self.sid, "doctype": "User", "fields": json.dumps(["name", "creation"])}
+		response = self.get(self.method("frappe.desk.reportview.get"), params)
+		self.assertEqual(response.headers["content-type"], "application/json")
+		rows = response.json["message"]["values"]
+
+		response = self.get(
+			self.method("frappe.desk.reportview.get"), params, headers={"Accept": COLUMNAR_MIMETYPE}
+		)
+		self.assertEqual(response.headers["content-type"], COLUMNAR_MIMETYPE)
+		data = response.json["message"]
+		self.assertNotIn("values", data)
+		self.assertEqual(data["columns"], [list(column) for column in zip(*rows, strict=True)])
+
 	def test_download_private_file_with_unique_url(self):
 		test_content = frappe.generate_hash()
 		file = frappe.get_doc(
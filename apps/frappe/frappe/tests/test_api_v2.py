@@ -1,3 +1,4 @@
+import json
 import typing
 from random import choice
 
@@ -78,6 +79,37 @@ class TestResourceAPIV2(FrappeAPITestCase):
 		json = frappe._dict(response.json)
 		self.assertIn("description", json.data[0])
 
+	def test_bulk_read(self):
+		response = self.post(
+			self.resource("User", "bulk"),
+			{
+				"sid": self.sid,
+				"names": ["Guest", "Administrator", "not-a-user"],
+				"fields": ["first_name"],
+				"child_fields": {"roles": ["role"]},
+			},
+		)
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.mimetype, "application/x-ndjson")
+
+		docs = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+		self.assertEqual([doc["name"] for doc in docs], ["Guest", "Administrator"])
+		self.assertEqual(docs[1]["first_name"], "Administrator")
+		self.assertNotIn("email", docs[1])
+		self.assertNotIn("block_modules", docs[1])
+		self.assertEqual(
+			{row["role"] for row in docs[1]["roles"]},
+			set(frappe.get_all("Has Role", {"parent": "Administrator", "parenttype": "User"}, pluck="role")),
+		)
+		self.assertEqual(set(docs[1]["roles"][0]), {"role"})
+
+		response = self.get(self.resource(self.DOCTYPE, "bulk"), {"sid": self.sid, "limit": 3})
+		self.assertEqual(len(response.get_data(as_text=True).splitlines()), 3)
+
+		response = self.get(self.resource(self.DOCTYPE, "bulk"), {"sid": self.sid, "fields": '["version()"]'})
+		self.assertGreaterEqual(response.status_code, 400)
+		self.assertLess(response.status_code, 500)
+
 	def test_create_document(self):
 		data = {"description": frappe.mock("paragraph"), "sid": self.sid}
 		response = self.post(self.resource(self.DOCTYPE), data)
@@ -10,7 +10,15 @@ from werkzeug.wrappers import Request
 import frappe
 from frappe.auth import LoginAttemptTracker
 from frappe.frappeclient import AuthError, FrappeClient
-from frappe.sessions import Session, get_expired_sessions, get_expiry_in_seconds
+from frappe.sessions import (
+	PENDING_SESSION_UPDATES,
+	Session,
+	drop_local_sessions,
+	flush_session_updates,
+	get_cached_session,
+	get_expired_sessions,
+	get_expiry_in_seconds,
+)
 from frappe.tests import IntegrationTestCase, UnitTestCase
 from frappe.tests.test_api import FrappeAPITestCase
 from frappe.utils import get_datetime, get_site_url, now
@@ -275,3 +283,33 @@ class TestSessionExpiry(FrappeAPITestCase):
 		with self.freeze_time(time_of_expiry):
 			self.assertIn(sid, get_expired_sessions())
 			self.assertFalse(s.get_session_data_from_db())
+
+	def test_session_activity_is_flushed(self):
+		sid = self.sid
+		s: Session = frappe.local.session_obj
+		s.data.data.last_updated = add_to_date(now(), hours=-1, as_string=True)
+
+		# saved in cache, written to the database later
+		self.assertFalse(s.update())
+		self.assertTrue(frappe.cache.sismember(PENDING_SESSION_UPDATES, sid))
+		self.assertEqual(get_cached_session(sid).data.last_updated, s.data.data.last_updated)
+
+		sessions = frappe.qb.DocType("Sessions")
+		frappe.qb.update(sessions).set(sessions.lastupdate, "2000-01-01").where(sessions.sid == sid).run()
+		flush_session_updates()
+		lastupdate = frappe.qb.from_(sessions).select(sessions.lastupdate).where(sessions.sid == sid).run()
+		self.assertEqual(get_datetime(lastupdate[0][0]), get_datetime(s.data.data.last_updated))
+		self.assertFalse(frappe.cache.sismember(PENDING_SESSION_UPDATES, sid))
+
+	def test_local_session_cache(self):
+		sid = self.sid
+		self.assertTrue(get_cached_session(sid))
+
+		frappe.cache.hdel("session", sid)
+		frappe.local.cache.clear()
+		if frappe.client_cache.healthy:
+			# kept by this worker until it's told about the change
+			self.assertTrue(get_cached_session(sid))
+
+		drop_local_sessions(sid)
+		self.assertIsNone(get_cached_session(sid))
@@ -11,9 +11,12 @@ from frappe.tests import IntegrationTestCase
 from frappe.utils.background_jobs import (
 	RQ_JOB_FAILURE_TTL,
 	RQ_RESULTS_TTL,
+	add_to_coalesced_job,
+	claim_coalesced_job,
 	create_job_id,
 	execute_job,
 	generate_qname,
+	get_coalesce_key,
 	get_redis_conn,
 )
 
@@ -75,6 +78,58 @@ class TestBackgroundJobs(IntegrationTestCase):
 			self.assertEqual(r, "pong")
 			self.assertLess(_test_JOB_HOOK.get("before_job"), _test_JOB_HOOK.get("after_job"))
 
+	def test_warm_contexts_reuse_connection(self):
+		from frappe.utils import background_jobs
+
+		warm_contexts = background_jobs.WarmSiteContexts()
+		self.addCleanup(warm_contexts.close)
+		connections = []
+
+		with freeze_local() as locals, patch.object(background_jobs, "_warm_contexts", warm_contexts):
+			for _ in range(2):
+				execute_job(
+					site=locals.site,
+					user="Administrator",
+					method=record_connection,
+					event=None,
+					job_name="record_connection",
+					is_async=True,
+					kwargs={"connections": connections},
+				)
+
+		(first_db, first_marker), (second_db, second_marker) = connections
+		self.assertIs(first_db, second_db)
+		self.assertIs(warm_contexts.databases[locals.site], first_db)
+		# request scoped state is not carried over
+		self.assertFalse(first_marker or second_marker)
+
+	def test_coalesced_calls_merge_arguments(self):
+		method = "frappe.tests.test_background_jobs.fail_function"
+		key = get_coalesce_key(method, {"doctype": "ToDo", "names": ["a"]}, ["names"])
+		self.assertEqual(key, get_coalesce_key(method, {"doctype": "ToDo", "names": ["b", "c"]}, ["names"]))
+		self.assertNotEqual(key, get_coalesce_key(method, {"doctype": "Note", "names": ["a"]}, ["names"]))
+
+		# no job accepting calls yet
+		self.assertIsNone(add_to_coalesced_job(key, {"names": ["a"]}, ["names"]))
+
+		job = frappe._dict(id=create_job_id(), meta={}, save_meta=lambda: None)
+		get_redis_conn().set(key, job.id, ex=60)
+		self.assertEqual(add_to_coalesced_job(key, {"names": ["b", "c"]}, ["names"]), job.id)
+		self.assertEqual(add_to_coalesced_job(key, {"names": "a"}, ["names"]), job.id)
+
+		with patch("frappe.utils.background_jobs.get_current_job", return_value=job):
+			kwargs = claim_coalesced_job({"key": key, "merge": ["names"]}, {"names": ["a"]})
+
+		self.assertEqual(sorted(kwargs["names"]), ["a", "b", "c"])
+		self.assertEqual(job.meta["coalesced"], 2)
+		# claimed job doesn't accept any more calls
+		self.assertIsNone(add_to_coalesced_job(key, {"names": ["d"]}, ["names"]))
+
+
+def record_connection(connections):
+	connections.append((frappe.local.db, frappe.local.flags.warm_context_marker))
+	frappe.local.flags.warm_context_marker = True
+
 
 def fail_function():
 	return 1 / 0
@@ -1,7 +1,9 @@
 import frappe
-from frappe.boot import get_user_pages_or_reports
+import frappe.sessions
+from frappe.boot import get_shared_bootinfo, get_user_pages_or_reports
 from frappe.desk.doctype.note.note import _get_unseen_notes, get_unseen_notes, mark_as_seen
 from frappe.tests import IntegrationTestCase
+from frappe.tests.test_api import FrappeAPITestCase
 
 
 class TestBootData(IntegrationTestCase):
@@ -76,3 +78,39 @@ class TestPermissionQueries(IntegrationTestCase):
 		# Test user must not see admin user's report
 		self.assertNotIn("Test Admin Report", allowed_reports)
 		self.assertIn("Test User Report", allowed_reports)
+
+
+class TestSharedBoot(FrappeAPITestCase):
+	def test_shared_boot_is_cached_once(self):
+		frappe.set_user("Administrator")
+		frappe.cache.delete_value("bootinfo")
+
+		bootinfo = frappe.sessions.get()
+		shared = get_shared_bootinfo()
+		self.assertIn("__messages", bootinfo)
+		self.assertEqual(bootinfo.page_info, shared.data["page_info"])
+
+		# cached boot of the user only keeps what isn't shared
+		frappe.local.cache = {}
+		cached = frappe.cache.hget("bootinfo", "Administrator")
+		self.assertNotIn("__messages", cached)
+		self.assertNotIn("page_info", cached)
+
+		cached_bootinfo = frappe.sessions.get()
+		self.assertTrue(cached_bootinfo.from_cache)
+		self.assertEqual(cached_bootinfo.page_info, bootinfo.page_info)
+		self.assertEqual(cached_bootinfo.lang_dict, bootinfo.lang_dict)
+		self.assertEqual(get_shared_bootinfo().version, shared.version)
+
+	def test_shared_boot_revalidation(self):
+		response = self.get(self.method("frappe.sessions.get_shared_boot"), {"sid": self.sid})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.mimetype, "text/javascript")
+		self.assertIn("__messages", response.text)
+		etag = response.headers["ETag"]
+
+		response = self.get(
+			self.method("frappe.sessions.get_shared_boot"), {"sid": self.sid}, headers={"If-None-Match": etag}
+		)
+		self.assertEqual(response.status_code, 304)
+		self.assertEqual(response.text, "")
@@ -206,6 +206,34 @@ class TestDBUpdate(IntegrationTestCase):
 		)[0][0]
 		self.assertEqual(length, 64)
 
+	@run_only_if(db_type_is.MARIADB)
+	def test_online_schema_change_through_shadow_table(self):
+		from frappe.database.mariadb.online_schema_change import OnlineSchemaChange
+
+		doctype = new_doctype(fields=[{"fieldname": "title", "fieldtype": "Data"}]).insert().name
+		names = [frappe.get_doc(doctype=doctype, title=f"Row {i}").insert().name for i in range(5)]
+
+		change = OnlineSchemaChange(f"tab{doctype}", ["MODIFY `title` varchar(200)"])
+		change.chunk_size = 2
+		change.create_shadow_table()
+		change.create_triggers()
+		# written while copying, synced by trigger
+		frappe.db.set_value(doctype, names[-1], "title", "Changed")
+		change.copy_rows()
+		change.swap_tables()
+		change.cleanup()
+
+		length = frappe.db.sql(
+			"""SELECT CHARACTER_MAXIMUM_LENGTH FROM INFORMATION_SCHEMA.COLUMNS
+			WHERE TABLE_NAME = %s AND COLUMN_NAME = 'title'""",
+			f"tab{doctype}",
+		)[0][0]
+		self.assertEqual(length, 200)
+		self.assertCountEqual(
+			frappe.get_all(doctype, pluck="title"), [f"Row {i}" for i in range(4)] + ["Changed"]
+		)
+		self.assertEqual(frappe.db.get_value(doctype, names[-1], "title"), "Changed")
+
 
 class TestDBUpdateSanityChecks(IntegrationTestCase):
 	@run_only_if(db_type_is.MARIADB)
@@ -224,6 +224,21 @@ class TestDocument(IntegrationTestCase):
 		d.append("roles", {"role": ("Guest", "Administrator")})
 		self.assertRaises(AssertionError, d._validate_links)
 
+	def test_link_values_fetched_on_save(self):
+		# links are prefetched in bulk before they are validated
+		todo = frappe.get_doc(
+			doctype="ToDo", description="Prefetched links", allocated_to="Administrator", assigned_by="Guest"
+		).insert()
+		self.assertEqual(todo.assigned_by_full_name, frappe.db.get_value("User", "Guest", "full_name"))
+
+		todo.assigned_by = "Administrator"
+		todo.save()
+		full_name = frappe.db.get_value("User", "Administrator", "full_name")
+		self.assertEqual(todo.assigned_by_full_name, full_name)
+
+		todo.allocated_to = "non-existent-user@example.com"
+		self.assertRaises(frappe.LinkValidationError, todo.save)
+
 	def test_validate(self):
 		d = self.test_insert()
 		d.starts_on = "2014-01-01"
@@ -538,6 +553,46 @@ class TestDocument(IntegrationTestCase):
 		changed_val = frappe.db.get_single_value(c.doctype, key)
 		self.assertEqual(val, changed_val)
 
+	def test_child_rows_written_in_bulk(self):
+		roles = frappe.get_all("Role", pluck="name", limit=20, order_by="name asc")
+		doc = frappe.new_doc("Role Profile")
+		doc.role_profile = frappe.generate_hash()
+		for role in roles:
+			doc.append("roles", {"role": role})
+
+		with self.count_writes("Has Role") as writes:
+			doc.insert()
+		self.assertEqual(len(writes), 1, writes)
+
+		doc.roles[3].role = roles[0]
+		doc.remove(doc.roles[5])
+		with self.count_writes("Has Role") as writes:
+			doc.save()
+		# delete removed row, update changed row, bump timestamps of the others
+		self.assertEqual(len(writes), 3, writes)
+
+		doc.reload()
+		self.assertEqual(len(doc.roles), len(roles) - 1)
+		self.assertEqual(doc.roles[3].role, roles[0])
+		self.assertEqual({row.modified for row in doc.roles}, {doc.modified})
+
+		with self.count_writes("Has Role") as writes:
+			doc.save()
+		self.assertEqual(len(writes), 2, writes)
+
+	@contextmanager
+	def count_writes(self, doctype):
+		writes = []
+		sql = frappe.db.sql
+
+		def sql_with_count(query, *args, **kwargs):
+			if f"tab{doctype}" in str(query) and not str(query).lstrip().lower().startswith("select"):
+				writes.append(str(query))
+			return sql(query, *args, **kwargs)
+
+		with patch.object(frappe.db, "sql", sql_with_count):
+			yield writes
+
 
 class TestDocumentWebView(IntegrationTestCase):
 	def get(self, path, user="Guest"):
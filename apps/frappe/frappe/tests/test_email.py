@@ -82,6 +82,53 @@ class TestEmail(IntegrationTestCase):
 		self.assertEqual(len(queue_recipients), 2)
 		self.assertTrue("Unsubscribe" in frappe.safe_decode(frappe.flags.sent_mail))
 
+	def test_flush_batch_sender(self):
+		from frappe.email.queue import EmailQueueBatchSender, get_queue
+
+		self.test_email_queue()
+		self.test_email_queue()
+
+		batch = get_queue()
+		sender = EmailQueueBatchSender(batch, workers_per_account=4)
+		self.assertEqual(sum(len(names) for names in sender.group_by_email_account().values()), 2)
+
+		sender.run()
+		self.assertFalse(sender.failed_email_queues)
+		self.assertEqual(frappe.db.count("Email Queue", {"status": "Sent"}), 2)
+		self.assertEqual(frappe.db.count("Email Queue Recipient", {"status": "Sent"}), 4)
+
+	def test_flush_batch_sender_in_threads(self):
+		from frappe.email.queue import EmailQueueBatchSender, get_queue
+
+		# rows deleted by setUp belong to other tests, they mustn't be committed
+		frappe.db.rollback()
+		queues = [
+			frappe.sendmail(
+				recipients=["test@example.com", "test1@example.com"],
+				sender="admin@example.com",
+				subject="Testing Queue in Threads",
+				message="This mail is queued!",
+			)
+			for _ in range(3)
+		]
+		names = [queue.name for queue in queues]
+		# sending threads have their own connections
+		frappe.db.commit()
+		self.addCleanup(frappe.db.commit)
+		self.addCleanup(frappe.db.delete, "Email Queue Recipient", {"parent": ("in", names)})
+		self.addCleanup(frappe.db.delete, "Email Queue", {"name": ("in", names)})
+
+		sender = EmailQueueBatchSender([q for q in get_queue() if q.name in names], workers_per_account=2)
+		sender.use_threads = True
+		sender.run()
+
+		frappe.db.rollback()
+		self.assertFalse(sender.failed_email_queues)
+		self.assertEqual(frappe.db.count("Email Queue", {"name": ("in", names), "status": "Sent"}), 3)
+		self.assertEqual(
+			frappe.db.count("Email Queue Recipient", {"parent": ("in", names), "status": "Sent"}), 6
+		)
+
 	def test_cc_header(self):
 		# test if sending with cc's makes it into header
 		frappe.sendmail(
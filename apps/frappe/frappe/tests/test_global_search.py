@@ -1,6 +1,8 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
 
+from unittest.mock import patch
+
 import frappe
 from frappe.custom.doctype.property_setter.property_setter import make_property_setter
 from frappe.desk.page.setup_wizard.install_fixtures import update_global_search_doctypes
@@ -76,6 +78,31 @@ class TestGlobalSearch(IntegrationTestCase):
 
 		self.assertTrue("testing global search" in results[0].content)
 
+	def test_queue_is_keyed_by_document(self):
+		global_search.sync_global_search()
+
+		event = frappe.get_doc(doctype="Event", subject="first queued subject", starts_on=now_datetime())
+		event.insert()
+		event.subject = "second queued subject"
+		event.save()
+		self.assertEqual(global_search.get_indexing_lag().pending, 1)
+
+		global_search.sync_global_search()
+		self.assertEqual(global_search.get_indexing_lag().pending, 0)
+
+		results = global_search.search("queued subject")
+		self.assertEqual(len(results), 1)
+		self.assertIn("second queued subject", results[0].content)
+
+	def test_rebuild_in_pages(self):
+		self.insert_test_events()
+		global_search.reset()
+
+		with patch.object(global_search, "REBUILD_PAGE_SIZE", 1):
+			global_search.rebuild_for_doctype("Event")
+
+		self.assertEqual(frappe.db.count("__global_search", {"doctype": "Event"}), frappe.db.count("Event"))
+
 	def test_update_fields(self):
 		self.insert_test_events()
 		results = global_search.search("Monthly")
@@ -1,5 +1,9 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
+import os
+import sys
+from unittest.mock import patch
+
 import frappe
 from frappe.cache_manager import clear_controller_cache
 from frappe.desk.doctype.todo.todo import ToDo
@@ -19,6 +23,32 @@ class TestHooks(IntegrationTestCase):
 			in hooks.get("doc_events").get("*").get("on_update")
 		)
 
+	def test_hooks_disk_cache(self):
+		from frappe.utils import hooks_cache
+
+		apps = frappe.get_installed_apps(_ensure_on_bench=True)
+		hooks_cache.clear_hooks_cache()
+
+		def load_without_imported_hooks():
+			for app in apps:
+				sys.modules.pop(f"{app}.hooks", None)
+			return hooks_cache.load_app_hooks()
+
+		with (
+			patch.dict(sys.modules),
+			patch.object(frappe, "_load_app_hooks", wraps=frappe._load_app_hooks) as load_app_hooks,
+		):
+			hooks = load_without_imported_hooks()
+			self.assertTrue(os.path.exists(hooks_cache.get_cache_path(apps)))
+			self.assertEqual(load_without_imported_hooks(), hooks)
+			self.assertEqual(load_app_hooks.call_count, 1)
+
+			# hooks modules imported by now are used as they are
+			hooks_cache.load_app_hooks()
+			self.assertEqual(load_app_hooks.call_count, 2)
+
+		hooks_cache.clear_hooks_cache()
+
 	def test_override_doctype_class(self):
 		from frappe import hooks
 
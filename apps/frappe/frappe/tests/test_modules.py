@@ -3,6 +3,7 @@ import shutil
 import unittest
 from contextlib import contextmanager
 from pathlib import Path
+from unittest.mock import patch
 
 import frappe
 from frappe import scrub
@@ -149,6 +150,21 @@ class TestUtils(IntegrationTestCase):
 		self.assertTrue(os.path.exists(exported_doc_path))
 		self.addCleanup(delete_path, path=exported_doc_path.parent.parent)
 
+	def test_sync_skips_unchanged_files(self):
+		from frappe.model.sync import get_files_to_import
+		from frappe.modules.import_file import calculate_hash
+
+		path = frappe.get_app_path("frappe", "desk", "doctype", "note", "note.json")
+		frappe.db.set_value("DocType", "Note", "migration_hash", calculate_hash(path), update_modified=False)
+		get_files_to_import("frappe", [path])
+
+		with patch("frappe.model.sync.read_doc_file") as read_doc_file:
+			self.assertEqual(get_files_to_import("frappe", [path]), [])
+			read_doc_file.assert_not_called()
+
+		frappe.db.set_value("DocType", "Note", "migration_hash", "changed", update_modified=False)
+		self.assertEqual(get_files_to_import("frappe", [path]), [path])
+
 	@unittest.skipUnless(
 		os.access(frappe.get_app_path("frappe"), os.W_OK), "Only run if frappe app paths is writable"
 	)
@@ -1,8 +1,9 @@
 # Copyright (c) 2018, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
 import io
+from unittest.mock import patch
 
-from pypdf import PdfReader
+from pypdf import PdfReader, PdfWriter
 
 import frappe
 import frappe.utils.pdf as pdfgen
@@ -94,3 +95,51 @@ class TestPdf(IntegrationTestCase):
 
 		# If image was actually retrieved then size will be  in few kbs, else bytes.
 		self.assertGreaterEqual(len(pdf), 10_000)
+
+	def test_render_pdfs_in_order(self):
+		from frappe.utils.pdf_render_pool import render_pdfs
+
+		todos = [frappe.get_doc(doctype="ToDo", description=f"PDF {i}").insert() for i in range(2)]
+		docs = [("ToDo", todo.name) for todo in todos] + [("ToDo", "non-existent-todo")]
+
+		output = PdfWriter()
+		printed = list(render_pdfs(docs, output))
+
+		self.assertEqual([(p.doctype, p.name) for p in printed], docs)
+		self.assertEqual([p.rendered for p in printed], [True, True, False])
+		self.assertGreaterEqual(len(output.pages), 2)
+
+	def test_render_pdfs_concurrently(self):
+		from frappe.utils.pdf_render_pool import _render_concurrently
+
+		# rendering threads have their own connections, they only see committed documents
+		todos = [frappe.get_doc(doctype="ToDo", description=f"PDF {i}").insert() for i in range(3)]
+		frappe.db.commit()
+		self.addCleanup(frappe.db.commit)
+		for todo in todos:
+			self.addCleanup(todo.delete)
+		docs = [("ToDo", todo.name) for todo in todos] + [("ToDo", "non-existent-todo")]
+
+		frappe.local.form_dict.pdf_generator = "wkhtmltopdf"
+		self.addCleanup(frappe.local.form_dict.pop, "pdf_generator", None)
+
+		output = PdfWriter()
+		with patch.object(frappe, "get_print", wraps=frappe.get_print) as get_print:
+			printed = list(_render_concurrently(docs, output, 2, {}))
+
+		self.assertEqual([(p.doctype, p.name) for p in printed], docs)
+		self.assertEqual([p.rendered for p in printed], [True, True, True, False])
+		self.assertGreaterEqual(len(output.pages), 3)
+		self.assertEqual({call.kwargs["pdf_generator"] for call in get_print.call_args_list}, {"wkhtmltopdf"})
+
+	def test_pdf_generator_of_render(self):
+		from frappe.utils.pdf_render_pool import get_pdf_generator
+
+		frappe.local.form_dict.pop("pdf_generator", None)
+		self.assertEqual(get_pdf_generator({"pdf_generator": "chrome"}), "chrome")
+		self.assertEqual(get_pdf_generator({"print_format": None}), "wkhtmltopdf")
+
+		# the generator asked for by the request wins, as in `frappe.get_print`
+		frappe.local.form_dict.pdf_generator = "wkhtmltopdf"
+		self.addCleanup(frappe.local.form_dict.pop, "pdf_generator", None)
+		self.assertEqual(get_pdf_generator({"pdf_generator": "chrome"}), "wkhtmltopdf")
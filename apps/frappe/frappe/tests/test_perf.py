@@ -21,6 +21,8 @@ import gc
 import itertools
 import sys
 import time
+from datetime import timedelta
+from decimal import Decimal
 from unittest.mock import patch
 
 import psutil
@@ -28,12 +30,12 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fi
 
 import frappe
 from frappe.frappeclient import FrappeClient
-from frappe.model.base_document import get_controller
+from frappe.model.base_document import get_controller, prefetch_link_values
 from frappe.query_builder.utils import db_type_is
 from frappe.tests import IntegrationTestCase
 from frappe.tests.test_api import FrappeAPITestCase
 from frappe.tests.test_query_builder import run_only_if
-from frappe.utils import cint
+from frappe.utils import cint, orjson_dumps
 from frappe.utils.caching import redis_cache
 from frappe.website.path_resolver import PathResolver
 
@@ -123,6 +125,20 @@ class TestPerformance(IntegrationTestCase):
 		with self.assertQueryCount(0):
 			doc.get_invalid_links()
 
+	def test_link_prefetch(self):
+		"""Links of a document and its child rows are read with one query per linked doctype"""
+		doc = frappe.get_doc("User", "Administrator")
+		children = doc.get_all_children()
+		self.assertGreater(len(children), 1)
+
+		frappe.db.value_cache.clear()
+		prefetch_link_values([doc, *children])
+
+		with self.assertQueryCount(0):
+			doc.get_invalid_links()
+			for child in children:
+				child.get_invalid_links()
+
 	@retry(
 		retry=retry_if_exception_type(AssertionError),
 		stop=stop_after_attempt(3),
@@ -153,6 +169,16 @@ class TestPerformance(IntegrationTestCase):
 			"Possible performance regression in basic /api/Resource list  requests",
 		)
 
+	def test_columnar_encoding(self):
+		"""Columnar encoding of a large report result is smaller than the JSON response."""
+		from frappe.utils.columnar import to_columnar
+		from frappe.utils.response import json_handler
+
+		rows = get_report_rows()
+		json_size = len(orjson_dumps({"result": rows}, default=json_handler))
+		columnar_size = len(orjson_dumps({"result": to_columnar(rows)}, default=json_handler))
+		self.assertLess(columnar_size, json_size)
+
 	def test_homepage_resolver(self):
 		paths = ["/", "/desk"]
 		for path in paths:
@@ -314,6 +340,50 @@ class TestOverheadCalls(FrappeAPITestCase):
 			self.get(self.resource("User", "Administrator"), {"sid": sid})
 
 
+def get_report_rows(count: int = 50_000) -> list[dict]:
+	"""Return rows shaped like a stock ledger report, with dates, times and decimals in every row."""
+	now = frappe.utils.now_datetime()
+	return [
+		{
+			"name": f"SLE-{i}",
+			"posting_date": now.date(),
+			"posting_time": timedelta(seconds=i),
+			"item_code": f"ITEM-{i % 500}",
+			"actual_qty": Decimal(i),
+			"valuation_rate": Decimal("10.25"),
+			"creation": now,
+		}
+		for i in range(count)
+	]
+
+
+def benchmark_columnar_encoding(count: int = 50_000, repeat: int = 3) -> dict:
+	"""Print and return the fastest of `repeat` encoding times of a report result, as JSON and columns.
+
+	Timings depend on the machine, so they are left out of tests. Run with:
+	bench --site {site} execute frappe.tests.test_perf.benchmark_columnar_encoding"""
+	from frappe.utils.columnar import to_columnar
+	from frappe.utils.response import json_handler
+
+	rows = get_report_rows(count)
+	encoders = {
+		"json": lambda: orjson_dumps({"result": rows}, default=json_handler),
+		"columnar": lambda: orjson_dumps({"result": to_columnar(rows)}, default=json_handler),
+	}
+
+	results = {}
+	for label, encode in encoders.items():
+		durations = []
+		for _ in range(repeat):
+			start = time.perf_counter()
+			payload = encode()
+			durations.append(time.perf_counter() - start)
+		results[label] = {"seconds": round(min(durations), 4), "bytes": len(payload)}
+		print(f"{label}: {results[label]['seconds']}s, {results[label]['bytes']} bytes")
+
+	return results
+
+
 @redis_cache
 def redis_cached_func():
 	return 42
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import frappe
 from frappe.core.doctype.doctype.test_doctype import new_doctype
 from frappe.tests import IntegrationTestCase
@@ -30,3 +32,15 @@ class PrintViewTest(IntegrationTestCase):
 
 		# cancelled doc can't be printed by default
 		self.assertRaises(frappe.PermissionError, frappe.attach_print, doc.doctype, doc.name)
+
+	def test_template_compiled_once(self):
+		from frappe.utils.jinja import get_jenv, render_template
+
+		template = f"<p>{{{{ doc.name }}}} {frappe.generate_hash()}</p>"
+		jenv_class = type(get_jenv())
+
+		with patch.object(jenv_class, "compile", autospec=True, side_effect=jenv_class.compile) as compile:
+			for name in ("INV-1", "INV-2", "INV-3"):
+				self.assertIn(name, render_template(template, {"doc": {"name": name}}))
+
+		self.assertEqual([call.args[1] for call in compile.call_args_list].count(template), 1)
@@ -7,9 +7,9 @@ from werkzeug.wrappers import Response
 
 import frappe
 import frappe.rate_limiter
-from frappe.rate_limiter import RateLimiter
+from frappe.rate_limiter import RateLimiter, check_rate_limits
 from frappe.tests import IntegrationTestCase
-from frappe.utils import cint
+from frappe.utils import cint, set_request
 
 
 class TestRateLimiter(IntegrationTestCase):
@@ -117,3 +117,53 @@ class TestRateLimiter(IntegrationTestCase):
 		time.sleep(1.1)
 		self.assertFalse(frappe.cache.exists(limiter.key, shared=True))
 		frappe.cache.delete(limiter.key)
+
+	def test_sliding_window(self):
+		key = "rate-limit:test_sliding_window"
+		self.addCleanup(frappe.cache.delete_value, key)
+
+		results = [check_rate_limits([(key, 2, 60)]) for _ in range(3)]
+		self.assertEqual([result.allowed for result in results], [True, True, False])
+		self.assertEqual([result.remaining for result in results], [1, 0, 0])
+		self.assertEqual(results[0].retry_after, 0)
+		self.assertTrue(0 < results[2].retry_after <= 120)
+
+	def test_request_counted_only_within_all_limits(self):
+		keys = ["rate-limit:test_tight", "rate-limit:test_loose"]
+		self.addCleanup(frappe.cache.delete_value, keys)
+
+		limits = [(keys[0], 1, 60), (keys[1], 10, 60)]
+		self.assertTrue(check_rate_limits(limits).allowed)
+		self.assertFalse(check_rate_limits(limits).allowed)
+		# rejected request wasn't counted against the loose limit
+		self.assertEqual(check_rate_limits([(keys[1], 10, 60)]).remaining, 8)
+
+	def test_rate_limit_policies(self):
+		set_request(path="/api/method/frappe.ping", method="GET")
+		policy = {"path": "/api/method/frappe.*", "limit": 1, "seconds": 60, "per": "global"}
+		frappe.conf.rate_limit_policies = [policy, {"path": "/api/v2/*", "limit": 1, "seconds": 60}]
+		key = "rate-limit-policy:/api/method/frappe.*:60:global:"
+		self.addCleanup(frappe.cache.delete_value, key)
+		self.addCleanup(frappe.conf.pop, "rate_limit_policies")
+
+		frappe.rate_limiter.apply()
+		self.assertRaises(frappe.TooManyRequestsError, frappe.rate_limiter.apply)
+		self.assertGreater(cint(frappe.local.response_headers["Retry-After"]), 0)
+		self.assertEqual(frappe.rate_limiter.respond().status_code, 429)
+		frappe.flags.rate_limit_policy_exceeded = False
+
+	def test_user_rate_limit_policies(self):
+		set_request(path="/api/method/frappe.ping", method="GET")
+		frappe.conf.rate_limit_policies = [
+			{"path": "/api/method/frappe.*", "limit": 1, "seconds": 60, "per": "user"}
+		]
+		key = f"rate-limit-policy:/api/method/frappe.*:60:user:{frappe.session.user}"
+		self.addCleanup(frappe.cache.delete_value, key)
+		self.addCleanup(frappe.conf.pop, "rate_limit_policies")
+
+		# counted once the user is authenticated
+		frappe.rate_limiter.apply()
+		frappe.rate_limiter.apply()
+		frappe.rate_limiter.apply_user_policies()
+		self.assertRaises(frappe.TooManyRequestsError, frappe.rate_limiter.apply_user_policies)
+		frappe.flags.rate_limit_policy_exceeded = False
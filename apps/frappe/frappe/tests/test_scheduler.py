@@ -1,11 +1,13 @@
+import importlib.util
 import os
 import time
+import unittest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import frappe
 from frappe.core.doctype.scheduled_job_type.scheduled_job_type import ScheduledJobType, sync_jobs
-from frappe.tests import IntegrationTestCase
+from frappe.tests import IntegrationTestCase, UnitTestCase
 from frappe.utils import add_days, get_datetime
 from frappe.utils.doctor import purge_pending_jobs
 from frappe.utils.scheduler import (
@@ -108,6 +110,70 @@ class TestScheduler(IntegrationTestCase):
 				self.assertEqual(sleep_duration(DEFAULT_SCHEDULER_TICK), expected_sleep, delta)
 
 
+@unittest.skipUnless(importlib.util.find_spec("fakeredis"), "fakeredis is not installed")
+class TestFairShareScheduler(UnitTestCase):
+	"""Simulate scheduler ticks for tenants with skewed job costs."""
+
+	def setUp(self):
+		import fakeredis
+
+		from frappe.utils.fair_scheduler import FairShareScheduler
+
+		self.scheduler = FairShareScheduler(fakeredis.FakeRedis(), quantum=60)
+
+	def simulate(self, tenants: dict[str, dict[str, float]], ticks: int, weights=None) -> dict[str, int]:
+		"""Run `ticks` scheduler ticks, every job is due on every tick and finishes before next tick.
+
+		:param tenants: {site: {job: duration}}
+		:return: number of jobs run per site
+		"""
+		weights = weights or {}
+		runs = dict.fromkeys(tenants, 0)
+		for _ in range(ticks):
+			for site in self.scheduler.order_sites(list(tenants)):
+				jobs = tenants[site]
+				for job in self.scheduler.admit(site, list(jobs), weight=weights.get(site, 1)):
+					self.scheduler.job_enqueued(site, job)
+					self.scheduler.job_finished(site, job, jobs[job])
+					runs[site] += 1
+		return runs
+
+	def test_heavy_tenant_does_not_starve_others(self):
+		heavy = {f"heavy_{i}": 600.0 for i in range(5)}
+		light = {f"light_{i}": 1.0 for i in range(5)}
+		runs = self.simulate({"heavy.site": heavy, "light.site": light}, ticks=20)
+
+		# light site runs everything on every tick
+		self.assertEqual(runs["light.site"], 20 * 5)
+		# heavy site runs at most one job per tick and gets throttled while in debt
+		self.assertLess(runs["heavy.site"], 20)
+		self.assertGreater(runs["heavy.site"], 0)
+
+		metrics = self.scheduler.get_backlog_metrics()
+		self.assertEqual(metrics["light.site"].backlog, 0)
+		self.assertGreater(metrics["heavy.site"].backlog, 0)
+		self.assertGreater(metrics["heavy.site"].average_job_cost, metrics["light.site"].average_job_cost)
+
+	def test_weights(self):
+		tenants = {
+			"a.site": {f"job_{i}": 30.0 for i in range(10)},
+			"b.site": {f"job_{i}": 30.0 for i in range(10)},
+		}
+		runs = self.simulate(tenants, ticks=10, weights={"a.site": 3})
+		self.assertGreater(runs["a.site"], 2 * runs["b.site"])
+
+	def test_occupancy_limit(self):
+		self.scheduler.max_site_occupancy = 2
+		self.scheduler.job_enqueued("busy.site", "running_job")
+		self.assertEqual(len(self.scheduler.admit("busy.site", ["a", "b", "c"])), 1)
+		self.assertEqual(self.scheduler.get_backlog_metrics()["busy.site"].in_flight, 1)
+
+	def test_busy_sites_are_visited_last(self):
+		for job in ("a", "b", "c"):
+			self.scheduler.job_enqueued("busy.site", job)
+		self.assertEqual(self.scheduler.order_sites(["busy.site", "idle.site"])[-1], "busy.site")
+
+
 def get_test_job(method="frappe.tests.test_scheduler.test_timeout_10", frequency="All") -> ScheduledJobType:
 	if not frappe.db.exists("Scheduled Job Type", dict(method=method)):
 		job = frappe.get_doc(
@@ -3,6 +3,7 @@
 
 import re
 from functools import partial
+from unittest.mock import patch
 
 import frappe
 from frappe.desk.search import get_names_for_mentions, search_link, search_widget
@@ -180,6 +181,63 @@ class TestSearch(IntegrationTestCase):
 		result = search(txt="(txt)")
 		self.assertEqual(result, [])
 
+	@patch.dict(frappe.conf, {"link_search_index": ["Note"]})
+	def test_link_search_index(self):
+		import sqlite3
+
+		from frappe.search.link_search import (
+			LinkSearchIndex,
+			flush_link_search_changes,
+			sync_link_search_changes,
+		)
+
+		def search(txt):
+			# changes are applied once committed
+			flush_link_search_changes()
+			return [row["value"] for row in search_link(doctype="Note", txt=txt, filters=None)]
+
+		steel, copper = (
+			frappe.get_doc(doctype="Note", title=title).insert()
+			for title in ("Indexed Steel Bolt", "Indexed Copper Wire")
+		)
+		index = LinkSearchIndex("Note")
+		index.build()
+		self.addCleanup(index.drop)
+
+		self.assertEqual(search("steel bolt"), [steel.name])
+		self.assertEqual(set(search("indexed")), {steel.name, copper.name})
+
+		# typo falls back to names with most trigrams in common
+		self.assertEqual(search("Indexed Stel")[0], steel.name)
+
+		# names left out of truncated index results are searched for in the table
+		truncated = frappe._dict(names=[copper.name], fuzzy=False, truncated=True)
+		with patch("frappe.search.link_search.get_link_search_candidates", return_value=truncated):
+			self.assertEqual(set(search("indexed")), {steel.name, copper.name})
+
+		# kept up to date on changes
+		brass = frappe.get_doc(doctype="Note", title="Indexed Brass Nut").insert()
+		self.assertEqual(search("brass nut"), [brass.name])
+
+		copper.title = "Indexed Aluminium Wire"
+		copper.save()
+		self.assertEqual(search("copper"), [])
+		self.assertEqual(search("aluminium"), [copper.name])
+
+		brass.delete()
+		self.assertEqual(search("brass nut"), [])
+
+		# failed updates are retried by the scheduler
+		steel.title = "Indexed Stainless Bolt"
+		steel.save()
+		locked = sqlite3.OperationalError("database is locked")
+		with patch.object(LinkSearchIndex, "sync", side_effect=locked):
+			flush_link_search_changes()
+		self.assertEqual(search("stainless"), [])
+
+		sync_link_search_changes()
+		self.assertEqual(search("stainless"), [steel.name])
+
 
 @frappe.validate_and_sanitize_search_inputs
 def get_data(doctype, txt, searchfield, start, page_len, filters):
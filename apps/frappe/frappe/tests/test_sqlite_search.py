@@ -355,6 +355,65 @@ class TestSQLiteSearchAPI(IntegrationTestCase):
 		finally:
 			new_note.delete()
 
+	def test_incremental_sync(self):
+		"""Test applying changed and deleted documents with sync_index."""
+		self.search.build_index()
+
+		def find(query):
+			return [r["name"] for r in self.search.search(query)["results"] if r["doctype"] == "Note"]
+
+		note = self.test_notes[0]
+		self.assertIn(note.name, find("Python Programming"))
+
+		# reindexing a document replaces its entry
+		self.search.index_doc("Note", note.name)
+		self.assertEqual(find("Python Programming").count(note.name), 1)
+
+		note.title = "Incrementally Synced Document"
+		note.save()
+		new_note = frappe.get_doc(
+			{"doctype": "Note", "title": "Created Before Sync", "content": "Indexed by incremental sync"}
+		).insert()
+		deleted_note = self.test_notes.pop()
+		deleted_note.delete()
+
+		self.assertGreaterEqual(self.search.sync_index(batch_size=1), 3)
+
+		self.assertEqual(find("Incrementally Synced"), [note.name])
+		self.assertEqual(find("Created Before Sync"), [new_note.name])
+		self.assertNotIn(deleted_note.name, find("Machine Learning"))
+
+		# nothing left to apply
+		self.assertEqual(self.search.sync_index(), 0)
+		stats = self.search.get_index_stats()
+		self.assertEqual(stats["freshness"]["Note"]["lag"], 0)
+		new_note.delete()
+
+	def test_vocabulary_follows_document_changes(self):
+		"""Test that words of replaced and removed documents are taken out of the vocabulary."""
+		self.search.build_index()
+		note = frappe.get_doc(
+			{"doctype": "Note", "title": "Vocabulary Zanzibar", "content": "Zanzibar"}
+		).insert()
+		self.addCleanup(note.delete)
+
+		def frequency(word):
+			conn = self.search._get_connection(read_only=True)
+			try:
+				query = "SELECT frequency FROM search_vocabulary WHERE word = ?"
+				row = conn.execute(query, (word,)).fetchone()
+			finally:
+				conn.close()
+			return row[0] if row else None
+
+		# reindexing a document doesn't count its words again
+		self.search.index_doc("Note", note.name)
+		self.search.index_doc("Note", note.name)
+		self.assertEqual(frequency("zanzibar"), 2)
+
+		self.search.remove_doc("Note", note.name)
+		self.assertIsNone(frequency("zanzibar"))
+
 	def test_search_result_summary_and_metadata(self):
 		"""Test search result summary and metadata information."""
 		self.search.build_index()
@@ -1146,6 +1146,35 @@ class TestLazyLoader(IntegrationTestCase):
 			ls.time
 		self.assertEqual(["Module `frappe.tests.data.load_sleep` loaded"], output)
 
+	def test_lazy_attributes(self):
+		from frappe.utils import jinja
+		from frappe.utils.lazy_loader import lazy_attributes
+
+		sys.modules.pop("frappe.tests.data.load_sleep", None)
+		module_globals = {"__name__": "lazy_module"}
+		with Capturing() as output:
+			__getattr__ = lazy_attributes(module_globals, {"time": "frappe.tests.data.load_sleep"})
+		self.assertEqual(output, [])
+
+		with Capturing() as output:
+			self.assertIs(__getattr__("time"), sys.modules["time"])
+		self.assertEqual(["Module `frappe.tests.data.load_sleep` loaded"], output)
+		self.assertIs(module_globals["time"], sys.modules["time"])
+		self.assertRaises(AttributeError, __getattr__, "sleep")
+
+		self.assertIs(frappe.render_template, jinja.render_template)
+
+	def test_import_times(self):
+		from frappe.utils.commands import get_import_times
+
+		output = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   pypika.enums
+import time:       300 |        420 | pypika
+import time:        80 |         80 | json
+"""
+		self.assertEqual(get_import_times(output), {"pypika": 420, "json": 80})
+		self.assertEqual(get_import_times(output, by_module=True)["pypika.enums"], 120)
+
 
 class TestIdenticon(IntegrationTestCase):
 	def test_get_gravatar(self):
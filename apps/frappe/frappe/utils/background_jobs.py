@@ -1,10 +1,13 @@
+import hashlib
+import json
 import os
 import random
 import signal
 import socket
 import sys
 import time
-from collections import defaultdict
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable
 from contextlib import suppress
 from functools import lru_cache
@@ -13,8 +16,8 @@ from typing import Any, NoReturn
 from uuid import uuid4
 
 import redis
-from redis.exceptions import BusyLoadingError, ConnectionError
-from rq import Callback, Queue, Worker
+from redis.exceptions import BusyLoadingError, ConnectionError, WatchError
+from rq import Callback, Queue, Worker, get_current_job
 from rq.defaults import DEFAULT_WORKER_TTL
 from rq.exceptions import InvalidJobOperation, NoSuchJobError
 from rq.job import Job, JobStatus
@@ -31,6 +34,7 @@ from frappe.utils import CallbackManager, cint, get_bench_id, get_sites
 from frappe.utils.caching import site_cache
 from frappe.utils.commands import log
 from frappe.utils.data import sbool
+from frappe.utils.local import release_local
 from frappe.utils.redis_queue import RedisQueue
 
 # TTL to keep RQ job logs in redis for.
@@ -46,6 +50,13 @@ MAX_QUEUED_JOBS = 500  # frappe.enqueue will start failing when these many jobs
 # response latencies to interactive jobs.
 QUEUE_STARVATION_THRESHOLD = 16
 
+# Upper bounds (in ms) of job start latency histogram buckets, see `record_job_start_latency`
+JOB_START_LATENCY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+WARM_CONTEXT_MAX_SITES = 8  # Sites for which a warm worker keeps DB connections around
+
+# How long coalescing state (merge counters and merged arguments) of a queued job is kept around.
+COALESCE_STATE_TTL = 24 * 60 * 60
+
 
 _redis_queue_conn = None
 
@@ -89,6 +100,8 @@ def enqueue(
 	job_id: str | None = None,
 	deduplicate=False,
 	at_front_when_starved=False,
+	coalesce: int = 0,
+	coalesce_merge: str | list[str] | None = None,
 	**kwargs,
 ) -> Job | Any:
 	"""
@@ -112,6 +125,10 @@ def enqueue(
 	:param job_id: Assigning unique job id, which can be checked using `is_job_enqueued`
 	:param at_front_when_starved: If the queue appears to be starved then new jobs are
 	automatically inserted in LIFO fashion.
+	:param coalesce: Window in seconds in which calls with the same method and arguments are merged
+	into one job, as long as that job hasn't started. Returns the job calls were merged into.
+	:param coalesce_merge: Argument name(s) excluded from the comparison, values passed for these are
+	merged (as a union of lists) into the arguments of the coalesced job. e.g. document names.
 	"""
 	# To handle older implementations
 	is_async = kwargs.pop("async", is_async)
@@ -130,6 +147,9 @@ def enqueue(
 
 		# If job exists and is completed then delete it before re-queue
 
+	if coalesce and job_id:
+		frappe.throw(_("`job_id` can't be specified for coalesced jobs."))
+
 	# namespace job ids to sites
 	job_id = create_job_id(job_id)
 
@@ -189,7 +209,29 @@ def enqueue(
 	if at_front_when_starved and q.count > QUEUE_STARVATION_THRESHOLD:
 		at_front = True
 
+	coalesce_key = None
+	if coalesce and is_async:
+		coalesce_merge = [coalesce_merge] if isinstance(coalesce_merge, str) else list(coalesce_merge or [])
+		coalesce_key = get_coalesce_key(method_name, kwargs, coalesce_merge)
+		queue_args["coalesce"] = {"key": coalesce_key, "merge": coalesce_merge}
+
 	def enqueue_call():
+		if coalesce_key:
+			while coalesced_job_id := add_to_coalesced_job(coalesce_key, kwargs, coalesce_merge):
+				with suppress(NoSuchJobError):
+					job = Job.fetch(coalesced_job_id, connection=q.connection)
+					if job.get_status(refresh=False) in (JobStatus.QUEUED, JobStatus.STARTED):
+						return job
+				# job got removed or cancelled, stop coalescing into it
+				q.connection.delete(coalesce_key)
+
+		job = _enqueue_call()
+		if coalesce_key:
+			# If another job won the race, this one just doesn't accept coalesced calls.
+			q.connection.set(coalesce_key, job.id, ex=coalesce, nx=True)
+		return job
+
+	def _enqueue_call():
 		return q.enqueue_call(
 			"frappe.utils.background_jobs.execute_job",
 			on_success=Callback(func=on_success) if on_success else None,
@@ -236,13 +278,114 @@ def run_doc_method(doctype, name, doc_method, **kwargs):
 	getattr(frappe.get_doc(doctype, name), doc_method)(**kwargs)
 
 
-def execute_job(site, method, event, job_name, kwargs, user=None, is_async=True, retry=0):
+def get_coalesce_key(method_name: str, kwargs: dict, merge: list[str]) -> str:
+	"""Key identifying calls which can be coalesced, arguments listed in `merge` are ignored."""
+	identity = json.dumps(
+		[method_name, {k: v for k, v in kwargs.items() if k not in merge}], sort_keys=True, default=str
+	)
+	return f"{frappe.local.site}||coalesce||{hashlib.sha1(identity.encode()).hexdigest()}"
+
+
+def get_coalesce_state_keys(job_id: str, merge: list[str]) -> tuple[str, list[str]]:
+	"""Return key of merge counter and keys of merged argument sets for a coalescing job."""
+	return f"{job_id}||coalesced", [f"{job_id}||coalesced||{field}" for field in merge]
+
+
+def add_to_coalesced_job(coalesce_key: str, kwargs: dict, merge: list[str]) -> str | None:
+	"""Merge call into the job currently accepting coalesced calls.
+
+	Return id of that job, None if there is no such job."""
+	with get_redis_conn().pipeline() as pipe:
+		while True:
+			try:
+				# Worker deletes the key when it picks the job, that aborts this transaction
+				pipe.watch(coalesce_key)
+				if not (job_id := pipe.get(coalesce_key)):
+					return None
+
+				job_id = frappe.safe_decode(job_id)
+				counter_key, merge_keys = get_coalesce_state_keys(job_id, merge)
+
+				pipe.multi()
+				pipe.hincrby(counter_key, "count", 1)
+				pipe.expire(counter_key, COALESCE_STATE_TTL)
+				for field, merge_key in zip(merge, merge_keys, strict=True):
+					if values := _as_list(kwargs.get(field)):
+						pipe.sadd(merge_key, *(json.dumps(v, default=str) for v in values))
+						pipe.expire(merge_key, COALESCE_STATE_TTL)
+				pipe.execute()
+				return job_id
+			except WatchError:
+				continue
+
+
+def claim_coalesced_job(coalesce: dict, kwargs: dict) -> dict:
+	"""Stop accepting coalesced calls for the current job and return its merged arguments."""
+	job = get_current_job()
+	if not job:
+		return kwargs
+
+	conn = get_redis_conn()
+	coalesce_key, merge = coalesce["key"], coalesce.get("merge") or []
+
+	with conn.pipeline() as pipe:
+		while True:
+			try:
+				pipe.watch(coalesce_key)
+				if frappe.safe_decode(pipe.get(coalesce_key)) == job.id:
+					pipe.multi()
+					pipe.delete(coalesce_key)
+					pipe.execute()
+				else:
+					pipe.unwatch()
+				break
+			except WatchError:
+				continue
+
+	counter_key, merge_keys = get_coalesce_state_keys(job.id, merge)
+	kwargs = kwargs.copy()
+	for field, merge_key in zip(merge, merge_keys, strict=True):
+		merged = _as_list(kwargs.get(field))
+		merged.extend(v for v in (json.loads(m) for m in conn.smembers(merge_key)) if v not in merged)
+		kwargs[field] = merged
+
+	job.meta["coalesced"] = cint(conn.hget(counter_key, "count"))
+	job.save_meta()
+	conn.delete(counter_key, *merge_keys)
+	return kwargs
+
+
+def get_coalesced_count(job: Job) -> int:
+	"""Number of calls merged into `job`."""
+	if "coalesced" in job.meta:
+		return job.meta["coalesced"]
+	if job.kwargs.get("coalesce"):
+		counter_key, _ = get_coalesce_state_keys(job.id, [])
+		return cint(job.connection.hget(counter_key, "count"))
+	return 0
+
+
+def _as_list(value) -> list:
+	if value is None:
+		return []
+	if isinstance(value, list | tuple | set):
+		return list(value)
+	return [value]
+
+
+def execute_job(
+	site, method, event, job_name, kwargs, user=None, is_async=True, retry=0, coalesce: dict | None = None
+):
 	"""Executes job in a worker, performs commit/rollback and logs if there is any error"""
 	retval = None
+	job_start = time.monotonic()
 
 	if is_async:
-		frappe.init(site, force=True)
-		frappe.connect()
+		if _warm_contexts:
+			_warm_contexts.init(site)
+		else:
+			frappe.init(site, force=True)
+			frappe.connect()
 		if os.environ.get("CI"):
 			from frappe.tests.utils import toggle_test_mode
 
@@ -257,6 +400,9 @@ def execute_job(site, method, event, job_name, kwargs, user=None, is_async=True,
 	else:
 		method_name = f"{method.__module__}.{method.__qualname__}"
 
+	if coalesce:
+		kwargs = claim_coalesced_job(coalesce, kwargs)
+
 	frappe.local.job = frappe._dict(
 		site=site,
 		method=method_name,
@@ -269,6 +415,9 @@ def execute_job(site, method, event, job_name, kwargs, user=None, is_async=True,
 	for before_job_task in frappe.get_hooks("before_job"):
 		frappe.call(before_job_task, method=method_name, kwargs=kwargs, transaction_type="job")
 
+	if is_async and not retry:
+		record_job_start_latency(time.monotonic() - job_start)
+
 	try:
 		retval = method(**kwargs)
 
@@ -284,7 +433,7 @@ def execute_job(site, method, event, job_name, kwargs, user=None, is_async=True,
 			# 1205 = lock wait timeout
 			# or RetryBackgroundJobError is explicitly raised
 			frappe.job.after_job.reset()
-			frappe.destroy()
+			_destroy_job_context()
 			time.sleep(retry + 1)
 
 			return execute_job(site, method, event, job_name, kwargs, is_async=is_async, retry=retry + 1)
@@ -314,7 +463,117 @@ def execute_job(site, method, event, job_name, kwargs, user=None, is_async=True,
 		frappe.local.job.after_job.run()
 
 		if is_async:
-			frappe.destroy()
+			_destroy_job_context()
+
+
+def _destroy_job_context():
+	if _warm_contexts:
+		_warm_contexts.release()
+	else:
+		frappe.destroy()
+
+
+class WarmSiteContexts:
+	"""Per-site state kept alive across jobs by warm, non-forking workers.
+
+	`frappe.init` is cheap once hooks, module map and site config sit in the process wide client cache;
+	what dominates start up of short jobs is connecting to the database. Connections of recently used
+	sites are kept in an LRU and only request scoped state (`frappe.local`, transaction and value cache
+	of the connection) is reset between jobs.
+	"""
+
+	def __init__(self, maxsize: int = WARM_CONTEXT_MAX_SITES):
+		self.maxsize = maxsize
+		self.databases = OrderedDict()
+
+	def init(self, site: str):
+		frappe.init(site, force=True)
+
+		db = self.databases.pop(site, None)
+		if db and self.is_usable(db):
+			self.reset_db(db)
+			frappe.local.db = db
+			frappe.set_user("Administrator")
+		else:
+			db and db.close()
+			frappe.connect()
+
+		self.databases[site] = frappe.local.db
+		while len(self.databases) > self.maxsize:
+			_site, evicted = self.databases.popitem(last=False)
+			evicted.close()
+
+	def release(self):
+		"""Release `frappe.local` while keeping the DB connection of current site open."""
+		site = getattr(frappe.local, "site", None)
+		db = getattr(frappe.local, "db", None)
+		if db and self.databases.get(site) is db:
+			try:
+				db.rollback()
+			except Exception:
+				self.databases.pop(site)
+				db.close()
+		elif db:
+			db.close()
+
+		release_local(frappe.local)
+
+	@staticmethod
+	def is_usable(db) -> bool:
+		try:
+			db.sql("select 1")
+			return True
+		except Exception:
+			return False
+
+	@staticmethod
+	def reset_db(db):
+		db.value_cache.clear()
+		db.transaction_writes = 0
+		db.auto_commit_on_many_writes = 0
+		db._disable_transaction_control = 0
+		for callbacks in (db.before_commit, db.after_commit, db.before_rollback, db.after_rollback):
+			callbacks.reset()
+
+	def close(self):
+		while self.databases:
+			_site, db = self.databases.popitem()
+			db.close()
+
+
+_warm_contexts: WarmSiteContexts | None = None
+
+
+def enable_warm_contexts(maxsize: int = WARM_CONTEXT_MAX_SITES):
+	"""Keep site contexts warm across jobs executed in this process."""
+	global _warm_contexts
+	_warm_contexts = WarmSiteContexts(maxsize)
+
+
+def _get_job_start_latency_key() -> str:
+	return f"{get_bench_id()}:job_start_latency"
+
+
+def record_job_start_latency(seconds: float):
+	"""Count time spent between a job getting picked and its method getting called in a histogram."""
+	bucket = bisect_left(JOB_START_LATENCY_BUCKETS, seconds * 1000)
+	label = f"le_{JOB_START_LATENCY_BUCKETS[bucket]}ms" if bucket < len(JOB_START_LATENCY_BUCKETS) else "inf"
+	mode = "warm" if _warm_contexts else "cold"
+
+	with suppress(Exception):
+		pipe = get_redis_conn().pipeline(transaction=False)
+		pipe.hincrby(_get_job_start_latency_key(), f"{mode}:{label}", 1)
+		pipe.hincrbyfloat(_get_job_start_latency_key(), f"{mode}:sum", seconds)
+		pipe.execute()
+
+
+def get_job_start_latency_histogram() -> dict[str, dict[str, float]]:
+	"""Return job start latency histogram of warm and cold workers, `{mode: {bucket: count}}`."""
+	histogram = defaultdict(dict)
+	for field, value in get_redis_conn().hgetall(_get_job_start_latency_key()).items():
+		mode, bucket = frappe.safe_decode(field).split(":", 1)
+		histogram[mode][bucket] = float(value)
+	return dict(histogram)
 
 
 def start_worker(
@@ -448,13 +707,20 @@ def start_worker_pool(
 		logging_level = "WARNING"
 
 	# TODO: Make this true by default eventually. It's limited to RQ WorkerPool
-	if sbool(os.environ.get("FRAPPE_BACKGROUND_WORKERS_NOFORK", False)):
+	warm = sbool(os.environ.get("FRAPPE_BACKGROUND_WORKERS_WARM", False))
+	if warm or sys.version_info >= (3, 14):
+		import multiprocessing
+
+		# warm contexts are only inherited by forked workers, spawned ones would start cold
+		multiprocessing.set_start_method("fork", force=True)
+
+	if warm or sbool(os.environ.get("FRAPPE_BACKGROUND_WORKERS_NOFORK", False)):
 		worker_klass = FrappeWorkerNoFork
+		if warm:
+			# Inherited by forked workers, connections are only opened in workers.
+			with frappe.init_site():
+				enable_warm_contexts(cint(frappe.conf.warm_worker_max_sites) or WARM_CONTEXT_MAX_SITES)
 	else:
-		if sys.version_info >= (3, 14):
-			import multiprocessing
-
-			multiprocessing.set_start_method("fork", force=True)
 		worker_klass = FrappeWorker
 
 	pool = WorkerPool(
@@ -652,15 +652,22 @@ def delete_temp_backups(older_than=24):
 	"""
 	Cleans up the backup_link_path directory by deleting older files
 	"""
+	from frappe.utils.parallel_backup import delete_old_parallel_backups
+
 	older_than = cint(frappe.conf.keep_backups_for_hours) or older_than
 	backup_path = get_backup_path()
 	if os.path.exists(backup_path):
 		file_list = os.listdir(get_backup_path())
 		for this_file in file_list:
 			this_file_path = os.path.join(get_backup_path(), this_file)
+			if os.path.isdir(this_file_path):
+				# parallel backups and their file store
+				continue
 			if is_file_old(this_file_path, older_than):
 				os.remove(this_file_path)
 
+	delete_old_parallel_backups(older_than)
+
 
 def is_file_old(file_path, older_than=24) -> bool:
 	"""Return True if file exists and is older than specified hours."""
@@ -0,0 +1,79 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Columnar encoding of tabular responses.
+
+Rows of large list and report results are sent as one JSON object per row, repeating every key, and
+every date or Decimal in them goes through `json_handler` on its own. Clients that send
+`Accept: application/vnd.frappe.columnar+json` to `frappe.desk.reportview.get` or
+`frappe.desk.query_report.run` get rows as `{"keys": [...], "columns": [[...], ...]}` instead:
+
+- each key is sent once, and values of a key are sent together as one list
+- dates, times, timedeltas and Decimals are converted a column at a time, to the same values the JSON
+  response would have had, so that `orjson` doesn't call back into Python for each of them
+- the response is sent with the columnar content type, results that can't be split in columns are
+  sent as usual
+"""
+
+import datetime
+import itertools
+from decimal import Decimal
+
+import frappe
+from frappe.utils.data import format_timedelta
+
+COLUMNAR_MIMETYPE = "application/vnd.frappe.columnar+json"
+
+# Values are converted as `json_handler` would, by exact type
+CONVERTERS = {
+	datetime.datetime: str,
+	datetime.date: str,
+	datetime.time: str,
+	datetime.timedelta: format_timedelta,
+	Decimal: float,
+}
+
+
+def accepts_columnar() -> bool:
+	"""Return True if the client explicitly asked for a columnar response, wildcards don't count."""
+	request = getattr(frappe.local, "request", None)
+	if not request:
+		return False
+
+	return any(mimetype == COLUMNAR_MIMETYPE and quality for mimetype, quality in request.accept_mimetypes)
+
+
+def get_columnar_result(rows: list, keys: list | None = None) -> frappe._dict | None:
+	"""Return `rows` as columns if the client asked for a columnar response, None otherwise."""
+	if not rows or not accepts_columnar():
+		return None
+
+	if columnar := to_columnar(rows, keys):
+		frappe.flags.columnar_response = True
+	return columnar
+
+
+def to_columnar(rows: list, keys: list | None = None) -> frappe._dict | None:
+	"""Return `rows`, all dicts or all lists, as keys and a list of values per key.
+
+	Returns None if rows are mixed and can't be split in columns."""
+	if all(isinstance(row, dict) for row in rows):
+		keys = keys or list(dict.fromkeys(itertools.chain.from_iterable(rows)))
+		columns = [[row.get(key) for row in rows] for key in keys]
+	elif all(isinstance(row, list | tuple) for row in rows):
+		columns = [list(column) for column in itertools.zip_longest(*rows)]
+		keys = keys or list(range(len(columns)))
+	else:
+		return None
+
+	return frappe._dict(keys=keys, columns=[encode_column(column) for column in columns])
+
+
+def encode_column(values: list) -> list:
+	"""Convert values of the type of the first value in a column to what the JSON response would have."""
+	kind = next((type(value) for value in values if value is not None), None)
+	if not (converter := CONVERTERS.get(kind)):
+		return values
+
+	# values of other types are left to `json_handler`
+	return [converter(value) if type(value) is kind else value for value in values]
@@ -61,3 +61,23 @@ def warn(message, category=None, stacklevel=3):
 	from warnings import warn
 
 	warn(message=message, category=category, stacklevel=stacklevel)
+
+
+def get_import_times(importtime_output: str, by_module: bool = False) -> dict[str, int]:
+	"""Return microseconds spent importing each top level package, or each module if `by_module` is
+	set, from the output of `python -X importtime`."""
+	times = {}
+	for line in importtime_output.splitlines():
+		if not line.startswith("import time:"):
+			continue
+
+		self_time, _cumulative, module = line.removeprefix("import time:").split("|", 2)
+		if not self_time.strip().isdigit():
+			# header
+			continue
+
+		module = module.strip()
+		if not by_module:
+			module = module.split(".", 1)[0]
+		times[module] = times.get(module, 0) + int(self_time)
+	return times
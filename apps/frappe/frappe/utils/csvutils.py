@@ -1,6 +1,8 @@
 # Copyright (c) 2015, Frappe Technologies Pvt. Ltd. and Contributors
 # License: MIT. See LICENSE
+import codecs
 import csv
+import itertools
 import json
 from csv import Sniffer
 from io import StringIO
@@ -57,50 +59,85 @@ def read_csv_content(fcontent, use_sniffer: bool = False):
 
 	fcontent = fcontent.encode("utf-8")
 	content = [frappe.safe_decode(line) for line in fcontent.splitlines(True)]
-	dialect = csv.get_dialect("excel")
-
-	if use_sniffer:
-		sniffer = Sniffer()
-		# Don't need to use whole csv, if more than 20 rows, use just first 20
-		sample_content = content[:20] if len(content) > 20 else content
-		# only testing for most common delimiter types, this later can be extended
-		# init default dialect, to avoid lint errors
+	dialect = get_csv_dialect(content, use_sniffer)
+
+	try:
+		return [clean_csv_row(row) for row in csv.reader(content, dialect=dialect)]
+
+	except Exception:
+		frappe.msgprint(_("Not a valid Comma Separated Value (CSV File)"))
+		raise
+
+
+def iter_csv_rows(file_path: str, use_sniffer: bool = False):
+	"""Yield rows of a CSV file one by one, like `read_csv_content` without loading the whole file."""
+	with open(file_path, encoding=guess_file_encoding(file_path), newline="") as f:
+		dialect = get_csv_dialect(list(itertools.islice(f, 20)), use_sniffer)
+		f.seek(0)
+
 		try:
-			# csv by default uses excel dialect, which is not always correct
-			dialect = sniffer.sniff(
-				sample="\n".join(sample_content), delimiters=frappe.flags.delimiter_options
-			)
+			for row in csv.reader(f, dialect=dialect):
+				yield clean_csv_row(row)
 		except csv.Error:
-			# if sniff fails, show alert on user interface. Fall back to use default dialect (excel)
-			frappe.msgprint(
-				_(
-					"Delimiter detection failed. Try to enable custom delimiters and adjust the delimiter options as per your data."
-				),
-				indicator="orange",
-				alert=True,
-			)
+			frappe.msgprint(_("Not a valid Comma Separated Value (CSV File)"))
+			raise
+
 
+def guess_file_encoding(file_path: str, sample_size: int = 1024 * 1024) -> str:
+	"""Return the first of `FILE_ENCODING_OPTIONS` which can decode the beginning of the file."""
+	with open(file_path, "rb") as f:
+		sample = f.read(sample_size)
+
+	for encoding in FILE_ENCODING_OPTIONS:
+		try:
+			# the sample may end in the middle of a multi-byte character
+			codecs.getincrementaldecoder(encoding)().decode(sample, final=len(sample) < sample_size)
+			return encoding
+		except UnicodeDecodeError:
+			continue
+
+	frappe.msgprint(
+		_("Unknown file encoding. Tried to use: {0}").format(", ".join(FILE_ENCODING_OPTIONS)),
+		raise_exception=True,
+	)
+
+
+def get_csv_dialect(content: list[str], use_sniffer: bool = False):
+	if not use_sniffer:
+		return csv.get_dialect("excel")
+
+	sniffer = Sniffer()
+	# Don't need to use whole csv, if more than 20 rows, use just first 20
+	sample_content = content[:20] if len(content) > 20 else content
+	# only testing for most common delimiter types, this later can be extended
 	try:
-		rows = []
-		for row in csv.reader(content, dialect=dialect):
-			r = []
-			for val in row:
-				# decode everything
-				val = val.strip()
+		# csv by default uses excel dialect, which is not always correct
+		return sniffer.sniff(sample="\n".join(sample_content), delimiters=frappe.flags.delimiter_options)
+	except csv.Error:
+		# if sniff fails, show alert on user interface. Fall back to use default dialect (excel)
+		frappe.msgprint(
+			_(
+				"Delimiter detection failed. Try to enable custom delimiters and adjust the delimiter options as per your data."
+			),
+			indicator="orange",
+			alert=True,
+		)
+		return csv.get_dialect("excel")
 
-				if val == "":
-					# reason: in maraidb strict config, one cannot have blank strings for non string datatypes
-					r.append(None)
-				else:
-					r.append(val)
 
-			rows.append(r)
+def clean_csv_row(row: list[str]) -> list[str | None]:
+	r = []
+	for val in row:
+		# decode everything
+		val = val.strip()
 
-		return rows
+		if val == "":
+			# reason: in maraidb strict config, one cannot have blank strings for non string datatypes
+			r.append(None)
+		else:
+			r.append(val)
 
-	except Exception:
-		frappe.msgprint(_("Not a valid Comma Separated Value (CSV File)"))
-		raise
+	return r
 
 
 @frappe.whitelist()
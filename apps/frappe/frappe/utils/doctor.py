@@ -133,6 +133,9 @@ def doctor(site=None):
 
 		frappe.destroy()
 
+	print_fair_share_metrics(site)
+	print_job_start_latency()
+
 	# TODO improve this
 	print("Workers online:", workers_online)
 	print(f"-----{site} Jobs-----")
@@ -148,6 +151,45 @@ def doctor(site=None):
 	return True
 
 
+def print_fair_share_metrics(site=None):
+	from frappe.utils.fair_scheduler import get_fair_share_scheduler, is_fair_share_enabled
+
+	with frappe.init_site(site):
+		if not is_fair_share_enabled():
+			return
+		metrics = get_fair_share_scheduler().get_backlog_metrics()
+
+	print("-----Fair share scheduler-----")
+	for s, m in sorted(metrics.items()):
+		if site and s != site:
+			continue
+		print(
+			f"{s}: in flight: {m.in_flight}, backlog: {m.backlog}, weight: {m.weight}, "
+			f"credit: {m.deficit:.1f}s, average job cost: {m.average_job_cost:.1f}s"
+		)
+
+
+def print_job_start_latency():
+	from frappe.utils.background_jobs import JOB_START_LATENCY_BUCKETS, get_job_start_latency_histogram
+
+	with frappe.init_site():
+		histogram = get_job_start_latency_histogram()
+
+	if not histogram:
+		return
+
+	print("-----Job start latency-----")
+	buckets = [f"le_{b}ms" for b in JOB_START_LATENCY_BUCKETS] + ["inf"]
+	for mode, counts in sorted(histogram.items()):
+		total = sum(counts.get(b, 0) for b in buckets)
+		if not total:
+			continue
+		print(f"{mode} workers: {int(total)} jobs, average {counts.get('sum', 0) / total * 1000:.1f}ms")
+		for bucket in buckets:
+			if count := counts.get(bucket):
+				print(f"  {bucket}: {int(count)}")
+
+
 def pending_jobs(site=None):
 	print("-----Pending Jobs-----")
 	pending_jobs = get_pending_jobs(site)
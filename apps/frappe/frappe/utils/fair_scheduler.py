@@ -0,0 +1,174 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Fair-share admission of scheduled jobs across the sites of a bench.
+
+All sites of a bench enqueue their scheduled jobs into the same RQ queues, so a site with heavy jobs
+can keep workers busy while jobs of other sites wait. When `scheduler_fair_share` is set in
+common_site_config.json, each scheduler tick admits due jobs using deficit weighted round-robin:
+
+- every site earns `scheduler_fair_share_quantum` seconds of job time per tick, multiplied by its
+  `scheduler_weight` (site config, defaults to 1)
+- each admitted job spends its estimated cost, a moving average of its past run durations
+- due jobs that don't fit are left for the next tick, they are still due then
+- sites with fewer jobs in flight (relative to their weight) are visited first
+
+All state lives in the RQ redis instance, see `get_backlog_metrics` for per-site numbers.
+"""
+
+import random
+import time
+
+import frappe
+from frappe.utils import cint, flt
+
+KEY_PREFIX = "scheduler:fair_share"
+DEFAULT_QUANTUM = 60
+DEFAULT_JOB_COST = 1.0
+# Weight of the latest run while updating average job cost
+COST_SMOOTHING = 0.3
+# In-flight jobs older than this are assumed lost (killed worker, flushed queue)
+IN_FLIGHT_TTL = 6 * 60 * 60
+# A site can't borrow more than these many quanta of future time
+MAX_DEBT_QUANTA = 10
+
+
+def is_fair_share_enabled() -> bool:
+	return bool(cint(frappe.get_conf().scheduler_fair_share))
+
+
+def get_fair_share_scheduler() -> "FairShareScheduler":
+	from frappe.utils.background_jobs import get_redis_conn
+
+	conf = frappe.get_conf()
+	return FairShareScheduler(
+		get_redis_conn(),
+		quantum=flt(conf.scheduler_fair_share_quantum) or DEFAULT_QUANTUM,
+		max_site_occupancy=cint(conf.scheduler_max_jobs_per_site),
+	)
+
+
+class FairShareScheduler:
+	def __init__(self, connection, quantum: float = DEFAULT_QUANTUM, max_site_occupancy: int = 0):
+		"""
+		:param connection: redis connection used to store scheduler state.
+		:param quantum: seconds of estimated job time a site with weight 1 earns every tick.
+		:param max_site_occupancy: maximum jobs a site can have in flight, 0 for no limit.
+		"""
+		self.connection = connection
+		self.quantum = quantum
+		self.max_site_occupancy = max_site_occupancy
+
+	def key(self, *parts: str) -> str:
+		return ":".join((KEY_PREFIX, *parts))
+
+	def order_sites(self, sites: list[str]) -> list[str]:
+		"""Return sites ordered by their weighted occupancy, least loaded first."""
+		weights = self.get_weights()
+		sites = list(sites)
+		random.shuffle(sites)  # tie breaker
+		return sorted(sites, key=lambda site: self.get_occupancy(site) / weights.get(site, 1.0))
+
+	def admit(self, site: str, due_jobs: list[str], weight: float = 1.0) -> list[str]:
+		"""Return subset of `due_jobs` which should be enqueued now for `site`.
+
+		:param due_jobs: names of Scheduled Job Types which are due, in preferred order.
+		:param weight: share of this site relative to other sites.
+		"""
+		weight = weight if weight > 0 else 1.0
+		self.connection.hset(self.key("weight"), site, weight)
+
+		if not due_jobs:
+			# idle sites don't accumulate credit, as in deficit round-robin
+			self.connection.hset(self.key("deficit"), site, 0)
+			self.connection.hset(self.key("backlog"), site, 0)
+			return []
+
+		occupancy = self.get_occupancy(site)
+		deficit = flt(self.connection.hget(self.key("deficit"), site)) + self.quantum * weight
+		costs = self.get_costs(site, due_jobs)
+
+		admitted = []
+		for job in due_jobs:
+			if self.max_site_occupancy and occupancy + len(admitted) >= self.max_site_occupancy:
+				break
+
+			# an idle site with some credit always gets one job, so jobs costlier than a quantum can't starve
+			if costs[job] > deficit and (admitted or occupancy or deficit <= 0):
+				continue
+
+			admitted.append(job)
+			deficit -= costs[job]
+
+		backlog = len(due_jobs) - len(admitted)
+		if not backlog:
+			# unused credit is not carried over once everything due is admitted, debt is
+			deficit = min(deficit, 0)
+		deficit = max(deficit, -self.quantum * weight * MAX_DEBT_QUANTA)
+		self.connection.hset(self.key("deficit"), site, deficit)
+		self.connection.hset(self.key("backlog"), site, backlog)
+		return admitted
+
+	def job_enqueued(self, site: str, job: str):
+		self.connection.zadd(self.key("in_flight", site), {job: time.time()})
+
+	def job_finished(self, site: str, job: str, duration: float):
+		self.connection.zrem(self.key("in_flight", site), job)
+
+		field = f"{site}|{job}"
+		previous = self.connection.hget(self.key("cost"), field)
+		if previous is None:
+			cost = duration
+		else:
+			cost = (1 - COST_SMOOTHING) * flt(previous) + COST_SMOOTHING * duration
+		self.connection.hset(self.key("cost"), field, cost)
+
+	def get_occupancy(self, site: str) -> int:
+		key = self.key("in_flight", site)
+		self.connection.zremrangebyscore(key, 0, time.time() - IN_FLIGHT_TTL)
+		return cint(self.connection.zcard(key))
+
+	def get_costs(self, site: str, jobs: list[str]) -> dict[str, float]:
+		values = self.connection.hmget(self.key("cost"), [f"{site}|{job}" for job in jobs])
+		return {
+			job: DEFAULT_JOB_COST if value is None else flt(value)
+			for job, value in zip(jobs, values, strict=True)
+		}
+
+	def get_weights(self) -> dict[str, float]:
+		return {
+			frappe.safe_decode(site): flt(weight)
+			for site, weight in self.connection.hgetall(self.key("weight")).items()
+		}
+
+	def get_backlog_metrics(self) -> dict[str, dict]:
+		"""Return per-site jobs in flight, jobs left due in the last tick, credit and average job cost."""
+		weights = self.get_weights()
+		deficits = self.connection.hgetall(self.key("deficit"))
+		backlogs = self.connection.hgetall(self.key("backlog"))
+
+		costs: dict[str, list[float]] = {}
+		for field, cost in self.connection.hgetall(self.key("cost")).items():
+			site, _job = frappe.safe_decode(field).split("|", 1)
+			costs.setdefault(site, []).append(flt(cost))
+
+		metrics = {}
+		for site, weight in weights.items():
+			site_costs = costs.get(site) or [DEFAULT_JOB_COST]
+			metrics[site] = frappe._dict(
+				weight=weight,
+				in_flight=self.get_occupancy(site),
+				backlog=cint(backlogs.get(site.encode())),
+				deficit=flt(deficits.get(site.encode())),
+				average_job_cost=sum(site_costs) / len(site_costs),
+			)
+		return metrics
+
+
+@frappe.whitelist()
+def get_site_backlog_metrics():
+	"""Return fair-share scheduler metrics of the current site."""
+	frappe.only_for("System Manager")
+	if not is_fair_share_enabled():
+		return {}
+	return get_fair_share_scheduler().get_backlog_metrics().get(frappe.local.site, {})
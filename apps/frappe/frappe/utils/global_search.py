@@ -4,6 +4,8 @@
 import json
 import os
 import re
+import time
+import zlib
 
 import redis
 
@@ -14,6 +16,11 @@ from frappe.utils.data import cstr
 from frappe.utils.html_utils import unescape_html
 
 HTML_TAGS_PATTERN = re.compile(r"(?s)<[\s]*(script|style).*?</\1>")
+GLOBAL_SEARCH_FIELDS = ("doctype", "name", "content", "published", "title", "route")
+# Queued documents written to __global_search in one query
+GLOBAL_SEARCH_SYNC_BATCH_SIZE = 1000
+# Records read at once while rebuilding a doctype
+REBUILD_PAGE_SIZE = 5000
 
 
 def setup_global_search_table():
@@ -102,54 +109,76 @@ def rebuild_for_doctype(doctype):
 
 	parent_search_fields = meta.get_global_search_fields()
 	fieldnames = get_selected_fields(meta, parent_search_fields)
+	filters = _get_filters()
 
-	# Get all records from parent doctype table
-	all_records = frappe.get_all(doctype, fields=fieldnames, filters=_get_filters())
-
-	# Children data
-	all_children, child_search_fields = get_children_data(doctype, meta)
-	all_contents = []
-
-	for doc in all_records:
-		content = []
-		for field in parent_search_fields:
-			value = doc.get(field.fieldname)
-			if value:
-				content.append(get_formatted_value(value, field))
-
-		# get children data
-		for child_doctype, records in all_children.get(doc.name, {}).items():
-			for field in child_search_fields.get(child_doctype):
-				for r in records:
-					if r.get(field.fieldname):
-						content.append(get_formatted_value(r.get(field.fieldname), field))
-
-		if content:
-			# if doctype published in website, push title, route etc.
-			published = 0
-			title, route = "", ""
-			try:
-				if hasattr(get_controller(doctype), "is_website_published") and meta.allow_guest_to_view:
+	try:
+		controller = get_controller(doctype)
+		check_published = hasattr(controller, "is_website_published") and meta.allow_guest_to_view
+	except ImportError:
+		# some doctypes has been deleted via future patch, hence controller does not exists
+		check_published = False
+
+	# Read records page by page in order of name, with children of the page's records only,
+	# so that large tables are never loaded in memory at once
+	last_name = None
+	while True:
+		page_filters = filters.copy()
+		if last_name is not None:
+			page_filters.name = [">", last_name]
+
+		records = frappe.get_all(
+			doctype,
+			fields=fieldnames,
+			filters=page_filters,
+			order_by="name asc",
+			limit_page_length=REBUILD_PAGE_SIZE,
+		)
+		if not records:
+			break
+
+		last_name = records[-1].name
+		all_children, child_search_fields = get_children_data(
+			doctype, meta, parents=[doc.name for doc in records]
+		)
+		all_contents = []
+
+		for doc in records:
+			content = []
+			for field in parent_search_fields:
+				value = doc.get(field.fieldname)
+				if value:
+					content.append(get_formatted_value(value, field))
+
+			# get children data
+			for child_doctype, child_records in all_children.get(doc.name, {}).items():
+				for field in child_search_fields.get(child_doctype):
+					for r in child_records:
+						if r.get(field.fieldname):
+							content.append(get_formatted_value(r.get(field.fieldname), field))
+
+			if content:
+				# if doctype published in website, push title, route etc.
+				published = 0
+				title, route = "", ""
+				if check_published:
 					d = frappe.get_doc(doctype, doc.name)
 					published = 1 if d.is_website_published() else 0
 					title = d.get_title()
 					route = d.get("route")
-			except ImportError:
-				# some doctypes has been deleted via future patch, hence controller does not exists
-				pass
-
-			all_contents.append(
-				{
-					"doctype": frappe.db.escape(doctype),
-					"name": frappe.db.escape(doc.name),
-					"content": frappe.db.escape(" ||| ".join(content or "")),
-					"published": published,
-					"title": frappe.db.escape((title or "")[: int(frappe.db.VARCHAR_LEN)]),
-					"route": frappe.db.escape((route or "")[: int(frappe.db.VARCHAR_LEN)]),
-				}
-			)
-	if all_contents:
-		insert_values_for_multiple_docs(all_contents)
+
+				all_contents.append(
+					{
+						"doctype": frappe.db.escape(doctype),
+						"name": frappe.db.escape(doc.name),
+						"content": frappe.db.escape(" ||| ".join(content or "")),
+						"published": published,
+						"title": frappe.db.escape((title or "")[: int(frappe.db.VARCHAR_LEN)]),
+						"route": frappe.db.escape((route or "")[: int(frappe.db.VARCHAR_LEN)]),
+					}
+				)
+
+		if all_contents:
+			insert_values_for_multiple_docs(all_contents)
 
 
 def delete_global_search_records_for_doctype(doctype):
@@ -169,9 +198,9 @@ def get_selected_fields(meta, global_search_fields):
 	return fieldnames
 
 
-def get_children_data(doctype, meta):
+def get_children_data(doctype, meta, parents=None):
 	"""
-	Get all records from all the child tables of a doctype
+	Get all records from all the child tables of a doctype, only of given `parents` if passed
 
 	all_children = {
 	        "parent1": {
@@ -194,11 +223,11 @@ def get_children_data(doctype, meta):
 		if search_fields:
 			child_search_fields.setdefault(child.options, search_fields)
 			child_fieldnames = get_selected_fields(child_meta, search_fields)
-			child_records = frappe.get_all(
-				child.options,
-				fields=child_fieldnames,
-				filters={"docstatus": ["!=", 2], "parenttype": doctype},
-			)
+			filters = {"docstatus": ["!=", 2], "parenttype": doctype}
+			if parents is not None:
+				filters["parent"] = ["in", parents]
+
+			child_records = frappe.get_all(child.options, fields=child_fieldnames, filters=filters)
 
 			for record in child_records:
 				all_children.setdefault(record.parent, frappe._dict()).setdefault(child.options, []).append(
@@ -368,13 +397,56 @@ def get_formatted_value(value, field):
 	return field.label + " : " + strip_html_tags(str(value))
 
 
-def sync_global_search():
+def sync_global_search(shard: int | None = None):
 	"""
 	Inserts / updates values from `global_search_queue` to __global_search.
 	This is called via job scheduler
-	:param flags:
-	:return:
+
+	Queued documents are keyed by (doctype, name), so a document changed many times between two
+	syncs is written once. If `global_search_queue_shards` is set in site config, the queue is split
+	in shards by document and each shard is synced by its own background job.
+
+	:param shard: sync only this shard of the queue
 	"""
+	shard_count = get_queue_shard_count()
+	if shard is None and shard_count > 1 and not frappe.in_test:
+		for i in range(shard_count):
+			frappe.enqueue(sync_global_search, shard=i, job_id=f"sync_global_search||{i}", deduplicate=True)
+	else:
+		for i in range(shard_count) if shard is None else [shard]:
+			sync_queue_shard(i)
+
+	if shard is None:
+		sync_legacy_queue()
+
+
+def sync_queue_shard(shard: int):
+	queue, values_key = get_queue_keys(shard)
+	synced, lag = 0, 0.0
+
+	while pending := frappe.cache.zrange(queue, 0, GLOBAL_SEARCH_SYNC_BATCH_SIZE - 1, withscores=True):
+		keys = [key for key, _queued_at in pending]
+		lag = max(lag, time.time() - pending[0][1])
+
+		# values updated after reading keys are picked up here, the key isn't queued again for them
+		pipe = frappe.cache.pipeline()
+		pipe.hmget(values_key, keys)
+		pipe.hdel(values_key, *keys)
+		pipe.zrem(queue, *keys)
+		values = pipe.execute()[0]
+
+		values = [json.loads(value) for value in values if value]
+		sync_values([tuple(value[field] for field in GLOBAL_SEARCH_FIELDS) for value in values])
+		synced += len(values)
+
+	if synced:
+		frappe.cache.set_value(
+			f"global_search_last_sync:{shard}", {"synced_at": time.time(), "synced": synced, "lag": lag}
+		)
+
+
+def sync_legacy_queue():
+	"""Sync values queued in the list used before the queue was keyed by document."""
 	from itertools import islice
 
 	def get_search_queue_item_generator():
@@ -382,7 +454,7 @@ def sync_global_search():
 			yield value
 
 	item_generator = get_search_queue_item_generator()
-	while search_items := tuple(islice(item_generator, 1000)):
+	while search_items := tuple(islice(item_generator, GLOBAL_SEARCH_SYNC_BATCH_SIZE)):
 		values = _get_deduped_search_item_values(search_items)
 		sync_values(values)
 
@@ -403,6 +475,9 @@ def _get_deduped_search_item_values(items):
 def sync_values(values: list):
 	from pypika.terms import Values
 
+	if not values:
+		return
+
 	GlobalSearch = frappe.qb.Table("__global_search")
 	conflict_fields = ["content", "published", "title", "route"]
 
@@ -422,16 +497,51 @@ def sync_values(values: list):
 	query.run()
 
 
+def get_queue_shard_count() -> int:
+	return max(cint(frappe.conf.global_search_queue_shards), 1)
+
+
+def get_queue_keys(shard: int) -> tuple[str, str]:
+	"""Return keys of the sorted set of queued documents (scored by time of queueing) and the hash of
+	their latest values for given shard."""
+	queue = frappe.cache.make_key(f"global_search_queue:{shard}")
+	return queue, f"{queue}:values"
+
+
 def sync_value_in_queue(value):
+	key = f"{value['doctype']}||{value['name']}"
+	queue, values_key = get_queue_keys(zlib.crc32(key.encode()) % get_queue_shard_count())
+
 	try:
-		# append to search queue if connected
-		frappe.cache.lpush("global_search_queue", json.dumps(value))
+		# queue if connected, a document already in queue keeps its place and only its value is replaced
+		pipe = frappe.cache.pipeline()
+		pipe.zadd(queue, {key: time.time()}, nx=True)
+		pipe.hset(values_key, key, json.dumps(value))
+		pipe.execute()
 	except redis.exceptions.ConnectionError:
 		# not connected, sync directly
 		assert not frappe.flags.in_test, "Should not fail silently in tests"
 		sync_value(value)
 
 
+@frappe.whitelist()
+def get_indexing_lag():
+	"""Return number of documents waiting to be indexed, age of the oldest one in seconds and stats
+	of the last sync of each shard."""
+	frappe.only_for("System Manager")
+
+	pending, lag, last_sync = 0, 0.0, []
+	for shard in range(get_queue_shard_count()):
+		queue, _values_key = get_queue_keys(shard)
+		pending += frappe.cache.zcard(queue)
+		if oldest := frappe.cache.zrange(queue, 0, 0, withscores=True):
+			lag = max(lag, time.time() - oldest[0][1])
+		last_sync.append(frappe.cache.get_value(f"global_search_last_sync:{shard}"))
+
+	pending += frappe.cache.llen("global_search_queue")
+	return frappe._dict(pending=pending, lag=lag, last_sync=last_sync)
+
+
 def sync_value(value: dict):
 	"""
 	Sync a given document to global search
@@ -0,0 +1,90 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+On-disk cache of merged app hooks.
+
+Outside developer mode, hooks are cached in Redis once loaded, but every process that finds them
+missing there, e.g. a worker started after `bench clear-cache`, imports the `hooks.py` of every
+installed app and everything those import. Merged hooks are kept as a pickle in `sites/.hooks_cache`
+so that such processes can skip importing them:
+
+- the file is named after a hash of installed apps, their versions and the size and modification time
+  of their `hooks.py`, so updating or editing an app starts a new file and sites with the same apps
+  share one
+- hooks modules already imported by the process are used as they are, they may have been changed at
+  runtime
+- files older than `STALE_AFTER` are removed when a new one is written, a removed file that was
+  still in use is written again
+
+Changes to modules imported by `hooks.py` aren't noticed until the app version changes or the cache is
+cleared, see `clear_hooks_cache`.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import time
+
+import frappe
+
+CACHE_DIR = ".hooks_cache"
+STALE_AFTER = 7 * 24 * 60 * 60  # seconds
+
+
+def load_app_hooks() -> dict:
+	"""Return merged hooks of installed apps, from the cache if they are unchanged."""
+	apps = frappe.get_installed_apps(_ensure_on_bench=True)
+	if any(f"{app}.hooks" in sys.modules for app in apps):
+		return frappe._load_app_hooks()
+
+	try:
+		path = get_cache_path(apps)
+	except Exception:
+		return frappe._load_app_hooks()
+
+	try:
+		with open(path, "rb") as f:
+			return pickle.load(f)
+	except Exception:
+		# missing, or written by an incompatible Python version
+		pass
+
+	hooks = frappe._load_app_hooks()
+	try:
+		write_cache(path, hooks)
+	except Exception:
+		# hooks are loaded either way, the next process will try again
+		pass
+	return hooks
+
+
+def get_cache_path(apps: list[str]) -> str:
+	key = hashlib.sha1(usedforsecurity=False)
+	key.update(sys.version.encode())
+	for app in apps:
+		stat = os.stat(frappe.get_app_path(app, "hooks.py"))
+		version = getattr(frappe.get_module(app), "__version__", None)
+		key.update(f"{app}:{version}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+
+	return os.path.join(frappe.local.sites_path, CACHE_DIR, f"{key.hexdigest()}.pickle")
+
+
+def write_cache(path: str, hooks: dict):
+	cache_dir = os.path.dirname(path)
+	os.makedirs(cache_dir, exist_ok=True)
+
+	temp_path = f"{path}.{os.getpid()}.tmp"
+	with open(temp_path, "wb") as f:
+		pickle.dump(hooks, f, protocol=pickle.HIGHEST_PROTOCOL)
+	os.replace(temp_path, path)
+
+	stale_before = time.time() - STALE_AFTER
+	for entry in os.scandir(cache_dir):
+		if entry.path != path and entry.stat().st_mtime < stale_before:
+			os.remove(entry.path)
+
+
+def clear_hooks_cache():
+	shutil.rmtree(os.path.join(frappe.local.sites_path, CACHE_DIR), ignore_errors=True)
@@ -59,6 +59,21 @@ def _get_jenv():
 	return jenv
 
 
+def get_template_from_string(source: str):
+	"""Return template for `source`, compiling it only once per site in a process.
+
+	Same as `get_jenv().from_string(source)`, for templates like print formats and letter heads which
+	are rendered again and again."""
+	jenv = get_jenv()
+	return jenv.template_class.from_code(jenv, _compile_template(source), jenv.make_globals(None), None)
+
+
+@site_cache(ttl=10 * 60, maxsize=256)
+def _compile_template(source: str):
+	# compiled code depends on filters and tests of the environment, which apps of each site add to
+	return get_jenv().compile(source)
+
+
 def get_template(path):
 	jenv = get_jenv()
 	# Note: jenv globals are reapplied here because we don't have true "global"/"local" separation.
@@ -110,7 +125,6 @@ def render_template(template, context=None, is_path=None, safe_render=True):
 		return ""
 
 	from jinja2 import TemplateError
-	from jinja2.sandbox import SandboxedEnvironment
 
 	from frappe import _, get_traceback, throw
 
@@ -122,11 +136,10 @@ def render_template(template, context=None, is_path=None, safe_render=True):
 			is_path = True
 			compiled_template = get_template(template)
 		else:
-			jenv: SandboxedEnvironment = get_jenv()
 			if safe_render and ".__" in template:
 				throw(_("Illegal template"))
 
-			compiled_template = jenv.from_string(template)
+			compiled_template = get_template_from_string(template)
 	except TemplateError:
 		import html
 
@@ -1,3 +1,4 @@
+import importlib
 import importlib.util
 import sys
 
@@ -33,3 +34,34 @@ def lazy_import(name, package=None):
 	sys.modules[name] = module
 	loader.exec_module(module)
 	return module
+
+
+def lazy_attributes(module_globals: dict, attributes: dict[str, str]):
+	"""Return a module level `__getattr__` (PEP 562) importing given attributes on first access.
+
+	`attributes` maps attribute names to the module defining them. Once imported, an attribute is
+	stored in `module_globals`, so later lookups don't go through `__getattr__`.
+	$ cat mod.py
+	from frappe.utils.lazy_loader import lazy_attributes
+	__getattr__ = lazy_attributes(globals(), {"Template": "jinja2"})
+	$ python -i
+	>>> import mod  # jinja2 is not loaded
+	>>> mod.Template  # jinja2 is loaded on accessing attribute
+	<class 'jinja2.environment.Template'>
+
+	Names are only looked up this way from outside the module, code in the module must import them
+	itself.
+	"""
+	module_name = module_globals["__name__"]
+
+	def __getattr__(name):
+		try:
+			source = attributes[name]
+		except KeyError:
+			raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+
+		value = getattr(importlib.import_module(source), name)
+		module_globals[name] = value
+		return value
+
+	return __getattr__
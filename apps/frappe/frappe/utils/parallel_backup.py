@@ -0,0 +1,563 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Parallel site backups.
+
+`bench backup` pipes a single database dump through gzip and tars files serially. A parallel backup is
+a directory instead:
+
+	{date}-{site}-parallel/
+		manifest.json
+		site_config_backup.json
+		tables/{table}.sql.zst
+
+- every table is dumped by its own mariadb-dump / pg_dump process (in Python for SQLite), `workers` of
+  them at a time, each compressed with zstd (gzip if zstd isn't installed)
+- manifest.json lists every file with its size and sha256, restore verifies them before starting
+- site files are kept in a content-addressed `file-store` shared by all parallel backups of the site,
+  named by their content hash (`File.content_hash` when known), so a backup only copies new files
+
+Tables are dumped in separate transactions, so unlike a regular backup the dump is not one snapshot
+across tables. Restore replaces the tables present in the backup in place, other tables are left as is.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from shutil import which
+
+import frappe
+from frappe import _
+from frappe.core.doctype.file.utils import get_file_content_hash
+from frappe.utils import cint, get_file_size, now, now_datetime
+from frappe.utils.backups import BackupGenerator, delete_temp_backups, get_backup_path, is_file_old
+
+MANIFEST_VERSION = 1
+FILE_STORE = "file-store"
+DEFAULT_WORKERS = 4
+CHUNK_SIZE = 1024 * 1024
+FTS_SHADOW_TABLE_SUFFIXES = ("_data", "_idx", "_content", "_docsize", "_config")
+
+
+class BackupChecksumError(frappe.ValidationError):
+	pass
+
+
+def get_workers(workers: int | None = None) -> int:
+	return (
+		cint(workers)
+		or cint(frappe.conf.backup_parallel_workers)
+		or min(os.cpu_count() or 1, DEFAULT_WORKERS)
+	)
+
+
+def get_compression() -> dict:
+	"""Return file extension and commands to compress and decompress stdin to stdout."""
+	if zstd := which("zstd"):
+		return {
+			"extension": "zst",
+			"compress": [zstd, "-q", "-c"],
+			"decompress": [zstd, "-q", "-d", "-c"],
+		}
+
+	if gzip := which("gzip"):
+		return {"extension": "gz", "compress": [gzip, "-c"], "decompress": [gzip, "-d", "-c"]}
+
+	frappe.throw(_("zstd or gzip is required to take a backup."), exc=frappe.ExecutableNotFound)
+
+
+def get_file_checksum(path: str) -> str:
+	sha256 = hashlib.sha256()
+	with open(path, "rb") as f:
+		while chunk := f.read(CHUNK_SIZE):
+			sha256.update(chunk)
+	return sha256.hexdigest()
+
+
+def run_pipeline(producer: list[str], consumer: list[str], stdout=None, stdin=None):
+	"""Run `producer | consumer` at a lower priority and raise if either of them fails."""
+	# `preexec_fn` isn't safe to use from worker threads, `nice` lowers the priority instead
+	if nice := which("nice"):
+		producer, consumer = [nice, "-n", "10", *producer], [nice, "-n", "10", *consumer]
+
+	first = subprocess.Popen(producer, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+	second = subprocess.Popen(consumer, stdin=first.stdout, stdout=stdout, stderr=subprocess.PIPE)
+	first.stdout.close()  # so that the producer gets SIGPIPE if the consumer exits
+	_out, second_err = second.communicate()
+	first_err = first.stderr.read()
+	first.wait()
+
+	for process, err in ((first, first_err), (second, second_err)):
+		if process.returncode:
+			raise frappe.CommandFailedError("Command failed", "", err.decode(errors="replace"))
+
+
+class ParallelBackupGenerator(BackupGenerator):
+	"""Take a backup as a directory of per-table dumps, see module docstring."""
+
+	def __init__(self, *args, workers: int | None = None, **kwargs):
+		super().__init__(*args, **kwargs)
+		self.workers = get_workers(workers)
+		self.compression = get_compression()
+		self.manifest = frappe._dict(
+			version=MANIFEST_VERSION,
+			site=frappe.local.site,
+			created=now(),
+			db_type=self.db_type,
+			frappe_version=frappe.__version__,
+			compression=self.compression["extension"],
+			tables={},
+			files={},
+		)
+
+	def get_backup(self, older_than=24, ignore_files=False, force=False):
+		if frappe.get_system_settings("encrypt_backup"):
+			frappe.throw(_("Parallel backups can't be encrypted yet, take a regular backup instead."))
+
+		backup_root = self.backup_path or get_backup_path()
+		self.backup_dir = os.path.join(
+			backup_root, f"{now_datetime().strftime('%Y%m%d_%H%M%S')}-{self.site_slug}-parallel"
+		)
+		self.file_store = os.path.join(backup_root, FILE_STORE)
+		os.makedirs(os.path.join(self.backup_dir, "tables"))
+		self.add_to_rollback(lambda: shutil.rmtree(self.backup_dir, ignore_errors=True))
+
+		self.backup_path_db = self.backup_dir
+		self.backup_path_conf = os.path.join(self.backup_dir, "site_config_backup.json")
+		self.copy_site_config()
+
+		self.take_dump()
+		if not ignore_files:
+			self.backup_files()
+
+		self.manifest.partial = bool(self.partial)
+		with open(os.path.join(self.backup_dir, "manifest.json"), "w") as f:
+			json.dump(self.manifest, f, indent=1, sort_keys=True)
+
+	def get_tables_to_backup(self) -> list[str]:
+		tables = self.backup_includes or [t for t in self._existing_tables if t not in self.backup_excludes]
+		if self.db_type == "sqlite":
+			tables = get_sqlite_tables_to_backup(frappe.db, tables)
+
+		# start with the largest tables so that they don't end up running alone at the end
+		sizes = get_table_sizes(self.db_type)
+		return sorted(tables, key=lambda table: sizes.get(table, 0), reverse=True)
+
+	def take_dump(self):
+		tables = self.get_tables_to_backup()
+		if self.db_type == "sqlite":
+			db_path = frappe.get_site_path("db", f"{self.db_name}.db")
+			jobs = [(self.dump_sqlite_table, (table, db_path)) for table in tables]
+		else:
+			# commands are built here, site context isn't available in worker threads
+			jobs = [(self.dump_table, (table, self.get_dump_command(table))) for table in tables]
+
+		with ThreadPoolExecutor(max_workers=self.workers) as executor:
+			futures = [executor.submit(dump, *args) for dump, args in jobs]
+			for table, future in zip(tables, futures, strict=True):
+				path = future.result()
+				self.manifest.tables[table] = {
+					"file": os.path.relpath(path, self.backup_dir),
+					"size": os.path.getsize(path),
+					"sha256": get_file_checksum(path),
+				}
+				if self.verbose:
+					print(f"Dumped {table} ({get_file_size(path, format=True)})")
+
+	def get_dump_path(self, table: str) -> str:
+		return os.path.join(self.backup_dir, "tables", f"{table}.sql.{self.compression['extension']}")
+
+	def get_dump_command(self, table: str) -> list[str]:
+		from frappe.database import get_command
+
+		if self.db_type == "postgres":
+			extra = [f'--table=public."{table}"', "--clean", "--if-exists"]
+		else:
+			extra = [table]
+
+		bin, args, bin_name = get_command(
+			socket=self.db_socket,
+			host=self.db_host,
+			port=self.db_port,
+			user=self.user,
+			password=self.password,
+			db_name=self.db_name,
+			extra=extra,
+			dump=True,
+		)
+		if not bin:
+			frappe.throw(
+				_("{} not found in PATH! This is required to take a backup.").format(bin_name),
+				exc=frappe.ExecutableNotFound,
+			)
+		return [bin, *args]
+
+	def dump_table(self, table: str, command: list[str]) -> str:
+		path = self.get_dump_path(table)
+		with open(path, "wb") as f:
+			run_pipeline(command, self.compression["compress"], stdout=f)
+		return path
+
+	def dump_sqlite_table(self, table: str, db_path: str) -> str:
+		path = self.get_dump_path(table)
+
+		with open(path, "wb") as f:
+			compressor = subprocess.Popen(self.compression["compress"], stdin=subprocess.PIPE, stdout=f)
+			# each thread reads through its own connection
+			conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+			try:
+				for statement in iter_sqlite_table_dump(conn, table):
+					compressor.stdin.write(statement.encode() + b"\n")
+			finally:
+				conn.close()
+				compressor.stdin.close()
+				compressor.wait()
+
+		if compressor.returncode:
+			raise frappe.CommandFailedError(f"Compressing dump of {table} failed", "", "")
+		return path
+
+	def backup_files(self):
+		"""Copy site files missing from the file store and record them in the manifest."""
+		site_path = frappe.get_site_path()
+		known_hashes = {
+			file_url: content_hash
+			for file_url, content_hash in frappe.get_all(
+				"File",
+				filters={"is_folder": 0, "content_hash": ("is", "set")},
+				fields=["file_url", "content_hash"],
+				as_list=True,
+			)
+		}
+
+		paths = []
+		for folder in ("public", "private"):
+			for root, _dirs, files in os.walk(frappe.get_site_path(folder, "files")):
+				paths.extend(os.path.join(root, file) for file in files)
+
+		def store(path):
+			relative_path = os.path.relpath(path, site_path)
+			file_url = "/" + relative_path.removeprefix("public/")
+			content_hash = known_hashes.get(file_url) or get_file_content_hash(path)
+			stored_path = get_stored_file_path(self.file_store, content_hash)
+
+			if not os.path.exists(stored_path):
+				os.makedirs(os.path.dirname(stored_path), exist_ok=True)
+				temp_path = f"{stored_path}.{threading.get_ident()}.tmp"
+				shutil.copyfile(path, temp_path)
+				os.replace(temp_path, stored_path)
+
+			return relative_path, {"hash": content_hash, "size": os.path.getsize(path)}
+
+		with ThreadPoolExecutor(max_workers=self.workers) as executor:
+			self.manifest.files = dict(executor.map(store, paths))
+
+	def get_summary(self):
+		summary = {
+			"config": {
+				"path": self.backup_path_conf,
+				"size": get_file_size(self.backup_path_conf, format=True),
+			},
+			"database": {"path": self.backup_dir, "size": f"{len(self.manifest.tables)} tables"},
+		}
+		if self.manifest.files:
+			summary["files"] = {"path": self.file_store, "size": f"{len(self.manifest.files)} files"}
+		return summary
+
+
+def get_stored_file_path(file_store: str, content_hash: str) -> str:
+	return os.path.join(file_store, content_hash[:2], content_hash)
+
+
+def get_sqlite_tables_to_backup(db, tables: list[str]) -> list[str]:
+	"""Leave out SQLite internal tables and shadow tables of FTS tables, which are restored through
+	their virtual table."""
+	virtual_tables = db.sql(
+		"SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE VIRTUAL TABLE%'",
+		pluck=True,
+	)
+	shadow_tables = {f"{table}{suffix}" for table in virtual_tables for suffix in FTS_SHADOW_TABLE_SUFFIXES}
+	return [table for table in tables if not table.startswith("sqlite_") and table not in shadow_tables]
+
+
+def get_table_sizes(db_type: str) -> dict[str, int]:
+	if db_type == "mariadb":
+		rows = frappe.db.sql(
+			"""SELECT table_name, data_length + index_length FROM information_schema.tables
+			WHERE table_schema = %s""",
+			frappe.conf.db_name,
+		)
+	elif db_type == "postgres":
+		rows = frappe.db.sql(
+			"""SELECT tablename, pg_total_relation_size(quote_ident(tablename)) FROM pg_tables
+			WHERE schemaname = 'public'"""
+		)
+	else:
+		return {}
+
+	return {table: cint(size) for table, size in rows}
+
+
+def iter_sqlite_table_dump(conn: sqlite3.Connection, table: str):
+	"""Yield SQL statements recreating `table` with its indexes and rows."""
+	quoted_table = '"{}"'.format(table.replace('"', '""'))
+	schema = conn.execute(
+		"SELECT type, sql FROM sqlite_master WHERE tbl_name = ? AND sql IS NOT NULL ORDER BY type = 'index'",
+		(table,),
+	).fetchall()
+
+	yield "BEGIN;"
+	yield f"DROP TABLE IF EXISTS {quoted_table};"
+	for _type, sql in schema:
+		yield f"{sql};"
+
+	columns = [row[1] for row in conn.execute(f"PRAGMA table_info({quoted_table})")]
+	column_list = ", ".join('"{}"'.format(column.replace('"', '""')) for column in columns)
+	for row in conn.execute(f"SELECT {column_list} FROM {quoted_table}"):
+		values = ", ".join(quote_sqlite_value(value) for value in row)
+		yield f"INSERT INTO {quoted_table} ({column_list}) VALUES ({values});"
+
+	yield "COMMIT;"
+
+
+def quote_sqlite_value(value) -> str:
+	if value is None:
+		return "NULL"
+	if isinstance(value, int | float):
+		return repr(value)
+	if isinstance(value, bytes):
+		return f"X'{value.hex()}'"
+	return "'{}'".format(str(value).replace("'", "''"))
+
+
+def new_parallel_backup(
+	ignore_files=False,
+	backup_path=None,
+	ignore_conf=False,
+	include_doctypes="",
+	exclude_doctypes="",
+	workers=None,
+	verbose=False,
+	rollback_callback=None,
+) -> ParallelBackupGenerator:
+	delete_temp_backups()
+	odb = ParallelBackupGenerator(
+		frappe.conf.db_name,
+		frappe.conf.db_user,
+		frappe.conf.db_password,
+		db_socket=frappe.conf.db_socket,
+		db_host=frappe.conf.db_host,
+		db_port=frappe.conf.db_port,
+		db_type=frappe.conf.db_type,
+		backup_path=backup_path,
+		ignore_conf=ignore_conf,
+		include_doctypes=include_doctypes,
+		exclude_doctypes=exclude_doctypes,
+		verbose=verbose,
+		rollback_callback=rollback_callback,
+		workers=workers,
+	)
+	odb.get_backup(ignore_files=ignore_files)
+	return odb
+
+
+def is_parallel_backup(path: str) -> bool:
+	return os.path.isfile(os.path.join(path, "manifest.json"))
+
+
+def load_manifest(backup_dir: str) -> frappe._dict:
+	with open(os.path.join(backup_dir, "manifest.json")) as f:
+		return frappe._dict(json.load(f))
+
+
+def verify_parallel_backup(backup_dir: str, workers: int | None = None) -> frappe._dict:
+	"""Check sizes and checksums of all dumps and stored files listed in the manifest."""
+	manifest = load_manifest(backup_dir)
+	file_store = os.path.join(os.path.dirname(os.path.abspath(backup_dir)), FILE_STORE)
+
+	def verify_table(item):
+		table, info = item
+		path = os.path.join(backup_dir, info["file"])
+		if not os.path.exists(path) or os.path.getsize(path) != info["size"]:
+			return table
+		if get_file_checksum(path) != info["sha256"]:
+			return table
+
+	def verify_file(item):
+		relative_path, info = item
+		path = get_stored_file_path(file_store, info["hash"])
+		if not os.path.exists(path) or os.path.getsize(path) != info["size"]:
+			return relative_path
+
+	with ThreadPoolExecutor(max_workers=get_workers(workers)) as executor:
+		invalid = [
+			*filter(None, executor.map(verify_table, manifest.tables.items())),
+			*filter(None, executor.map(verify_file, manifest.files.items())),
+		]
+
+	if invalid:
+		raise BackupChecksumError(
+			_("Backup is damaged, these files don't match the manifest: {0}").format(", ".join(invalid))
+		)
+
+	return manifest
+
+
+def restore_parallel_backup(
+	backup_dir: str,
+	tables: list[str] | None = None,
+	with_files: bool = True,
+	workers: int | None = None,
+	verbose: bool = False,
+):
+	"""Restore tables and files of a parallel backup into the current site, after verifying it.
+
+	:param tables: restore only these tables, all tables in the backup by default.
+	"""
+	manifest = verify_parallel_backup(backup_dir, workers)
+	if manifest.db_type != frappe.conf.db_type:
+		frappe.throw(
+			_("Backup of a {0} database can't be restored to {1}").format(
+				manifest.db_type, frappe.conf.db_type
+			)
+		)
+
+	decompress = get_decompress_command(manifest.compression)
+	restore_tables = [t for t in manifest.tables if not tables or t in tables]
+	paths = [os.path.join(backup_dir, manifest.tables[table]["file"]) for table in restore_tables]
+
+	# commit so that the session doesn't hold locks on tables being replaced
+	frappe.db.commit()
+	if manifest.db_type == "sqlite":
+		# SQLite has a single writer, tables are restored one at a time
+		for path in paths:
+			restore_sqlite_table(path, decompress)
+	else:
+		client = get_restore_client()
+
+		def restore_table(path):
+			with open(path, "rb") as f:
+				run_pipeline(decompress, client, stdout=subprocess.DEVNULL, stdin=f)
+
+		with ThreadPoolExecutor(max_workers=get_workers(workers)) as executor:
+			for table, _result in zip(restore_tables, executor.map(restore_table, paths), strict=True):
+				if verbose:
+					print(f"Restored {table}")
+
+	if with_files and manifest.files:
+		restore_files(backup_dir, manifest, workers)
+
+	frappe.clear_cache()
+
+
+def get_decompress_command(extension: str) -> list[str]:
+	executable = "zstd" if extension == "zst" else "gzip"
+	if not (path := which(executable)):
+		frappe.throw(
+			_("{} not found in PATH! This is required to restore a backup.").format(executable),
+			exc=frappe.ExecutableNotFound,
+		)
+	return [path, "-q", "-d", "-c"] if executable == "zstd" else [path, "-d", "-c"]
+
+
+def get_restore_client() -> list[str]:
+	from frappe.database import get_command
+
+	bin, args, bin_name = get_command(
+		socket=frappe.conf.db_socket,
+		host=frappe.conf.db_host,
+		port=frappe.conf.db_port,
+		user=frappe.conf.db_user,
+		password=frappe.conf.db_password,
+		db_name=frappe.conf.db_name,
+	)
+	if not bin:
+		frappe.throw(
+			_("{} not found in PATH! This is required to restore a backup.").format(bin_name),
+			exc=frappe.ExecutableNotFound,
+		)
+
+	if frappe.conf.db_type == "postgres":
+		return [bin, *args, "--quiet", "--set=ON_ERROR_STOP=1"]
+
+	# options for interactive use only
+	return [bin, *(arg for arg in args if arg != "--safe-updates" and not arg.startswith("--pager"))]
+
+
+def restore_sqlite_table(path: str, decompress: list[str]):
+	conn = sqlite3.connect(frappe.get_site_path("db", f"{frappe.conf.db_name}.db"), isolation_level=None)
+	try:
+		with open(path, "rb") as f:
+			process = subprocess.Popen(decompress, stdin=f, stdout=subprocess.PIPE)
+			statement = ""
+			for line in process.stdout:
+				statement += line.decode()
+				if sqlite3.complete_statement(statement):
+					conn.execute(statement)
+					statement = ""
+			process.wait()
+	except BaseException:
+		if conn.in_transaction:
+			conn.execute("ROLLBACK")
+		raise
+	finally:
+		conn.close()
+
+	if process.returncode:
+		raise frappe.CommandFailedError(f"Decompressing {path} failed", "", "")
+
+
+def restore_files(backup_dir: str, manifest: frappe._dict, workers: int | None = None):
+	file_store = os.path.join(os.path.dirname(os.path.abspath(backup_dir)), FILE_STORE)
+	site_path = frappe.get_site_path()
+
+	def restore(item):
+		relative_path, info = item
+		path = os.path.join(site_path, relative_path)
+		if os.path.exists(path) and os.path.getsize(path) == info["size"]:
+			if get_file_content_hash(path) == info["hash"]:
+				return
+
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		shutil.copyfile(get_stored_file_path(file_store, info["hash"]), path)
+
+	with ThreadPoolExecutor(max_workers=get_workers(workers)) as executor:
+		list(executor.map(restore, manifest.files.items()))
+
+
+def delete_old_parallel_backups(older_than: int = 24):
+	"""Delete old parallel backups and files in the file store no remaining backup refers to."""
+	older_than = cint(frappe.conf.keep_backups_for_hours) or older_than
+	backup_path = get_backup_path()
+	if not os.path.exists(backup_path):
+		return
+
+	backup_dirs = [
+		path
+		for name in os.listdir(backup_path)
+		if name.endswith("-parallel") and is_parallel_backup(path := os.path.join(backup_path, name))
+	]
+	for backup_dir in backup_dirs:
+		if is_file_old(os.path.join(backup_dir, "manifest.json"), older_than):
+			shutil.rmtree(backup_dir)
+
+	file_store = os.path.join(backup_path, FILE_STORE)
+	if not os.path.exists(file_store):
+		return
+
+	referenced = set()
+	for backup_dir in backup_dirs:
+		if os.path.exists(backup_dir):
+			referenced.update(info["hash"] for info in load_manifest(backup_dir).files.values())
+
+	for root, _dirs, files in os.walk(file_store):
+		for file in files:
+			path = os.path.join(root, file)
+			# recent files may belong to a backup in progress
+			if file not in referenced and is_file_old(path, older_than):
+				os.remove(path)
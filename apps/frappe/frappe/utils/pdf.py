@@ -6,6 +6,7 @@ import io
 import mimetypes
 import os
 import subprocess
+from functools import lru_cache
 from urllib.parse import parse_qs, urlparse
 
 import cssutils
@@ -20,7 +21,7 @@ import frappe
 from frappe import _
 from frappe.core.doctype.file.utils import find_file_by_url
 from frappe.utils import cstr, scrub_urls
-from frappe.utils.caching import redis_cache
+from frappe.utils.caching import redis_cache, request_cache
 from frappe.utils.data import get_url
 from frappe.utils.jinja_globals import bundled_asset, is_rtl
 
@@ -156,7 +157,8 @@ def get_chrome_pdf(print_format, html, options, output, pdf_generator=None):
 		return
 	# scrubbing url to expand url is not required as we have set url.
 	# also, planning to remove network requests anyway 🤞
-	generator = ChromePDFGenerator()
+	with ChromePDFGenerator._lock:
+		generator = ChromePDFGenerator()
 	browser = Browser(generator, print_format, html, options)
 	transformer = PDFTransformer(browser)
 	# transforms and merges header, footer into body pdf and returns merged pdf
@@ -303,6 +305,9 @@ def get_print_format_styles(soup: BeautifulSoup) -> list[cssutils.css.Property]:
 
 
 def inline_private_images(html) -> str:
+	if "<img" not in html:
+		return html
+
 	soup = BeautifulSoup(html, "html.parser")
 	for img in soup.find_all("img"):
 		if b64 := _get_base64_image(img["src"]):
@@ -324,20 +329,28 @@ def _get_base64_image(src):
 		if not file or not file.is_private:
 			return
 
-		b64_encoded_image = base64.b64encode(file.get_content()).decode()
-		return f"data:{mime_type};base64,{b64_encoded_image}"
+		return get_image_data_uri(file.get_full_path(), file.content_hash, mime_type)
 	except Exception:
 		frappe.logger("pdf").error("Failed to convert inline images to base64", exc_info=True)
 
 
+@request_cache
+def get_image_data_uri(path: str, content_hash: str | None, mime_type: str) -> str:
+	# permission is checked by the caller, the same image (e.g. a logo) is inlined in every
+	# document of a bulk print
+	with open(path, "rb") as f:
+		b64_encoded_image = base64.b64encode(f.read()).decode()
+	return f"data:{mime_type};base64,{b64_encoded_image}"
+
+
 def prepare_header_footer(soup: BeautifulSoup):
 	options = {}
 
 	head = soup.find("head").contents
 	styles = soup.find_all("style")
 
-	print_css = bundled_asset("print.bundle.css").lstrip("/")
-	css = frappe.read_file(os.path.join(frappe.local.sites_path, print_css))
+	print_css = os.path.join(frappe.local.sites_path, bundled_asset("print.bundle.css").lstrip("/"))
+	css = read_print_css(print_css, os.path.getmtime(print_css) if os.path.exists(print_css) else None)
 
 	# extract header and footer
 	for html_id in ("header-html", "footer-html"):
@@ -378,6 +391,11 @@ def prepare_header_footer(soup: BeautifulSoup):
 	return options
 
 
+@lru_cache(maxsize=4)
+def read_print_css(path: str, modified: float | None) -> str | None:
+	return frappe.read_file(path)
+
+
 def cleanup(options):
 	for key in ("header-html", "footer-html", "cookie-jar"):
 		if options.get(key) and os.path.exists(options[key]):
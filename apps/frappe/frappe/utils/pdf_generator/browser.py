@@ -56,8 +56,9 @@ class Browser:
 		from frappe.utils.pdf_generator.cdp_connection import CDPSocketClient
 
 		# checking because if we share browser accross request _devtools_url will already be set for subsequent requests.
-		if not generator._devtools_url:
-			generator._set_devtools_url()
+		with generator._lock:
+			if not generator._devtools_url:
+				generator._set_devtools_url()
 		# start the CDP websocket connection to browser
 		self.session = CDPSocketClient(generator._devtools_url)
 
@@ -1,6 +1,7 @@
 import os
 import platform
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import ClassVar
@@ -24,6 +25,9 @@ class ChromePDFGenerator:
 
 	_browsers: ClassVar[list] = []
 
+	# held while the shared instance is created or its DevTools URL is read, renders can run in threads
+	_lock: ClassVar = threading.RLock()
+
 	def add_browser(self, browser):
 		self._browsers.append(browser)
 
@@ -31,8 +35,8 @@ class ChromePDFGenerator:
 		self._browsers.remove(browser)
 
 	def __new__(cls):
-		# if instance or _chromium_process is not available create object else return current instance stored in cls._instance
-		if cls._instance is None or not cls._instance._chromium_process:
+		# create object if there is no instance or its _chromium_process has exited, else return cls._instance
+		if cls._instance is None or not cls._instance.is_alive():
 			cls._instance = super().__new__(cls)
 		return cls._instance
 
@@ -47,6 +51,22 @@ class ChromePDFGenerator:
 		self._devtools_url = None
 		self._initialize_chromium()
 
+	def is_alive(self) -> bool:
+		"""Return True if Chromium started by this instance is still running."""
+		return bool(self._chromium_process) and self._chromium_process.poll() is None
+
+	@classmethod
+	def get_health(cls) -> dict:
+		"""Return state of Chromium kept by this process, without starting it."""
+		instance = cls._instance
+		process = instance and instance._chromium_process
+		return {
+			"running": bool(instance and instance.is_alive()),
+			"pid": process.pid if process else None,
+			"external_url": bool(instance and getattr(instance, "CHROMIUM_WEBSOCKET_URL", None)),
+			"active_renders": len(cls._browsers),
+		}
+
 	def _initialize_chromium(self):
 		# ideally browser is initailized from before request hook.
 		# if _chromium_process is not available then initialize it.
@@ -10,6 +10,9 @@ CDP commands documentation can be found here.
 https://chromedevtools.github.io/devtools-protocol/
 """
 
+# bytes of generated PDF read from Chromium per IO.read call
+PDF_STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class Page:
 	def __init__(self, session, browser_context_id, page_type):
@@ -326,17 +329,19 @@ class Page:
 
 		from pypdf import PdfReader
 
-		pdf_data = b""
+		chunks = []
 		offset = 0
 		while True:
-			chunk_result, error = self.send("IO.read", {"handle": stream_id, "offset": offset, "size": 4096})
+			chunk_result, error = self.send(
+				"IO.read", {"handle": stream_id, "offset": offset, "size": PDF_STREAM_CHUNK_SIZE}
+			)
 			if error:
 				raise RuntimeError(f"Error reading PDF chunk: {error}")
 			chunk_data = chunk_result["data"]
 			# we don't use base64Encode option but added check anyway as it is one of the valid options.
 			if chunk_result.get("base64Encoded", False):
 				chunk_data = base64.b64decode(chunk_data)
-			pdf_data += chunk_data
+			chunks.append(chunk_data)
 			offset += len(chunk_data)
 			if chunk_result.get("eof", False):
 				break
@@ -345,6 +350,8 @@ class Page:
 		if error:
 			raise RuntimeError(f"Error closing PDF stream: {error}")
 
+		pdf_data = b"".join(chunks)
+
 		if raw:
 			return pdf_data
 
@@ -0,0 +1,197 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# License: MIT. See LICENSE
+"""
+Concurrent PDF rendering for bulk prints.
+
+Bulk prints render one document after another, each waiting for its HTML to be rendered and converted
+to PDF. When `pdf_render_workers` is set in site config, `render_pdfs` spreads documents over a pool
+of threads instead:
+
+- every thread has its own site connection and renders as the requesting user
+- with the chrome generator, all threads share the headless Chromium kept running by the worker
+  process (see `ChromePDFGenerator`), each over its own DevTools connection
+- wkhtmltopdf can't be kept running between documents, its processes are run concurrently instead
+- rendered documents are appended to the output in order as soon as their turn comes, only a few
+  per thread are kept waiting in memory
+
+Render durations are sampled per generator, see `get_render_metrics`.
+"""
+
+import io
+import queue
+import threading
+import time
+from collections.abc import Iterator
+
+from pypdf import PdfReader, PdfWriter
+
+import frappe
+from frappe.utils import cint
+
+PDF_GENERATORS = ("wkhtmltopdf", "chrome")
+RENDER_TIME_SAMPLES = 1000
+# Rendered documents waiting for their turn to be appended, per thread
+PENDING_DOCUMENTS_PER_WORKER = 2
+
+
+def get_render_workers() -> int:
+	return max(cint(frappe.conf.pdf_render_workers), 1)
+
+
+def render_pdfs(
+	docs: list[tuple[str, str]], output: PdfWriter, workers: int | None = None, **print_args
+) -> Iterator[frappe._dict]:
+	"""Render PDFs of `docs`, pairs of doctype and name, and append them to `output` in order.
+
+	Yields `doctype`, `name` and `rendered`, False if rendering failed, of each document once it is
+	appended. `print_args` are passed on to `frappe.get_print`."""
+	workers = min(workers or get_render_workers(), len(docs))
+	if workers > 1 and not frappe.in_test:
+		yield from _render_concurrently(docs, output, workers, print_args)
+		return
+
+	for doctype, name in docs:
+		try:
+			append_pdf(output, render_pdf(doctype, name, output=output, **print_args))
+		except Exception:
+			yield frappe._dict(doctype=doctype, name=name, rendered=False)
+		else:
+			yield frappe._dict(doctype=doctype, name=name, rendered=True)
+
+
+def render_pdf(doctype: str, name: str, **print_args) -> bytes | PdfWriter:
+	generator = get_pdf_generator(print_args)
+	started_at = time.monotonic()
+	pdf = frappe.get_print(doctype, name, as_pdf=True, **print_args)
+	record_render_time(generator, time.monotonic() - started_at)
+	return pdf
+
+
+def get_pdf_generator(print_args: dict) -> str:
+	"""Return the generator `frappe.get_print` renders with, given `print_args`."""
+	if generator := frappe.local.form_dict.get("pdf_generator"):
+		return generator
+	if generator := print_args.get("pdf_generator"):
+		return generator
+
+	print_format = print_args.get("print_format")
+	return (
+		print_format and frappe.get_cached_value("Print Format", print_format, "pdf_generator")
+	) or "wkhtmltopdf"
+
+
+def append_pdf(output: PdfWriter, pdf: bytes | PdfWriter):
+	"""Append pages of `pdf` to `output`, unless it was rendered into `output` already."""
+	if pdf is output:
+		return
+	output.append_pages_from_reader(PdfReader(io.BytesIO(pdf)))
+
+
+def _render_concurrently(docs, output, workers, print_args):
+	site, sites_path, user = frappe.local.site, frappe.local.sites_path, frappe.session.user
+	lang = frappe.local.lang
+	# threads don't see the request, so the generator it asked for is passed on explicitly
+	print_args = {"pdf_generator": frappe.local.form_dict.get("pdf_generator"), **print_args}
+
+	pending = queue.Queue()
+	for item in enumerate(docs):
+		pending.put(item)
+
+	results = {}
+	result_ready = threading.Condition()
+	# taken before picking a document and given back once it's appended, so that threads don't run
+	# far ahead of a slow document
+	slots = threading.Semaphore(workers * PENDING_DOCUMENTS_PER_WORKER)
+
+	def work():
+		frappe.init(site, sites_path=sites_path)
+		frappe.connect()
+		frappe.set_user(user)
+		frappe.local.lang = lang
+		try:
+			while True:
+				slots.acquire()
+				try:
+					idx, (doctype, name) = pending.get_nowait()
+				except queue.Empty:
+					slots.release()
+					return
+
+				try:
+					pdf = render_pdf(doctype, name, **print_args)
+				except Exception:
+					frappe.db.rollback()
+					pdf = None
+
+				with result_ready:
+					results[idx] = pdf
+					result_ready.notify_all()
+		finally:
+			frappe.destroy()
+
+	threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+	for thread in threads:
+		thread.start()
+
+	try:
+		for idx, (doctype, name) in enumerate(docs):
+			with result_ready:
+				while idx not in results:
+					if not any(thread.is_alive() for thread in threads):
+						# threads failed to connect, nothing else will be rendered
+						results[idx] = None
+						break
+					result_ready.wait(timeout=1)
+				pdf = results.pop(idx)
+			slots.release()
+
+			if pdf:
+				append_pdf(output, pdf)
+			yield frappe._dict(doctype=doctype, name=name, rendered=bool(pdf))
+	finally:
+		# let threads finish if documents are left, e.g. when the caller stops early
+		while not pending.empty():
+			try:
+				pending.get_nowait()
+			except queue.Empty:
+				break
+		for _thread in threads:
+			slots.release()
+		for thread in threads:
+			thread.join()
+
+
+def record_render_time(generator: str, duration: float):
+	key = f"pdf_render_time:{generator}"
+	try:
+		frappe.cache.lpush(key, duration)
+		frappe.cache.ltrim(key, 0, RENDER_TIME_SAMPLES - 1)
+	except Exception:
+		# render stats are best effort, printing must not fail because of them
+		pass
+
+
+def get_render_metrics() -> dict[str, dict]:
+	"""Return number of sampled renders and their median and 95th percentile duration per generator."""
+	metrics = {}
+	for generator in PDF_GENERATORS:
+		durations = sorted(
+			float(duration)
+			for duration in frappe.cache.lrange(f"pdf_render_time:{generator}", 0, RENDER_TIME_SAMPLES - 1)
+		)
+
+		def percentile(p):
+			if durations:
+				return round(durations[min(int(len(durations) * p), len(durations) - 1)], 4)
+
+		metrics[generator] = {"samples": len(durations), "p50": percentile(0.5), "p95": percentile(0.95)}
+	return metrics
+
+
+@frappe.whitelist()
+def get_renderer_health():
+	"""Return render durations and state of the headless Chromium kept by this process."""
+	from frappe.utils.pdf_generator.chrome_pdf_generator import ChromePDFGenerator
+
+	frappe.only_for("System Manager")
+	return {"chrome": ChromePDFGenerator.get_health(), "render_time": get_render_metrics()}
@@ -12,6 +12,7 @@ from frappe import _
 from frappe.core.doctype.access_log.access_log import make_access_log
 from frappe.translate import print_language
 from frappe.utils.pdf import get_pdf
+from frappe.utils.pdf_render_pool import render_pdfs
 
 no_cache = 1
 
@@ -124,19 +125,17 @@ def _download_multi_pdf(
 		filename = f"{doctype}_"
 
 		# Concatenating pdf files
-		for idx, ss in enumerate(result):
-			try:
-				pdf_writer = frappe.get_print(
-					doctype,
-					ss,
-					format,
-					as_pdf=True,
-					output=pdf_writer,
-					no_letterhead=no_letterhead,
-					letterhead=letterhead,
-					pdf_options=options,
-				)
-			except Exception:
+		for idx, printed in enumerate(
+			render_pdfs(
+				[(doctype, ss) for ss in result],
+				pdf_writer,
+				print_format=format,
+				no_letterhead=no_letterhead,
+				letterhead=letterhead,
+				pdf_options=options,
+			)
+		):
+			if not printed.rendered:
 				if task_id:
 					frappe.publish_realtime(task_id=task_id, message={"message": "Failed"})
 
@@ -161,39 +160,36 @@ def _download_multi_pdf(
 		count = 1
 		for doctype_name in doctype:
 			filename += f"{doctype_name}_"
-			for doc_name in doctype[doctype_name]:
-				try:
-					pdf_writer = frappe.get_print(
-						doctype_name,
-						doc_name,
-						format,
-						as_pdf=True,
-						output=pdf_writer,
-						no_letterhead=no_letterhead,
-						letterhead=letterhead,
-						pdf_options=options,
-					)
-				except Exception:
-					if task_id:
-						frappe.publish_realtime(task_id=task_id, message="Failed")
-					frappe.log_error(
-						title="Error in Multi PDF download",
-						message=f"Permission Error on doc {doc_name} of doctype {doctype_name}",
-						reference_doctype=doctype_name,
-						reference_name=doc_name,
-					)
-
-				count += 1
 
+		for printed in render_pdfs(
+			[(doctype_name, doc_name) for doctype_name in doctype for doc_name in doctype[doctype_name]],
+			pdf_writer,
+			print_format=format,
+			no_letterhead=no_letterhead,
+			letterhead=letterhead,
+			pdf_options=options,
+		):
+			if not printed.rendered:
 				if task_id:
-					frappe.publish_progress(
-						percent=count / total_docs * 100,
-						title=_("PDF Generation in Progress"),
-						description=_(
-							"{0}/{1} complete | Please leave this tab open until completion."
-						).format(count, total_docs),
-						task_id=task_id,
-					)
+					frappe.publish_realtime(task_id=task_id, message="Failed")
+				frappe.log_error(
+					title="Error in Multi PDF download",
+					message=f"Permission Error on doc {printed.name} of doctype {printed.doctype}",
+					reference_doctype=printed.doctype,
+					reference_name=printed.name,
+				)
+
+			count += 1
+
+			if task_id:
+				frappe.publish_progress(
+					percent=count / total_docs * 100,
+					title=_("PDF Generation in Progress"),
+					description=_("{0}/{1} complete | Please leave this tab open until completion.").format(
+						count, total_docs
+					),
+					task_id=task_id,
+				)
 		if task_id is None:
 			frappe.local.response.filename = f"{name}.pdf"
 
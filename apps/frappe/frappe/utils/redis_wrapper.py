@@ -347,9 +347,9 @@ class RedisWrapper(redis.Redis):
 		"""Return True or False based on if a given value is present in the set."""
 		return super().sismember(self.make_key(name), value)
 
-	def spop(self, name):
-		"""Remove and returns a random member from the set."""
-		return super().spop(self.make_key(name))
+	def spop(self, name, count=None):
+		"""Remove and returns a random member, or `count` random members, from the set."""
+		return super().spop(self.make_key(name), count)
 
 	def srandmember(self, name, count=None):
 		"""Return a random member from the set."""
@@ -589,6 +589,7 @@ class ClientCache:
 			**{
 				"__redis__:invalidate": self._handle_invalidation,
 				"clear_persistent_cache": self._handle_persistent_cache_invalidation,
+				"clear_session_cache": self._handle_session_cache_invalidation,
 			}
 		)
 		return self._watcher.run_in_thread(
@@ -612,6 +613,15 @@ class ClientCache:
 			# Assume bench isn't running
 			pass
 
+	def erase_session_cache(self, sid: str):
+		"""Send signal to drop copies of session `sid` kept in memory by workers, see
+		`frappe.sessions.get_cached_session`."""
+		try:
+			self.redis.publish("clear_session_cache", json.dumps({"sid": sid, "site": frappe.local.site}))
+		except redis.exceptions.ConnectionError:
+			# Assume bench isn't running
+			pass
+
 	def _handle_invalidation(self, message):
 		if message["data"] is None:
 			# Flushall
@@ -634,9 +644,22 @@ class ClientCache:
 		if not payload.doctype:
 			frappe.utils.caching._SITE_CACHE.clear()
 
+	def _handle_session_cache_invalidation(self, message):
+		from frappe.sessions import drop_local_sessions
+
+		if message["type"] != "message":
+			return
+
+		payload = frappe._dict(json.loads(message["data"]))
+		drop_local_sessions(payload.sid, site=payload.site)
+
 	def _exception_handler(self, exc, pubsub, pubsub_thread):
 		if isinstance(exc, (redis.exceptions.ConnectionError)):
+			from frappe.sessions import drop_local_sessions
+
 			self.clear_cache()
+			# invalidations may have been missed
+			drop_local_sessions()
 			self.connection_retries += 1
 			if self.connection_retries > 10:
 				self.healthy = False
@@ -27,6 +27,7 @@ import frappe.utils
 from frappe import _
 from frappe.core.doctype.access_log.access_log import make_access_log
 from frappe.utils import format_timedelta, orjson_dumps
+from frappe.utils.columnar import COLUMNAR_MIMETYPE
 
 if TYPE_CHECKING:
 	from frappe.core.doctype.file.file import File
@@ -148,7 +149,7 @@ def as_json():
 		response.status_code = frappe.local.response["http_status_code"]
 		del frappe.local.response["http_status_code"]
 
-	response.mimetype = "application/json"
+	response.mimetype = COLUMNAR_MIMETYPE if frappe.flags.columnar_response else "application/json"
 	response.data = orjson_dumps(frappe.local.response, default=json_handler)
 	return response
 
@@ -18,7 +18,7 @@ from croniter import CroniterBadCronError
 from filelock import FileLock, Timeout
 
 import frappe
-from frappe.utils import cint, get_bench_path, get_datetime, get_sites, now_datetime
+from frappe.utils import cint, flt, get_bench_path, get_datetime, get_sites, now_datetime
 from frappe.utils.background_jobs import set_niceness
 from frappe.utils.caching import redis_cache
 
@@ -100,6 +100,9 @@ def enqueue_events_for_all_sites() -> None:
 	# Sites are sorted in alphabetical order, shuffle to randomize priorities
 	random.shuffle(sites)
 
+	if fair_share_scheduler := _get_fair_share_scheduler():
+		sites = fair_share_scheduler.order_sites(sites)
+
 	for site in sites:
 		try:
 			enqueue_events_for_site(site=site)
@@ -107,6 +110,17 @@ def enqueue_events_for_all_sites() -> None:
 			frappe.logger("scheduler").debug(f"Failed to enqueue events for site: {site}", exc_info=True)
 
 
+def _get_fair_share_scheduler():
+	from frappe.utils.fair_scheduler import get_fair_share_scheduler, is_fair_share_enabled
+
+	try:
+		with frappe.init_site():
+			if is_fair_share_enabled():
+				return get_fair_share_scheduler()
+	except Exception:
+		frappe.logger("scheduler").error("Failed to setup fair share scheduler", exc_info=True)
+
+
 def enqueue_events_for_site(site: str) -> None:
 	def log_exc():
 		frappe.logger("scheduler").error(f"Exception in Enqueue Events for Site {site}", exc_info=True)
@@ -131,19 +145,39 @@ def enqueue_events_for_site(site: str) -> None:
 
 def enqueue_events() -> list[str] | None:
 	if schedule_jobs_based_on_activity():
+		from frappe.utils.fair_scheduler import get_fair_share_scheduler, is_fair_share_enabled
+
 		enqueued_jobs = []
 		all_jobs = frappe.get_all("Scheduled Job Type", filters={"stopped": 0}, fields="*")
 		random.shuffle(all_jobs)
+		job_types = []
 		for job_type in all_jobs:
 			job_type = frappe.get_doc(doctype="Scheduled Job Type", **job_type)
 			try:
-				if job_type.enqueue():
-					enqueued_jobs.append(job_type.method)
+				if job_type.is_event_due():
+					job_types.append(job_type)
 			except CroniterBadCronError:
 				frappe.logger("scheduler").error(
 					f"Invalid Job on {frappe.local.site} - {job_type.name}", exc_info=True
 				)
 
+		fair_share_scheduler = None
+		if is_fair_share_enabled():
+			fair_share_scheduler = get_fair_share_scheduler()
+			admitted = set(
+				fair_share_scheduler.admit(
+					frappe.local.site,
+					[job_type.name for job_type in job_types if not job_type.is_job_in_queue()],
+					weight=flt(frappe.conf.scheduler_weight) or 1.0,
+				)
+			)
+			job_types = [job_type for job_type in job_types if job_type.name in admitted]
+
+		for job_type in job_types:
+			if job_type.enqueue():
+				enqueued_jobs.append(job_type.method)
+				fair_share_scheduler and fair_share_scheduler.job_enqueued(frappe.local.site, job_type.name)
+
 		return enqueued_jobs
 
 
@@ -119,6 +119,23 @@ def read_xlsx_file_from_attached_file(file_url=None, fcontent=None, filepath=Non
 	return rows
 
 
+def iter_xlsx_rows(filepath):
+	"""Yield values of rows in the active sheet, reading the workbook in read-only mode.
+
+	Rows are padded to the width of the first row, read-only mode doesn't pad trailing empty cells."""
+	wb = load_workbook(filename=filepath, read_only=True, data_only=True)
+	try:
+		width = 0
+		for row in wb.active.iter_rows(values_only=True):
+			row = list(row)
+			width = width or len(row)
+			if len(row) < width:
+				row.extend([None] * (width - len(row)))
+			yield row
+	finally:
+		wb.close()
+
+
 def read_xls_file_from_attached_file(content):
 	book = xlrd.open_workbook(file_contents=content)
 	sheets = book.sheets()
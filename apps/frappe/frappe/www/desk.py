@@ -11,6 +11,7 @@ from urllib.parse import urlencode
 import frappe
 import frappe.sessions
 from frappe import _
+from frappe.boot import get_shared_bootinfo, strip_shared_bootinfo
 from frappe.utils.jinja_globals import is_rtl
 
 SCRIPT_TAG_PATTERN = re.compile(r"\<script[^<]*\</script\>")
@@ -28,6 +29,9 @@ def get_context(context):
 
 	try:
 		boot = frappe.sessions.get()
+		# loaded by a separate script the browser can revalidate instead, see desk.html
+		shared_boot = get_shared_bootinfo()
+		boot = strip_shared_bootinfo(boot, shared_boot.data)
 	except Exception as e:
 		raise frappe.SessionBootFailed from e
 
@@ -55,6 +59,7 @@ def get_context(context):
 			"lang": frappe.local.lang,
 			"sounds": hooks["sounds"],
 			"boot": boot,
+			"shared_boot_version": shared_boot.version,
 			"desk_theme": boot.get("desk_theme") or "Light",
 			"csrf_token": csrf_token,
 			"google_analytics_id": frappe.conf.get("google_analytics_id"),
@@ -12,6 +12,7 @@ from frappe import _, cstr, get_module_path
 from frappe.core.doctype.access_log.access_log import make_access_log
 from frappe.core.doctype.document_share_key.document_share_key import is_expired
 from frappe.utils import cint, escape_html, strip_html
+from frappe.utils.caching import request_cache
 from frappe.utils.jinja_globals import is_rtl
 
 if TYPE_CHECKING:
@@ -185,7 +186,8 @@ def get_rendered_template(
 		doc.absolute_value = print_format.absolute_value
 
 		def get_template_from_string():
-			return jenv.from_string(get_print_format(doc.doctype, print_format))
+			# compiled once per print format version, not for every printed document
+			return frappe.utils.jinja.get_template_from_string(get_print_format(doc.doctype, print_format))
 
 		template = None
 		if hook_func := frappe.get_hooks("get_print_format_template"):
@@ -223,9 +225,10 @@ def get_rendered_template(
 		template = jenv.get_template(standard_format)
 
 	letter_head = frappe._dict(get_letter_head(doc, no_letterhead, letterhead) or {})
+	letter_head_context = {"doc": doc.as_dict()} if letter_head.content or letter_head.footer else None
 
 	if letter_head.content:
-		letter_head.content = frappe.utils.jinja.render_template(letter_head.content, {"doc": doc.as_dict()})
+		letter_head.content = frappe.utils.jinja.render_template(letter_head.content, letter_head_context)
 		if letter_head.header_script:
 			letter_head.content += f"""
 				<script>
@@ -234,7 +237,7 @@ def get_rendered_template(
 			"""
 
 	if letter_head.footer:
-		letter_head.footer = frappe.utils.jinja.render_template(letter_head.footer, {"doc": doc.as_dict()})
+		letter_head.footer = frappe.utils.jinja.render_template(letter_head.footer, letter_head_context)
 		if letter_head.footer_script:
 			letter_head.footer += f"""
 				<script>
@@ -426,24 +429,21 @@ def get_letter_head(doc: "Document", no_letterhead: bool, letterhead: str | None
 	if no_letterhead:
 		return {}
 
-	letterhead_name = letterhead or doc.get("letter_head")
-	if letterhead_name:
-		return frappe.db.get_value(
+	return _get_letter_head(letterhead or doc.get("letter_head"))
+
+
+@request_cache
+def _get_letter_head(letterhead_name: str | None) -> dict:
+	# cached for the request, bulk prints mostly use the same letter head for every document
+	return (
+		frappe.db.get_value(
 			"Letter Head",
-			letterhead_name,
+			letterhead_name or {"is_default": 1},
 			["content", "footer", "header_script", "footer_script"],
 			as_dict=True,
 		)
-	else:
-		return (
-			frappe.db.get_value(
-				"Letter Head",
-				{"is_default": 1},
-				["content", "footer", "header_script", "footer_script"],
-				as_dict=True,
-			)
-			or {}
-		)
+		or {}
+	)
 
 
 def get_print_format(doctype: str, print_format: "PrintFormat") -> str: